@@ -0,0 +1,232 @@
+import contextlib
+import datetime
+import io
+import json
+import os
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from operator import attrgetter
+from pathlib import Path
+from typing import List
+
+import typer
+
+# the components read these when they are first imported, keep the timed runs off stdout and
+# don't record timings, they would be flushed into the repo's logs/ after leaving the task dir
+os.environ.setdefault("ORGPEDIA_LOG_LEVEL", "QUIET")
+os.environ.setdefault("ORGPEDIA_TIMING", "0")
+
+from benchmarks.synthetic import SyntheticCorpus  # noqa: E402
+
+app = typer.Typer()
+
+RESULTS_FILE = Path(__file__).parent / "results.jsonl"
+DEFAULT_SCALES = [1000, 10000]
+
+
+def bench_name_parser(corpus, cadre_file_dict):
+    from orgpedia.tools.name_parser import NameParser
+
+    parser = NameParser(extra_salutations=["Shri", "Smt"])
+    names = [f"{d['officer']['salut']} {d['officer']['name']}" for o in corpus.order_dicts for d in o["details"]]
+
+    def run():
+        [parser.parse(n) for n in names]
+        return len(names)
+
+    return run
+
+
+def bench_id_assigner(corpus, cadre_file_dict):
+    from orgpedia.components.id_assigner_fields import IDAssignerMultipleFields
+
+    id_assigner = IDAssignerMultipleFields("conf", "id_assigner", False, cadre_file_dict, ["dept"], [])
+    docs = corpus.build_docs(id_fraction=0.0)
+
+    def run():
+        [id_assigner(doc) for doc in docs]
+        return sum(len(d.order.details) for d in docs)
+
+    return run
+
+
+def bench_details_merger(corpus, cadre_file_dict, merge_engine="greedy"):
+    from orgpedia.components.details_merger import DetailsMerger
+
+    merger = DetailsMerger(
+        "conf", "details_merger", False, cadre_file_dict, ["dept"], [], "mismatch_names.yml", merge_engine
+    )
+    docs = corpus.build_docs(id_fraction=0.8)
+
+    def run():
+        merger.pipe(docs)
+        return sum(len(d.order.details) for d in docs)
+
+    return run
+
+
+def bench_details_merger_uf(corpus, cadre_file_dict):
+    return bench_details_merger(corpus, cadre_file_dict, merge_engine="union_find")
+
+
+def build_tenure_builder():
+    from orgpedia.components.tenure_builder import TenureBuilder
+
+    return TenureBuilder("conf", "tenure_builder", "conf/ministries.yml", "Cabinet Minister")
+
+
+def bench_tenure_builder(corpus, cadre_file_dict):
+    tenure_builder = build_tenure_builder()
+    docs = corpus.build_docs()
+
+    def run():
+        tenure_builder.pipe(docs)
+        return sum(len(d.order.details) for d in docs)
+
+    return run
+
+
+def bench_tenure_writer(corpus, cadre_file_dict):
+    from orgpedia.components.tenure_writer import TenureWriter
+
+    docs = build_tenure_builder().pipe(corpus.build_docs())
+    formats = ["json", "csv"]
+    tenure_writer = TenureWriter("conf", "tenure_writer", formats, cadre_file_dict, {}, [], "output", "trans.yml")
+
+    def run():
+        tenure_writer.pipe(docs)
+        return sum(len(d.tenures) for d in docs)
+
+    return run
+
+
+def bench_cabinet_infos(corpus, cadre_file_dict):
+    from orgpedia.components.website_lang_gen import WebsiteLanguageGenerator
+
+    docs = build_tenure_builder().pipe(corpus.build_docs())
+    website_gen = WebsiteLanguageGenerator(
+        "conf",
+        "website_generator",
+        ["conf/wiki_officer.yml"],
+        "conf/ministries.json",
+        "output",
+        ["en", "hi"],
+        "conf/trans.yml",
+        "conf/post_infos.json",
+        "miniHTML",
+        "input/tenures.json",
+        "input/orders.json",
+    )
+    orders = sorted((d.order for d in docs), key=attrgetter("date"))
+    website_gen.order_dict = dict((o.order_id, o) for o in orders)
+    tenures = sorted((t for d in docs for t in d.tenures), key=attrgetter("tenure_id"))
+
+    def run():
+        cabinet_infos, _ = website_gen.build_cabinet_infos(tenures)
+        return len(tenures)
+
+    return run
+
+
+STAGES = {
+    "name_parser": bench_name_parser,
+    "id_assigner": bench_id_assigner,
+    "details_merger": bench_details_merger,
+    "details_merger_uf": bench_details_merger_uf,
+    "tenure_builder": bench_tenure_builder,
+    "tenure_writer": bench_tenure_writer,
+    "cabinet_infos": bench_cabinet_infos,
+}
+
+
+def measure(stage_fn, corpus, cadre_file_dict, trace_memory):
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = stage_fn(corpus, cadre_file_dict)
+        start = time.perf_counter()
+        num_items = run()
+        seconds = time.perf_counter() - start
+
+        peak_mb = None
+        if trace_memory:
+            run = stage_fn(corpus, cadre_file_dict)
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mb = round(peak / (1024 * 1024), 2)
+
+    return {
+        "items": num_items,
+        "seconds": round(seconds, 4),
+        "items_per_sec": round(num_items / seconds, 1) if seconds else None,
+        "peak_mb": peak_mb,
+    }
+
+
+def get_git_rev():
+    try:
+        cmd = ["git", "rev-parse", "--short", "HEAD"]
+        return subprocess.check_output(cmd, cwd=Path(__file__).parent, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def read_results(results_file):
+    if not results_file.exists():
+        return []
+    return [json.loads(ln) for ln in results_file.read_text().splitlines() if ln.strip()]
+
+
+def show_comparison(result, prev_results):
+    prev = [r for r in prev_results if r["stage"] == result["stage"] and r["scale"] == result["scale"]]
+    prev_str = ""
+    if prev and prev[-1]["items_per_sec"] and result["items_per_sec"]:
+        change = 100 * (result["items_per_sec"] - prev[-1]["items_per_sec"]) / prev[-1]["items_per_sec"]
+        prev_str = f" ({change:+.1f}% vs {prev[-1]['git_rev']})"
+
+    peak_str = f" peak: {result['peak_mb']}MB" if result["peak_mb"] is not None else ""
+    print(
+        f"{result['stage']:15} scale: {result['scale']:>8} {result['seconds']:>9.3f}s"
+        f" {result['items_per_sec']:>10} items/s{peak_str}{prev_str}"
+    )
+
+
+@app.command()
+def run(
+    scales: List[int] = typer.Option(DEFAULT_SCALES, "--scale", help="number of details in the synthetic corpus"),
+    stages: List[str] = typer.Option(list(STAGES), "--stage"),
+    results_file: Path = typer.Option(RESULTS_FILE, "--results"),
+    trace_memory: bool = typer.Option(True, "--memory/--no-memory"),
+    seed: int = 0,
+):
+    unknown_stages = [s for s in stages if s not in STAGES]
+    if unknown_stages:
+        raise typer.BadParameter(f"Unknown stages: {unknown_stages}, choose from {list(STAGES)}")
+
+    prev_results = read_results(results_file)
+    git_rev, run_time = get_git_rev(), datetime.datetime.now().isoformat(timespec="seconds")
+
+    results, cwd = [], Path.cwd()
+    for scale in scales:
+        corpus = SyntheticCorpus(num_details=scale, seed=seed)
+        with tempfile.TemporaryDirectory() as task_dir:
+            os.chdir(task_dir)
+            try:
+                cadre_file_dict = corpus.write_conf(task_dir)
+                for stage in stages:
+                    result = {"stage": stage, "scale": scale, "git_rev": git_rev, "run_time": run_time}
+                    result.update(measure(STAGES[stage], corpus, cadre_file_dict, trace_memory))
+                    show_comparison(result, prev_results)
+                    results.append(result)
+            finally:
+                os.chdir(cwd)
+
+    with open(results_file, "a") as results_fp:
+        for result in results:
+            results_fp.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    app()
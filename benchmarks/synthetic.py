@@ -0,0 +1,294 @@
+import datetime
+import json
+import math
+import random
+import string
+from pathlib import Path
+
+import yaml
+
+from orgpedia.extracts.orgpedia import Order
+from orgpedia.tools.lang_runtime import LANG_CODES
+
+# Synthetic corpus of council-of-ministers style orders. Everything is
+# generated in memory from a seed, so the benchmarks run offline and without
+# any PDFs. The shapes mirror what the pipeline exports in orders.json.
+
+FIRST_NAMES = [
+    'Aarti', 'Abhay', 'Ajit', 'Amit', 'Anand', 'Anil', 'Anita', 'Arjun', 'Arun', 'Ashok',
+    'Bhavna', 'Chandra', 'Deepak', 'Devendra', 'Dinesh', 'Gita', 'Gopal', 'Hari', 'Indira', 'Jagdish',
+    'Jaya', 'Kamal', 'Kavita', 'Krishna', 'Lalit', 'Madhav', 'Mahesh', 'Manoj', 'Meena', 'Mohan',
+    'Mukesh', 'Nalini', 'Naresh', 'Nirmala', 'Pankaj', 'Prakash', 'Pramod', 'Prem', 'Radha', 'Rajesh',
+    'Rakesh', 'Ram', 'Ramesh', 'Ravi', 'Rekha', 'Sanjay', 'Santosh', 'Sarita', 'Shanti', 'Shyam',
+    'Subhash', 'Sudha', 'Sunil', 'Suresh', 'Sushma', 'Uma', 'Usha', 'Vijay', 'Vinod', 'Yogesh',
+]  # fmt: skip
+
+LAST_NAMES = [
+    'Agarwal', 'Ahmed', 'Bansal', 'Bhatt', 'Chauhan', 'Chopra', 'Das', 'Desai', 'Dubey', 'Gandhi',
+    'Ghosh', 'Gupta', 'Iyer', 'Jain', 'Joshi', 'Kapoor', 'Khan', 'Kulkarni', 'Kumar', 'Malhotra',
+    'Mehta', 'Menon', 'Mishra', 'Mukherjee', 'Naidu', 'Nair', 'Pandey', 'Patel', 'Patil', 'Pillai',
+    'Prasad', 'Rao', 'Reddy', 'Saxena', 'Sen', 'Shah', 'Sharma', 'Shukla', 'Singh', 'Sinha',
+    'Srivastava', 'Thakur', 'Tiwari', 'Trivedi', 'Varma', 'Verma', 'Yadav', 'Chatterjee', 'Bose', 'Dutta',
+]  # fmt: skip
+
+SUBJECTS = [
+    'Home Affairs', 'External Affairs', 'Defence', 'Finance', 'Railways', 'Agriculture', 'Education',
+    'Health and Family Welfare', 'Law and Justice', 'Commerce and Industry', 'Civil Aviation', 'Coal',
+    'Culture', 'Environment and Forests', 'Food Processing Industries', 'Information and Broadcasting',
+    'Labour and Employment', 'Mines', 'Petroleum and Natural Gas', 'Power', 'Rural Development',
+    'Science and Technology', 'Shipping', 'Social Justice and Empowerment', 'Steel', 'Textiles',
+    'Tourism', 'Tribal Affairs', 'Urban Development', 'Water Resources', 'Youth Affairs and Sports',
+    'Chemicals and Fertilizers', 'Communications', 'Consumer Affairs', 'Heavy Industries',
+    'Housing and Urban Poverty Alleviation', 'Minority Affairs', 'Panchayati Raj', 'Parliamentary Affairs',
+    'Personnel', 'Planning', 'Statistics', 'Women and Child Development', 'Road Transport and Highways',
+]  # fmt: skip
+
+ROLES = [
+    'Cabinet Minister',
+    'Minister of State (Independent Charge)',
+    'Minister of State',
+    'Deputy Minister',
+]
+ROLE_WEIGHTS = [4, 1, 4, 1]
+
+CADRE = 'minister'
+DEPT_ROOT = 'Ministries'
+ROLE_ROOT = 'Roles'
+
+START_DATE = datetime.date(year=1950, month=1, day=1)
+END_DATE = datetime.date(year=2024, month=1, day=1)
+MINISTRY_YEARS = 5
+
+
+class SyntheticWord:
+    """Placeholder for docint's Word, regions without words are falsy and get skipped by the components."""
+
+    def __init__(self, text, page_idx, word_idx):
+        self.text = text
+        self.page_idx = page_idx
+        self.word_idx = word_idx
+
+
+def add_words(region, text, page_idx):
+    region.words = [SyntheticWord(t, page_idx, idx) for (idx, t) in enumerate(text.split())]
+
+
+class SyntheticDoc:
+    """Stand-in for docint's Doc with only the attributes the orgpedia components use."""
+
+    def __init__(self, order):
+        self.order = order
+        self.pdf_name = order.order_id
+        self.tenures = []
+        self.pipe_names = []
+
+    def add_pipe(self, pipe_name):
+        self.pipe_names.append(pipe_name)
+
+    def add_extra_field(self, field_name, field_type):
+        pass
+
+
+class SyntheticCorpus:
+    def __init__(self, num_details=1000, details_per_order=25, noise=0.05, seed=0):
+        self.num_details = num_details
+        self.details_per_order = details_per_order
+        self.noise = noise
+        self.seed = seed
+
+        self.rng = random.Random(seed)
+        self.depts = [f'Ministry of {s}' for s in SUBJECTS]
+        self.officers = self.build_officers(max(50, num_details // 20))
+        self.ministries = self.build_ministries()
+        self.order_dicts = self.build_order_dicts()
+
+    def random_date(self, start, end):
+        return start + datetime.timedelta(days=self.rng.randrange((end - start).days))
+
+    def build_officers(self, num_officers):
+        names, officers = set(), []
+        while len(officers) < num_officers:
+            first_name = self.rng.choice(FIRST_NAMES)
+            initial = self.rng.choice(string.ascii_uppercase)
+            last_name = self.rng.choice(LAST_NAMES)
+            name = f'{first_name} {initial}. {last_name}'
+            if name in names:
+                name = f'{name} {len(officers)}'
+            names.add(name)
+
+            birth_date = self.random_date(datetime.date(1920, 1, 1), datetime.date(1975, 12, 31))
+            officer_idx = len(officers) + 1
+            officers.append(
+                {
+                    'officer_idx': officer_idx,
+                    'officer_id': f'Q{officer_idx:07d}',
+                    'salut': 'Shri',
+                    'name': name,
+                    'full_name': name,
+                    'cadre': CADRE,
+                    'birth_date': str(birth_date),
+                    'image_url': f'https://example.org/images/{officer_idx}.jpg',
+                }
+            )
+        return officers
+
+    def build_ministries(self):
+        ministries, start_date, idx = [], START_DATE, 0
+        while start_date < END_DATE:
+            end_date = start_date.replace(year=start_date.year + MINISTRY_YEARS)
+            pm = self.officers[idx % len(self.officers)]
+            ministry = {
+                'name': f'Ministry {idx + 1}',
+                'start_date': str(start_date),
+                'end_date': str(end_date) if end_date < END_DATE else 'today',
+                'pm': pm['name'],
+                'pm_officer_id': pm['officer_id'],
+                'first_order_id': f'order-{idx}-first.pdf',
+                'deputy_pms': [],
+            }
+            ministries.append(ministry)
+            start_date, idx = end_date, idx + 1
+        return ministries
+
+    def noisy_name(self, name):
+        if self.rng.random() >= self.noise or len(name) < 4:
+            return name
+        pos = self.rng.randrange(1, len(name) - 2)
+        return name[:pos] + name[pos + 1] + name[pos] + name[pos + 2 :]
+
+    def noisy_birth_date(self, birth_date):
+        r = self.rng.random()
+        if r < self.noise / 2 and birth_date.day <= 12:
+            return birth_date.replace(month=birth_date.day, day=birth_date.month)
+        elif r < self.noise:
+            try:
+                return birth_date.replace(day=(birth_date.day % 9) + 1)
+            except ValueError:
+                return birth_date
+        return birth_date
+
+    def post_dict(self, dept, role):
+        return {
+            'post_str': f'{role}, {dept}',
+            'dept_hpath': [DEPT_ROOT, dept],
+            'role_hpath': [ROLE_ROOT, role],
+            'post_id': f'D:{DEPT_ROOT}>{dept}',
+            'words': [],
+            'word_lines': [],
+            'word_lines_idxs': [],
+        }
+
+    def build_order_dicts(self):
+        num_orders = math.ceil(self.num_details / self.details_per_order)
+        total_days = (END_DATE - START_DATE).days
+        order_days = [(i * total_days) // num_orders for i in range(num_orders)]
+        order_dates = [START_DATE + datetime.timedelta(days=d) for d in order_days]
+
+        active_posts, order_dicts = {}, []
+        for order_idx, order_date in enumerate(order_dates):
+            category = 'Council of Ministers' if order_idx % 10 == 0 else 'civil_list' if order_idx % 10 == 5 else ''
+            officers = self.rng.sample(self.officers, min(self.details_per_order, len(self.officers)))
+            details = []
+            for detail_idx, officer in enumerate(officers):
+                officer_id = officer['officer_id']
+                verbs = {'continues': [], 'relinquishes': [], 'assumes': []}
+                active_post, assumes_post = active_posts.get(officer_id), True
+                if active_post and self.rng.random() < 0.3:
+                    verbs['continues'].append(active_post)
+                    assumes_post = False
+                elif active_post:
+                    verbs['relinquishes'].append(active_post)
+                    del active_posts[officer_id]
+                    assumes_post = self.rng.random() < 0.5
+
+                if assumes_post:
+                    role = self.rng.choices(ROLES, ROLE_WEIGHTS)[0]
+                    active_posts[officer_id] = self.post_dict(self.rng.choice(self.depts), role)
+                    verbs['assumes'].append(active_posts[officer_id])
+
+                birth_date = datetime.date.fromisoformat(officer['birth_date'])
+                name = self.noisy_name(officer['name'])
+                details.append(
+                    {
+                        'detail_idx': detail_idx,
+                        'detail_page_idx': detail_idx // 10,
+                        'officer': {
+                            'salut': officer['salut'],
+                            'name': name,
+                            'full_name': name,
+                            'cadre': CADRE,
+                            'birth_date': self.noisy_birth_date(birth_date),
+                            'officer_id': officer_id,
+                            'words': [],
+                            'word_lines': [],
+                            'word_lines_idxs': [],
+                        },
+                        **verbs,
+                    }
+                )
+            order_dicts.append(
+                {
+                    'order_id': f'order-{order_idx:07d}.pdf',
+                    'date': str(order_date),
+                    'category': category,
+                    'details': details,
+                }
+            )
+        return order_dicts
+
+    def build_orders(self, id_fraction=1.0):
+        """Build fresh Order objects, keeping the officer_id for `id_fraction` of the details."""
+        rng = random.Random(self.seed + 1)
+        orders = []
+        for order_dict in self.order_dicts:
+            order = Order.from_dict(json.loads(json.dumps(order_dict, default=str)))
+            for detail in order.details:
+                add_words(detail.officer, detail.officer.name, detail.detail_page_idx)
+                [add_words(p, p.post_str, detail.detail_page_idx) for p in detail.get_posts()]
+                detail.words = detail.officer.words + [w for p in detail.get_posts() for w in p.words]
+                if rng.random() >= id_fraction:
+                    detail.officer.officer_id = ''
+            orders.append(order)
+        return orders
+
+    def build_docs(self, id_fraction=1.0):
+        return [SyntheticDoc(order) for order in self.build_orders(id_fraction)]
+
+    @property
+    def num_orders(self):
+        return len(self.order_dicts)
+
+    def write_conf(self, task_dir):
+        task_dir = Path(task_dir)
+        conf_dir = task_dir / 'conf'
+        for sub_dir in ['conf', 'logs', 'output', 'input']:
+            (task_dir / sub_dir).mkdir(parents=True, exist_ok=True)
+
+        officers_path = conf_dir / 'officers.json'
+        officers_path.write_text(json.dumps({'officers': self.officers}))
+
+        (conf_dir / 'wiki_officer.yml').write_text(yaml.dump({'officers': self.officers}))
+        (conf_dir / 'ministries.yml').write_text(yaml.dump({'ministries': self.ministries}))
+        (conf_dir / 'ministries.json').write_text(json.dumps({'ministries': self.ministries}))
+        (conf_dir / 'mismatch_names.yml').write_text(yaml.dump({'mis_matches': []}))
+
+        post_infos = {'dept': {'ministries': [{'name': d} for d in self.depts]}}
+        (conf_dir / 'post_infos.json').write_text(json.dumps(post_infos))
+
+        (conf_dir / 'trans.yml').write_text(yaml.dump(self.build_translations(), allow_unicode=True))
+        return {CADRE: str(officers_path)}
+
+    def build_translations(self, languages=LANG_CODES):
+        def same(texts):
+            return dict((t, dict((lang, t) for lang in languages)) for t in texts)
+
+        labels = ['to_date', 'home', 'ministers', 'orders', 'order', 'prime_ministers', 'deputy_prime_ministers']
+        labels += ['council_of_ministers', 'continues', 'relinquishes', 'assumes', 'civil_list']
+        return {
+            'digits': dict((d, dict((lang, d) for lang in languages)) for d in string.digits),
+            'labels': same(labels),
+            'names': same(o['name'] for o in self.officers),
+            'ministry': same(m['name'] for m in self.ministries),
+            'dept': same(self.depts + ['']),
+            'role': same(ROLES + ['Prime Minister', 'Deputy Prime Minister']),
+        }
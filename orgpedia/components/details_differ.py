@@ -1,11 +1,12 @@
 import json
-import logging
-import sys
 from pathlib import Path
 
 from docint.data_error import DataError
 from docint.vision import Vision
 
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
+
 # b /Users/mukund/Software/docInt/docint/pipeline/id_assigner.py:34
 
 
@@ -45,26 +46,16 @@ class DetailsDiffer:
         self.mode = mode
         self.output_dir = Path(output_dir)
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_detail_line(self, d):
         def get_post(post):
@@ -90,9 +81,10 @@ class DetailsDiffer:
             errors.append(PostIDDiffError(path=path, msg=f'{verb}: {msg}', name='PostIDDiff'))
         return diffs, errors
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"details_differ: {doc.pdf_name}")
+        self.lgr.info("details_differ: %s", doc.pdf_name)
 
         details_path = self.output_dir / f'{doc.pdf_name}.orderdetails.json'
 
@@ -138,7 +130,7 @@ class DetailsDiffer:
                     )
 
         doc.add_errors(errors)
-        self.lgr.info(f"=={doc.pdf_name}.details_differ {len(doc.order.details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==%s.details_differ %s %s", doc.pdf_name, len(doc.order.details), DataError.error_counts(errors))
+        [self.lgr.info("%s", e) for e in errors]
         self.remove_log_handler(doc)
         return doc
@@ -1,9 +1,9 @@
 import datetime
 import json
-import logging
-import sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from itertools import groupby, product
+from itertools import groupby, product, repeat
 from operator import attrgetter
 from pathlib import Path
 from statistics import mean, median
@@ -14,6 +14,9 @@ from more_itertools import first, flatten, partition
 from polyleven import levenshtein
 
 from ..extracts.orgpedia import OfficerID
+from ..tools.date_match import BirthDates
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timing import phase, timed, timed_phase
 
 # b /Users/mukund/Software/docInt/docint/pipeline/details_merger.py:34
 
@@ -66,6 +69,141 @@ def get_duplicates(iter):
     return [i for i in iter if i in seen or seen.add(i)]
 
 
+# Union-find merge engine: instead of growing one OfficerHistory at a time,
+# details with the same officer_id are merged directly and candidate pairs of
+# the other details are generated from blocking keys, scored with the
+# same cascade as find_matching_detail and the clusters are built by merging
+# the pairs in rank order. Everything below works on MergeRecords, so that a
+# cadre can be merged in a separate process.
+
+MATCH_RANKS = [
+    "officer_id_match",
+    "exact_name_exact_date_match",
+    "exact_name_fuzzy_date_match",
+    "fuzzy_name_exact_date_match",
+    "fuzzy_name_fuzzy_date_match",
+    "exact_name_exact_post_match",
+    "fuzzy_name_exact_post_match",
+    "align_name_exact_date_match",
+    "exact_name_match",
+    "fuzzy_name_match",
+]
+
+MergeRecord = namedtuple(
+    "MergeRecord",
+    ["order_idx", "pos", "is_civil", "name", "birth_date", "officer_id", "before_post_id", "after_post_id"],
+)
+
+
+# number of following records in a birth_date or name block that a record is compared with
+MERGE_WINDOW = 4
+
+
+def name_variants(name):
+    # names within levenshtein distance 1 always share one of these deletion variants
+    return {name} | {name[:i] + name[i + 1 :] for i in range(len(name))}
+
+
+def get_match_rank(a, b, duplicate_names, mismatch_names):  # noqa: C901
+    """Rank of the first rule in the cascade that matches `b` to the history of `a`, None if none does."""
+    if a.officer_id and a.officer_id == b.officer_id:
+        return 0
+    elif a.officer_id and b.officer_id:
+        return None
+
+    exact_name = a.name == b.name
+    fuzzy_name = exact_name or levenshtein(a.name, b.name, 1) <= 1
+
+    has_dates = b.is_civil and a.birth_date and b.birth_date
+    exact_date = has_dates and a.birth_date == b.birth_date
+    fuzzy_date = has_dates and fuzzy_date_match(b.birth_date, a.birth_date)
+    exact_post = a.after_post_id and a.after_post_id == b.before_post_id
+
+    if exact_name and exact_date:
+        return 1
+    elif exact_name and fuzzy_date:
+        return 2
+    elif fuzzy_name and exact_date:
+        return 3
+    elif fuzzy_name and fuzzy_date:
+        return 4
+    elif exact_post and exact_name:
+        return 5
+    elif exact_post and fuzzy_name:
+        return 6
+    elif exact_date and align_name_match(b.name, a.name):
+        return 7
+    elif a.name in duplicate_names or b.name in duplicate_names:
+        return None
+    elif exact_name:
+        return 8
+    elif fuzzy_name and tuple(sorted([a.name, b.name])) not in mismatch_names:
+        return 9
+    return None
+
+
+def merge_records(records, duplicate_names, mismatch_names, window=MERGE_WINDOW):
+    """Cluster the records of a cadre, returns lists of (order_idx, pos) of the merged details."""
+    parent = list(range(len(records)))
+    cluster_orders = [{r.order_idx} for r in records]
+    cluster_ids = [r.officer_id for r in records]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri == rj or cluster_orders[ri] & cluster_orders[rj]:
+            return False
+        if cluster_ids[ri] and cluster_ids[rj] and cluster_ids[ri] != cluster_ids[rj]:
+            return False
+
+        if len(cluster_orders[ri]) < len(cluster_orders[rj]):
+            ri, rj = rj, ri
+        parent[rj] = ri
+        cluster_orders[ri] |= cluster_orders[rj]
+        cluster_ids[ri] = cluster_ids[ri] or cluster_ids[rj]
+        cluster_orders[rj] = None
+        return True
+
+    # records sharing an officer_id are merged directly, into the first of its clusters with no detail in the order
+    id_blocks, blocks = defaultdict(list), defaultdict(list)
+    for idx, r in enumerate(records):
+        if r.officer_id:
+            id_blocks[r.officer_id].append(idx)
+        if r.birth_date:
+            blocks[("birth_date", r.birth_date)].append(idx)
+        [blocks[("name", v)].append(idx) for v in name_variants(r.name)]
+
+    for idxs in id_blocks.values():
+        heads = []
+        for idx in idxs:
+            if not any(union(head, idx) for head in heads):
+                heads.append(idx)
+
+    # the birth_date and name blocks grow with the records, a record is paired only with its next few
+    # neighbours in the block, the records are sorted by (order_idx, pos) so i is from an earlier order than j
+    pairs = set()
+    for idxs in blocks.values():
+        for offset in range(1, window + 1):
+            pairs.update((i, j) for i, j in zip(idxs, idxs[offset:]) if records[i].order_idx != records[j].order_idx)
+
+    ranked_pairs = []
+    for i, j in pairs:
+        rank = get_match_rank(records[i], records[j], duplicate_names, mismatch_names)
+        if rank:  # rank 0, the officer_id matches, are already merged
+            ranked_pairs.append((rank, i, j))
+    ranked_pairs.sort()
+    [union(i, j) for (_, i, j) in ranked_pairs]
+
+    clusters = defaultdict(list)
+    [clusters[find(i)].append((r.order_idx, r.pos)) for i, r in enumerate(records)]
+    return list(clusters.values())
+
+
 @dataclass
 class OfficerHistory:
     details: []
@@ -255,6 +393,8 @@ class OfficerHistory:
         "post_id_fields": [],
         "officer_match_fields": [],
         "mismatch_names_file": "mismatch_names.yml",
+        "merge_engine": "greedy",
+        "merge_workers": 1,
     },
 )
 class DetailsMerger:
@@ -267,6 +407,8 @@ class DetailsMerger:
         post_id_fields,
         officer_match_fields,
         mismatch_names_file,
+        merge_engine="greedy",
+        merge_workers=1,
     ):
         self.conf_dir = Path(conf_dir)
         self.conf_stub = Path(conf_stub)
@@ -274,9 +416,14 @@ class DetailsMerger:
         self.post_id_fields = post_id_fields
         self.added_details = set()
 
+        assert merge_engine in ("greedy", "union_find"), f"Unknown merge_engine: {merge_engine}"
+        self.merge_engine = merge_engine
+        self.merge_workers = merge_workers
+
         self.duplicate_nows_names = set()
         self.order_officerid_dict = {}
         self.order_name_birthdate_dict = {}
+        self.order_birth_dates_dict = {}
 
         for cadre, cadre_file in cadre_file_dict.items():
             print(f"{cadre}: {cadre_file}")
@@ -296,30 +443,20 @@ class DetailsMerger:
         mis_dict = read_config_from_disk(mismatch_names_path)
         self.mismatch_nows_names = self.build_mismatch(mis_dict)
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
 
-        self.lgr.info(f"#Duplicates: {len(self.duplicate_nows_names)}")
-        self.lgr.info(f"#Duplicates: {'|'.join(self.duplicate_nows_names)}")
-        self.lgr.info(f"#Mismatch Names: {len(self.mismatch_nows_names)}")
+        self.lgr.info("#Duplicates: %s", len(self.duplicate_nows_names))
+        self.lgr.info("#Duplicates: %s", LazyStr('|'.join, self.duplicate_nows_names))
+        self.lgr.info("#Mismatch Names: %s", len(self.mismatch_nows_names))
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def build_mismatch(self, mis_dict):
         tuples = []
@@ -333,16 +470,23 @@ class DetailsMerger:
     def add_detail(self, order, detail):
         detail_tup = (order.order_id, detail.detail_idx)
         if detail_tup in self.added_details:
-            self.lgr.info(f"HUGE DETAIL ERROR {order.order_id}.{detail.detail_idx}")
+            self.lgr.info("HUGE DETAIL ERROR %s.%s", order.order_id, detail.detail_idx)
         self.added_details.add(detail_tup)
 
+    def get_order_birth_dates(self, order):
+        if order.order_id not in self.order_birth_dates_dict:
+            dates = [d.officer.birth_date if d.officer else None for d in order.details]
+            self.order_birth_dates_dict[order.order_id] = BirthDates(dates)
+        return self.order_birth_dates_dict[order.order_id]
+
     def is_duplicate(self, officer_history):
         ns = [fix_name(n) for n in officer_history.names]
         return any(n for n in ns if n in self.duplicate_nows_names)
 
+    @timed_phase("detail_match")
     def find_matching_detail(self, officer_history, order, o_idx):  # noqa: C901
         def iter_valid_details(order, cadre, order_officer_id):
-            for detail in order.details:
+            for pos, detail in enumerate(order.details):
                 if not detail.officer:
                     continue
                 if self.detail_added(order, detail):
@@ -353,7 +497,7 @@ class DetailsMerger:
                 if order_officer_id and detail.officer.officer_id:
                     continue
 
-                yield detail
+                yield pos, detail
 
         def get_before_post(detail):
             posts = detail.get_before_posts()
@@ -378,26 +522,23 @@ class DetailsMerger:
             return None
 
         def fuzzy_name_exact_date_match():
-            if oh.has_birth_date() and order.category == "civil_list":
-                for d_name, d in valid_details:
-                    d_date = d.officer.birth_date
-                    if d_date and oh.fuzzy_name_exact_date_match(d_name, d_date):
+            if has_date_matches:
+                for (d_name, d), date_matched in zip(valid_details, exact_dates):
+                    if date_matched and any(levenshtein(d_name, n, 1) <= 1 for n in oh.names):
                         return d
             return None
 
         def exact_name_fuzzy_date_match():
-            if oh.has_birth_date() and order.category == "civil_list":
-                for d_name, d in valid_details:
-                    d_date = d.officer.birth_date
-                    if d_date and oh.exact_name_fuzzy_date_match(d_name, d_date):
+            if has_date_matches:
+                for (d_name, d), date_matched in zip(valid_details, fuzzy_dates):
+                    if date_matched and d_name in oh.names:
                         return d
             return None
 
         def fuzzy_name_fuzzy_date_match():
-            if oh.has_birth_date() and order.category == "civil_list":
-                for d_name, d in valid_details:
-                    d_date = d.officer.birth_date
-                    if d_date and oh.fuzzy_name_date_match(d_name, d_date):
+            if has_date_matches:
+                for (d_name, d), date_matched in zip(valid_details, fuzzy_dates):
+                    if date_matched and oh.fuzzy_name_match(d_name):
                         return d
             return None
 
@@ -411,7 +552,11 @@ class DetailsMerger:
                         else:
                             names = "|".join(oh.names)
                             self.lgr.info(
-                                f"\t\tMissed-post: {names}<->{d_name} {oh_last_post.post_str}<->{d_post.post_str}"
+                                "\t\tMissed-post: %s<->%s %s<->%s",
+                                names,
+                                d_name,
+                                oh_last_post.post_str,
+                                d_post.post_str,
                             )
             return None
 
@@ -428,10 +573,9 @@ class DetailsMerger:
             return None
 
         def align_name_exact_date_match():
-            if oh.has_birth_date() and order.category == "civil_list":
-                for d_name, d in valid_details:
-                    d_date = d.officer.birth_date
-                    if oh.exact_date_match(d_date) and oh.align_name_match(d_name):
+            if has_date_matches:
+                for (d_name, d), date_matched in zip(valid_details, exact_dates):
+                    if date_matched and oh.align_name_match(d_name):
                         return d
             return None
 
@@ -467,10 +611,16 @@ class DetailsMerger:
         detail = officer_id_match()
         if detail:
             if self.detail_added(order, detail):
-                self.lgr.info(f"HUGE DUPLICATE DETAIL ERROR officer_id_match {order.order_id}.{detail.detail_idx}")
+                self.lgr.info("HUGE DUPLICATE DETAIL ERROR officer_id_match %s.%s", order.order_id, detail.detail_idx)
             else:
                 self.lgr.info(
-                    f"\tFound: {order_id}:{o_idx} officer_id_match {oh.names_str}<->{detail.officer.name} {oh.birth_date_str}<->{detail.officer.birth_date}"
+                    "\tFound: %s:%s officer_id_match %s<->%s %s<->%s",
+                    order_id,
+                    o_idx,
+                    oh.names_str,
+                    detail.officer.name,
+                    oh.birth_date_str,
+                    detail.officer.birth_date,
                 )
                 return detail
 
@@ -478,33 +628,51 @@ class DetailsMerger:
         if detail:
             if self.detail_added(order, detail):
                 self.lgr.info(
-                    f"HUGE DUPLICATE DETAIL ERROR exact_name_exact_date_match {order.order_id}.{detail.detail_idx}"
+                    "HUGE DUPLICATE DETAIL ERROR exact_name_exact_date_match %s.%s", order.order_id, detail.detail_idx
                 )
             else:
-                self.lgr.info(f"\tFound: {order_id}:{o_idx} exact_name_exact_date_match")
+                self.lgr.info("\tFound: %s:%s exact_name_exact_date_match", order_id, o_idx)
                 return detail
 
         o_cadre = oh.details[0].officer.cadre
-        valid_details = [(fix_name(d.officer.name), d) for d in list(iter_valid_details(order, o_cadre, oh_id))]
+        valid_pos_details = list(iter_valid_details(order, o_cadre, oh_id))
+        valid_details = [(fix_name(d.officer.name), d) for _, d in valid_pos_details]
+
+        # date conditions are evaluated for all the valid details at once, missing dates never match
+        has_date_matches = oh.has_birth_date() and order.category == "civil_list"
+        if has_date_matches:
+            d_birth_dates = self.get_order_birth_dates(order).take([pos for pos, _ in valid_pos_details])
+            exact_dates = d_birth_dates.any_exact(oh.birth_dates)
+            fuzzy_dates = d_birth_dates.any_fuzzy(oh.birth_dates)
 
         detail = exact_name_fuzzy_date_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} exact_name_fuzzy_date_match {oh.birth_date_str}<->{detail.officer.birth_date}"
+                "\tFound: %s:%s exact_name_fuzzy_date_match %s<->%s",
+                order_id,
+                o_idx,
+                oh.birth_date_str,
+                detail.officer.birth_date,
             )
             return detail
 
         detail = fuzzy_name_exact_date_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} fuzzy_name_exact_date_match {oh.names_str}<->{detail.officer.name}"
+                "\tFound: %s:%s fuzzy_name_exact_date_match %s<->%s", order_id, o_idx, oh.names_str, detail.officer.name
             )
             return detail
 
         detail = fuzzy_name_fuzzy_date_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} fuzzy_name_fuzzy_date_match {oh.names_str}<->{detail.officer.name} {oh.birth_date_str}<->{detail.officer.birth_date}"
+                "\tFound: %s:%s fuzzy_name_fuzzy_date_match %s<->%s %s<->%s",
+                order_id,
+                o_idx,
+                oh.names_str,
+                detail.officer.name,
+                oh.birth_date_str,
+                detail.officer.birth_date,
             )
             return detail
 
@@ -512,36 +680,51 @@ class DetailsMerger:
         detail = exact_name_exact_post_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} exact_name_exact_post_match {oh.names_str}<->{detail.officer.name}"
+                "\tFound: %s:%s exact_name_exact_post_match %s<->%s", order_id, o_idx, oh.names_str, detail.officer.name
             )
             return detail
 
         detail = fuzzy_name_exact_post_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} fuzzy_name_exact_post_match {oh.names_str}<->{detail.officer.name}"
+                "\tFound: %s:%s fuzzy_name_exact_post_match %s<->%s", order_id, o_idx, oh.names_str, detail.officer.name
             )
             return detail
 
         detail = align_name_exact_date_match()
         if detail:
             self.lgr.info(
-                f"\tFound: {order_id}:{o_idx} align_name_exact_date_match {oh.names_str}<->{detail.officer.name} {oh.birth_date_str}<->{detail.officer.birth_date}"
+                "\tFound: %s:%s align_name_exact_date_match %s<->%s %s<->%s",
+                order_id,
+                o_idx,
+                oh.names_str,
+                detail.officer.name,
+                oh.birth_date_str,
+                detail.officer.birth_date,
             )
             return detail
 
         detail = exact_name_match()
         if detail:
-            self.lgr.info(f"\tFound: {order_id}:{o_idx} exact_name_match {oh.names_str}<->{detail.officer.name}")
+            self.lgr.info("\tFound: %s:%s exact_name_match %s<->%s", order_id, o_idx, oh.names_str, detail.officer.name)
             return detail
 
         detail = fuzzy_name_match()
         if detail:
-            self.lgr.info(f"\tFound: {order_id}:{o_idx} fuzzy_name_match {oh.names_str}<->{detail.officer.name}")
+            self.lgr.info("\tFound: %s:%s fuzzy_name_match %s<->%s", order_id, o_idx, oh.names_str, detail.officer.name)
             return detail
 
         return None
 
+    def add_order_duplicate_names(self, orders):
+        def duplicate_names(order):
+            ns = [fix_name(d.officer.name) for d in order.details]
+            seen = set()
+            return [n for n in ns if n in seen or seen.add(n)]
+
+        self.duplicate_nows_names.update(flatten(duplicate_names(o) for o in orders))
+        self.lgr.info("#Duplicates: %s", len(self.duplicate_nows_names))
+
     def get_officer_histories(self, orders):
         def iter_valid_details(orders):
             for o_idx, order in enumerate(orders):
@@ -551,25 +734,21 @@ class DetailsMerger:
 
                     yield o_idx, order, detail.detail_idx, detail
 
-        def get_duplicate_nows_names(orders):
-            def duplicate_names(order):
-                ns = [fix_name(d.officer.name) for d in order.details]
-                seen = set()
-                return [n for n in ns if n in seen or seen.add(n)]
-
-            return flatten(duplicate_names(o) for o in orders)
-
         orders = sorted(orders, key=attrgetter("date"))
         officer_histories = []
 
-        order_duplicate_nows_names = get_duplicate_nows_names(orders)
-        self.duplicate_nows_names.update(order_duplicate_nows_names)
-        self.lgr.info(f"#Duplicates: {len(self.duplicate_nows_names)}")
+        self.add_order_duplicate_names(orders)
 
         for (o_idx, order, d_idx, detail) in iter_valid_details(orders):
             officer_id = detail.officer.officer_id
             self.lgr.info(
-                f"{order.order_id}:{o_idx}[{d_idx}] officer_id:{officer_id} name: {detail.officer.name} dob: {detail.officer.birth_date}"
+                "%s:%s[%s] officer_id:%s name: %s dob: %s",
+                order.order_id,
+                o_idx,
+                d_idx,
+                officer_id,
+                detail.officer.name,
+                detail.officer.birth_date,
             )
 
             o_history = OfficerHistory(
@@ -579,7 +758,7 @@ class DetailsMerger:
                 officer_id=officer_id,
             )
             self.add_detail(order, detail)
-            self.lgr.info(f"Processing {order.order_id} {o_idx}>{detail.detail_idx}")
+            self.lgr.info("Processing %s %s>%s", order.order_id, o_idx, detail.detail_idx)
 
             for (child_oidx, child_order) in enumerate(orders[o_idx + 1 :], o_idx + 1):
                 o_detail = self.find_matching_detail(o_history, child_order, child_oidx)
@@ -587,7 +766,7 @@ class DetailsMerger:
                 if o_detail:
                     o_history.add_detail(child_order, o_detail, child_oidx)
                     self.add_detail(child_order, o_detail)
-                    self.lgr.info(f"Adding {child_order.order_id} {child_oidx}>{o_detail.detail_idx}")
+                    self.lgr.info("Adding %s %s>%s", child_order.order_id, child_oidx, o_detail.detail_idx)
                 else:
                     pass
                     # self.lgr.info(f'\tNot Found: {child_order.order_id}:{child_oidx} {child_order.category} officer_id: {officer_id}')
@@ -596,6 +775,63 @@ class DetailsMerger:
         # end for
         return officer_histories
 
+    def merge_officer_histories(self, orders):
+        def post_id(posts):
+            assert len(posts) in (0, 1)
+            return posts[0].post_id if posts and not posts[0].has_error() else None
+
+        def build_record(o_idx, order, pos, detail):
+            officer = detail.officer
+            return MergeRecord(
+                order_idx=o_idx,
+                pos=pos,
+                is_civil=order.category == "civil_list",
+                name=fix_name(officer.name),
+                birth_date=officer.birth_date,
+                officer_id=officer.officer_id,
+                before_post_id=post_id(detail.get_before_posts()),
+                after_post_id=post_id(detail.get_after_posts()),
+            )
+
+        orders = sorted(orders, key=attrgetter("date"))
+        self.add_order_duplicate_names(orders)
+
+        cadre_records = defaultdict(list)
+        for o_idx, order in enumerate(orders):
+            for pos, detail in enumerate(order.details):
+                if detail.officer and not self.detail_added(order, detail):
+                    cadre_records[detail.officer.cadre].append(build_record(o_idx, order, pos, detail))
+
+        cadres = list(cadre_records)
+        merge_args = (
+            [cadre_records[c] for c in cadres],
+            repeat(self.duplicate_nows_names),
+            repeat(self.mismatch_nows_names),
+        )
+        if self.merge_workers > 1 and len(cadres) > 1:
+            with ProcessPoolExecutor(max_workers=self.merge_workers) as executor:
+                cadre_clusters = list(executor.map(merge_records, *merge_args))
+        else:
+            cadre_clusters = list(map(merge_records, *merge_args))
+
+        officer_histories = []
+        for cadre, clusters in zip(cadres, cadre_clusters):
+            self.lgr.info("%s: #records: %s #clusters: %s", cadre, len(cadre_records[cadre]), len(clusters))
+            for cluster in clusters:
+                (o_idx, pos), rest = cluster[0], cluster[1:]
+                order, detail = orders[o_idx], orders[o_idx].details[pos]
+                o_history = OfficerHistory(
+                    orders=[order], details=[detail], order_idxs=[o_idx], officer_id=detail.officer.officer_id
+                )
+                self.add_detail(order, detail)
+                for o_idx, pos in rest:
+                    o_history.add_detail(orders[o_idx], orders[o_idx].details[pos], o_idx)
+                    self.add_detail(orders[o_idx], orders[o_idx].details[pos])
+                officer_histories.append(o_history)
+
+        officer_histories.sort(key=lambda oh: (oh.order_idxs[0], oh.details[0].detail_idx))
+        return officer_histories
+
     def assign_id(self, officer_histories):
         cadre_id_dict, officer_ids = {}, []
         for oh in officer_histories:
@@ -618,6 +854,29 @@ class DetailsMerger:
             oid["birth_date"] = f"{bd.year}-{bd.month}-{bd.day}"
         officerid_path.write_text(json.dumps({"officers": officerids}, indent=2))
 
+    def index_orders(self, orders):
+        self.order_birth_dates_dict = {}
+        civil_orders = [o for o in orders if o.category == "civil_list"]
+
+        # officer_id_dict
+        officerid_details = [(o, d) for o in orders for d in o.details if d.officer and d.officer.officer_id]
+        order_officerids = [((o.order_id, d.officer.officer_id), d) for o, d in officerid_details]
+        self.order_officerid_dict = dict(order_officerids)
+
+        # duplicate handling
+        dup_order_officerids = get_duplicates(t[0] for t in order_officerids)
+        self.lgr.info("#order_officerids duplicates: %s %s", len(dup_order_officerids), dup_order_officerids)
+
+        self.order_name_birthdate_dict = dict(
+            (
+                ((o.order_id, fix_name(d.officer.name), d.officer.birth_date), d)
+                for o in civil_orders
+                for d in o.details
+                if d.officer and d.officer.birth_date
+            )
+        )
+
+    @timed
     def pipe(self, docs, **kwargs):
         def stats(nums):
             nums = list(nums)
@@ -634,33 +893,11 @@ class DetailsMerger:
 
         self.lgr.info("Entering details_merger.pipe")
 
-        now = datetime.datetime.now()
-        sys.stderr.write(f"Starting   {now.hour:02}:{now.minute:02}:{now.second:02}\n")
-        sys.stderr.flush()
-
         order_cutoff_date = datetime.date(year=2021, month=1, day=1)
 
         orders = [doc.order for doc in docs]
-        civil_orders = [o for o in orders if o.category == "civil_list"]
         non_civil_orders = [o for o in orders if o.category != "civil_list"]
-
-        # officer_id_dict
-        officerid_details = [(o, d) for o in orders for d in o.details if d.officer and d.officer.officer_id]
-        order_officerids = [((o.order_id, d.officer.officer_id), d) for o, d in officerid_details]
-        self.order_officerid_dict = dict(order_officerids)
-
-        # duplicate handling
-        dup_order_officerids = get_duplicates(t[0] for t in order_officerids)
-        self.lgr.info(f"#order_officerids duplicates: {len(dup_order_officerids)} {dup_order_officerids}")
-
-        self.order_name_birthdate_dict = dict(
-            (
-                ((o.order_id, fix_name(d.officer.name), d.officer.birth_date), d)
-                for o in civil_orders
-                for d in o.details
-                if d.officer and d.officer.birth_date
-            )
-        )
+        self.index_orders(orders)
 
         total_details = sum(len(o.details) for o in orders)
         withid_details = len(self.order_officerid_dict)
@@ -671,10 +908,11 @@ class DetailsMerger:
         )
         print(f"#non_civil_NOID_details: {non_civil_noid_details} #errors: {noid_post_error_details}")
 
-        sys.stderr.write(f"Built dict {now.hour:02}:{now.minute:02}:{now.second:02}\n")
-        sys.stderr.flush()
-
-        officer_histories = self.get_officer_histories(orders)
+        with phase("officer_histories"):
+            if self.merge_engine == "union_find":
+                officer_histories = self.merge_officer_histories(orders)
+            else:
+                officer_histories = self.get_officer_histories(orders)
         noid_OHs = [oh for oh in officer_histories if not oh.officer_id]
 
         nodup_noid_OHs, dup_noid_OHs = partition(self.is_duplicate, noid_OHs)
@@ -4,6 +4,8 @@ from pathlib import Path
 from docint.vision import Vision
 from more_itertools import flatten
 
+from ..tools.timing import timed
+
 MarathiNums = "१२३४५६७८९०.() "
 
 
@@ -92,6 +94,7 @@ class DocTranslator:
             table_trans.append([trans_number(c) if is_number(c) else self.get_text_trans(c) for c in row_texts])
         return table_trans
 
+    @timed
     def __call__(self, doc):
         doc.add_extra_page_field("para_trans", ("noparse", "", ""))
         doc.add_extra_page_field("table_trans", ("noparse", "", ""))
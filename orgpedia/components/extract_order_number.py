@@ -1,6 +1,7 @@
 import datetime
 import json
 import os
+import re
 import time
 
 from pathlib import Path
@@ -10,7 +11,11 @@ from docint.region import Region
 
 # from ..util import get_full_path, get_model_path, is_readable_nonempty, is_repo_path
 from docint.vision import Vision
-from more_itertools import flatten, pairwise
+from more_itertools import flatten
+
+from ..tools.lru_cache import LRUCache
+from ..tools.page_geometry import get_page_geometry
+from ..tools.timing import record_phase, timed
 
 class OrderTypeParser:
     TypeDict = {'Order': ['आदेश', 'कार्यालयीन आदेश'],
@@ -57,21 +62,32 @@ class OrderTypeParser:
              'अनापुग्रासंविभाग', 'गृहनिर्माण विभाग', 'प्रशासकीय विभाग', 'वित्त विभागाचा', 'जलसंपदा विभाग', 'वित्त विभाग',
              'गृह विभाग', 'प्रविभाग', 'सामान्य प्रशासन विभाग']
 
+    # one pass to find if any dept is present, most lines have none
+    DeptsRE = re.compile('|'.join(map(re.escape, Depts)))
+
     def __init__(self):
         self.order_types_set={}
         for (k, vals) in OrderTypeParser.TypeDict.items():
             for v in vals:
                 self.order_types_set[v] = k
             self.order_types_set[k.lower()] = k
+        self.parse_cache = LRUCache()
 
     def parse(self, order_line):
+        return self.parse_cache.get(order_line, lambda: self.parse_order_type(order_line))
+
+    def parse_batch(self, order_lines):
+        return [self.parse(order_line) for order_line in order_lines]
+
+    def parse_order_type(self, order_line):
         order_type = order_line
         order_type = order_type.replace('-', '').replace('.', '').replace(' , ', ' ').replace(' (','')
         order_type = order_type.replace('  ', ' ')
         order_type = order_type.strip(' ,– ')
 
-        for dept in OrderTypeParser.Depts:
-            order_type = order_type.replace(dept, '')
+        if OrderTypeParser.DeptsRE.search(order_type):
+            for dept in OrderTypeParser.Depts:
+                order_type = order_type.replace(dept, '')
 
         order_type = order_type.replace('क्रमांकः ', '')
         order_type = order_type.replace(' शासन ', '').replace(' क्रमांक', '').replace(' क्र', '')
@@ -102,38 +118,38 @@ class OrderNumber(Region):
     line_number: int
 
 class OrderNumberParser:
-    def split_line(self, order_number_str):
-        colon_replacements = [
-            ('क्रमांकः', 'क्रमांक :'),
-            ('परिपत्रकः', 'परिपत्रक :'),
-            ('शुद्धिपत्रकः', 'शुद्धिपत्रक :'),
-            (' क्रः ', 'क्र: '),
-        ]
-
-        replacements = [
-            ('क्रमांक ', 'क्रमांक :'),
-            ('क्रमांक- ', 'क्रमांक- :'),
-            ('क्रमांक-', 'क्रमांक-:'),
-            ('क्रं.', 'क्रं.:'),
-            (' क्र. ', ' क्र. :'),
-            ('क्र.- ', 'क्र.- :'),
-            ('क्र- ', 'क्र- :'),
-            ('क्र.', 'क्र.:'),
-            (' क्र . ', ' क्र. : '),
-
-        ]
+    ColonReplacements = [
+        ('क्रमांकः', 'क्रमांक :'),
+        ('परिपत्रकः', 'परिपत्रक :'),
+        ('शुद्धिपत्रकः', 'शुद्धिपत्रक :'),
+        (' क्रः ', 'क्र: '),
+    ]
+
+    Replacements = [
+        ('क्रमांक ', 'क्रमांक :'),
+        ('क्रमांक- ', 'क्रमांक- :'),
+        ('क्रमांक-', 'क्रमांक-:'),
+        ('क्रं.', 'क्रं.:'),
+        (' क्र. ', ' क्र. :'),
+        ('क्र.- ', 'क्र.- :'),
+        ('क्र- ', 'क्र- :'),
+        ('क्र.', 'क्र.:'),
+        (' क्र . ', ' क्र. : '),
+    ]
+
+    DateVariations = [', दिनांक', ',दिनांक', ' दिनांक', ', दि.', ',दि.', ' दि.']
 
+    def split_line(self, order_number_str):
         if order_number_str.isascii():
             return self.split_line_en(order_number_str)
 
-        date_variations = [', दिनांक', ',दिनांक', ' दिनांक', ', दि.', ',दि.', ' दि.']
         order_line, date_line = order_number_str, ''
-        for d in date_variations:
+        for d in OrderNumberParser.DateVariations:
             if d in order_number_str:
                 order_line, date_line = order_number_str.split(d, 1)
                 break
 
-        for old_c, new_c in colon_replacements:
+        for old_c, new_c in OrderNumberParser.ColonReplacements:
             order_line = order_line.replace(old_c, new_c, 1)
             if order_line.count(':') == 1:
                 break
@@ -141,7 +157,7 @@ class OrderNumberParser:
         if order_line.count(':') >= 1:
             return order_line, None
 
-        for old, new in replacements:
+        for old, new in OrderNumberParser.Replacements:
             order_line = order_line.replace(old, new, 1)
             if order_line.count(':') == 1:
                 break
@@ -184,6 +200,9 @@ class OrderNumberParser:
         order_type, order_number = order_type.strip(), self.clean_order_number(order_number)
         return order_type, order_number, None
 
+    def parse_batch(self, order_number_strs):
+        return [self.parse(order_number_str) for order_number_str in order_number_strs]
+
 
 
 
@@ -200,39 +219,11 @@ class ExtractOrderNumber:
         self.order_type_parser = OrderTypeParser()
 
 
+    @timed
     def __call__(self, doc):
-        def is_center_aligned(line):
-            padding = 0.1
-            if not line:
-                return False
-            #print(f'\t\t\t{page_xmin} {line.xmin} -- {page_xmax} {line.xmax} {line.raw_text()}')
-            return (page_xmin + padding) < line.xmin < line.xmax < (page_xmax - padding)
-
-        def is_center_aligned2(line):
-            if not line:
-                return False
-            left_gap, right_gap = (line.xmin - page_xmin), (page_xmax - line.xmax)
-
-            #print(f'\t\t\t{page_xmin} {line.xmin} -- {page_xmax} {line.xmax} {line.raw_text()}')
-            return abs(left_gap - right_gap) < 0.1 and left_gap > 0.1
-
-        def has_gap(line, gap):
-            return any((w2.xmin - w1.xmax) > gap for (w1, w2) in pairwise(line.words))
-
-        def is_left_aligned(line):
-            return line and abs(page_xmin - line.xmin) < 0.1
-
-        def is_right_aligned(line):
-            return line and abs(page_xmax - line.xmax) < 0.1
-
-        def is_center_gapped(line):
-            return has_gap(line, 0.25) and is_left_aligned(line) and is_right_aligned(line)
-
-        def is_full_line(line, page1):
-            page1_xmin = min((w.xmin for w in page1.words), default=0.0)
-            page1_xmax = max((w.xmax for w in page1.words), default=1.0)
-
-            return abs(page1_xmin - line.xmin) < 0.05 and abs(page1_xmax - line.xmax) < 0.05
+        def is_header_line(g, idx):
+            is_center_gapped = g.has_gap(idx, 0.25) and g.is_left_aligned(idx) and g.is_right_aligned(idx)
+            return g.is_center_balanced(idx) or is_center_gapped or g.is_right_aligned(idx) or g.is_center_aligned(idx)
 
         start_time = time.time()
         doc.add_extra_field("order_number", ("obj", __name__, "OrderNumber"))
@@ -243,9 +234,8 @@ class ExtractOrderNumber:
         doc.order_number, line = None, None
         line_str, order_type, order_number, order_date = None, None, None, None
         order_line_number = None
-        tried_first_page = False
 
-        if len(doc.pages) > 1 and not is_full_line(doc.pages[1].lines[0], doc.pages[1]): # and len(doc.pages[1].paras) > 0:
+        if len(doc.pages) > 1 and not get_page_geometry(doc.pages[1]).is_full_line(0): # and len(doc.pages[1].paras) > 0:
             line = doc.pages[1].lines[0]
             line_str = line.raw_text().strip()
             order_type, order_number, order_date = self.order_number_parser.parse(line_str)
@@ -253,12 +243,10 @@ class ExtractOrderNumber:
 
         if order_number is None:
             page = doc.pages[0]
-            page_xmin = min((w.xmin for w in page.words), default=0.0)
-            page_xmax = max((w.xmax for w in page.words), default=1.0)
+            geometry = get_page_geometry(page)
 
-            to_parse = [(idx, ln) for (idx, ln) in enumerate(page.lines) if ln and (is_center_aligned2(ln) or is_center_gapped(ln) or is_right_aligned(ln) or is_center_aligned(ln))]
+            to_parse = [(idx, ln) for (idx, ln) in enumerate(page.lines) if ln and is_header_line(geometry, idx)]
 
-            tried_first_page = True
             #print(f'\tFound {len(to_parse)} lines')
             for (idx, line) in to_parse:
                 #print(f'\t=={idx} {line.raw_text()}')
@@ -270,6 +258,7 @@ class ExtractOrderNumber:
                         order_line_number = idx + 1
                         break
 
+        record_phase("header_detection", time.time() - start_time)
 
         if order_number is not None:
             order_type_en = self.order_type_parser.parse(order_type)
@@ -1,6 +1,5 @@
 import logging
 import re
-import sys
 import unicodedata
 from pathlib import Path
 from typing import List
@@ -13,6 +12,8 @@ from more_itertools import first, flatten
 from polyleven import levenshtein
 
 from ..extracts.orgpedia import Officer, Order, OrderDetail
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
 
 # from . import PostParser
 from .pdfpost_parser import PostEmptyRoleError, PostParser
@@ -105,12 +106,7 @@ class HindiOrderBuilder:
 
         self.post_parser = self.init_post_parser()
 
-        self.lgr = logging.getLogger(f"docint.pipeline.{self.conf_stub}")
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(f"docint.pipeline.{self.conf_stub}", logging.INFO)
 
         self.fixes_dict = {}
         # self.errors_dict = {}
@@ -118,16 +114,11 @@ class HindiOrderBuilder:
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def init_post_parser(self):
         hierarchy_files = {
@@ -345,7 +336,7 @@ class HindiOrderBuilder:
                 hi_post = Span.blank_text([stub_span], hi_post)
                 matched_span_stubs.append((stub_span, en_stub))
                 if hi_stub in hi_post:
-                    self.lgr.warning(f"Multiple matches of {hi_stub} in {orig_hi_post}")
+                    self.lgr.warning("Multiple matches of %s in %s", hi_stub, orig_hi_post)
 
         matched_spans = [tup[0] for tup in matched_span_stubs]
 
@@ -530,9 +521,10 @@ class HindiOrderBuilder:
                 for (row_idx, row) in enumerate(table.body_rows):
                     yield page_idx, table_idx, row_idx, row
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"hindi_order_builder: {doc.pdf_name}")
+        self.lgr.info("hindi_order_builder: %s", doc.pdf_name)
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
 
@@ -577,8 +569,8 @@ class HindiOrderBuilder:
                     new_errors.append(error)
             errors = new_errors
 
-        self.lgr.info(f"=={doc.pdf_name}.hindi_order_builder {len(details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==%s.hindi_order_builder %s %s", doc.pdf_name, len(details), DataError.error_counts(errors))
+        [self.lgr.info("%s", e) for e in errors]
 
         # TODO NOT WRITING FIXES
         # self.write_fixes(doc, errors)
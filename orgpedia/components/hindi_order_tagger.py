@@ -1,6 +1,4 @@
-import logging
 import re
-import sys
 import unicodedata
 from pathlib import Path
 
@@ -21,6 +19,8 @@ from orgpedia.components.hindi_order_builder import (
 from orgpedia.components.pdfpost_parser import PostParser
 
 from ..extracts.orgpedia import Officer, Order, OrderDetail
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
 
 PassthroughStr = ".,()-/123456789:"
 PasssthroughList = [
@@ -80,12 +80,7 @@ class HindiOrderTagger:
 
         self.post_parser = self.init_post_parser()
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.fixes_dict = {}
 
     def init_post_parser(self):
@@ -107,16 +102,11 @@ class HindiOrderTagger:
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def fix_hi_name(self, hi_text):
         hi_name = (
@@ -313,7 +303,7 @@ class HindiOrderTagger:
                 hi_post = Span.blank_text([stub_span], hi_post)
                 matched_span_stubs.append((stub_span, en_stub))
                 if hi_stub in hi_post:
-                    self.lgr.warning(f"Multiple matches of {hi_stub} in {orig_hi_post}")
+                    self.lgr.warning("Multiple matches of %s in %s", hi_stub, orig_hi_post)
 
         matched_spans = [tup[0] for tup in matched_span_stubs]
 
@@ -378,9 +368,10 @@ class HindiOrderTagger:
         )
         return detail
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"manual_tagger: {doc.pdf_name}")
+        self.lgr.info("manual_tagger: %s", doc.pdf_name)
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
         conf_order = doc_config.get("order", None)
@@ -428,10 +419,10 @@ class HindiOrderTagger:
 
         if "order_date" in conf_order:
             order_date, _ = find_date(conf_order["order_date"])
-            self.lgr.info(f"order_tagger: Date: {order_date}")
+            self.lgr.info("order_tagger: Date: %s", order_date)
             doc.order.date = order_date
 
-        self.lgr.info(f"=={doc.pdf_name}.order_tagger {len(doc.order.details)}")
+        self.lgr.info("==%s.order_tagger %s", doc.pdf_name, len(doc.order.details))
         self.remove_log_handler(doc)
         return doc
 
@@ -1,5 +1,3 @@
-import logging
-import sys
 from pathlib import Path
 
 from docint.data_error import DataError
@@ -7,6 +5,9 @@ from docint.vision import Vision
 from polyleven import levenshtein
 
 from ..extracts.orgpedia import OfficerID, OfficerIDNotFoundError
+from ..tools.date_match import BirthDates
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed, timed_phase
 
 
 # b /Users/mukund/Software/docInt/docint/pipeline/id_assigner_fields.py:34
@@ -42,14 +43,17 @@ class IDAssignerMultipleFields:
         self.cadre_names_dict = {}
 
         self.cadre_names_dict2 = {}
+        self.cadre_name_idxs_dict = {}
         self.cadre_birth_date_dict = {}
+        self.cadre_birth_dates = {}
 
         for cadre, cadre_file in cadre_file_dict.items():
             print(f"{cadre}: {cadre_file}")
             officers = OfficerID.from_disk(cadre_file)
             officers_dict, names_dict, names2_dict, birth_date_dict = {}, {}, {}, {}
+            name_idxs_dict = {}
             duplicate_names, duplicate_officer_ids = set(), set()
-            for o in officers:
+            for o_idx, o in enumerate(officers):
                 if o.officer_id == "RR19861046":
                     print("Found It")
 
@@ -68,6 +72,7 @@ class IDAssignerMultipleFields:
 
                 # Approach 2
                 [names2_dict.setdefault(n, []).append(o) for n in names_nows]
+                [name_idxs_dict.setdefault(n, []).append(o_idx) for n in names_nows]
                 if o.birth_date is not None:
                     birth_date_dict.setdefault(o.birth_date, []).append(o)
 
@@ -77,28 +82,20 @@ class IDAssignerMultipleFields:
             self.cadre_officers_dict[cadre] = officers_dict
             print(f"Duplicates: {cadre}: {len(duplicate_officer_ids)} {duplicate_names}")
             self.cadre_names_dict2[cadre] = names2_dict
+            self.cadre_name_idxs_dict[cadre] = name_idxs_dict
             self.cadre_birth_date_dict[cadre] = birth_date_dict
+            self.cadre_birth_dates[cadre] = BirthDates(o.birth_date for o in officers)
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_post_id(self, post, path):
         post_id_fields = post.fields if not self.post_id_fields else self.post_id_fields
@@ -130,19 +127,16 @@ class IDAssignerMultipleFields:
                     return officer_id
         return None
 
+    @timed_phase("levenshtein_search")
     def search_officer_id2(self, officer, name_nows, cutoff):  # noqa: C901
-        def inv_equal(d1, d2):
-            return d1.year == d2.year and d1.month == d2.day and d1.day == d2.month
-
-        def leven_equal(d1, d2):
-            date_cutoff = 1
-            return levenshtein(str(d1), str(d2), date_cutoff) <= date_cutoff
-
-        def get_date_officer_id(mat_officers, dob):
+        def get_date_officer_id(o_name_nows):
             def details(o):
                 return f"{o.name}-{o.birth_date}"
 
-            ex_mat_officers = [o for o in mat_officers if o.birth_date.__eq__(dob)]
+            mat_officers = names_dict.get(o_name_nows, [])
+            mat_idxs = name_idxs_dict.get(o_name_nows, [])
+
+            ex_mat_officers = [o for o, i in zip(mat_officers, mat_idxs) if exact_dates[i]]
             assert len(ex_mat_officers) in (
                 0,
                 1,
@@ -150,7 +144,7 @@ class IDAssignerMultipleFields:
             if len(ex_mat_officers) == 1:
                 return ex_mat_officers[0].officer_id
 
-            inv_mat_officers = [o for o in mat_officers if inv_equal(o.birth_date, dob)]
+            inv_mat_officers = [o for o, i in zip(mat_officers, mat_idxs) if inv_dates[i]]
             assert len(inv_mat_officers) in (
                 0,
                 1,
@@ -158,7 +152,7 @@ class IDAssignerMultipleFields:
             if len(inv_mat_officers) == 1:
                 return inv_mat_officers[0].officer_id
 
-            lev_mat_officers = [o for o in mat_officers if leven_equal(o.birth_date, dob)]
+            lev_mat_officers = [o for o, i in zip(mat_officers, mat_idxs) if lev_dates[i]]
             assert len(lev_mat_officers) in (
                 0,
                 1,
@@ -179,12 +173,12 @@ class IDAssignerMultipleFields:
 
             set_nd_officer_ids = set(nd_officer_ids)
             if len(set_nd_officer_ids) == 1:
-                self.lgr.info(f"Found-nodate: {name_nows} -> {nd_names[0]}")
+                self.lgr.info("Found-nodate: %s -> %s", name_nows, nd_names[0])
                 return list(set_nd_officer_ids)[0]
 
             elif len(set_nd_officer_ids) == 2 and len(nd_names) == 2:
                 sel_officer_ids, sel_names = [], []
-                self.lgr.info(f"Searching Select {name_nows}")
+                self.lgr.info("Searching Select %s", name_nows)
 
                 for (nd_officer_id, nd_name) in zip(nd_officer_ids, nd_names):
                     if levenshtein(nd_name, name_nows, 1) <= 1:
@@ -193,16 +187,16 @@ class IDAssignerMultipleFields:
 
                 set_sel_officer_ids = set(sel_officer_ids)
                 if len(set_sel_officer_ids) == 1:
-                    self.lgr.info(f"Found-nodate-sel1: {name_nows} -> {sel_names[0]}")
+                    self.lgr.info("Found-nodate-sel1: %s -> %s", name_nows, sel_names[0])
                     return list(set_sel_officer_ids)[0]
                 else:
                     names = ", ".join(nd_names)
-                    self.lgr.info(f"\tUNMATCHED-nodate: {name_nows} -> [{len(set_nd_officer_ids)}]{names}]")
+                    self.lgr.info("\tUNMATCHED-nodate: %s -> [%s]%s]", name_nows, len(set_nd_officer_ids), names)
             elif len(set_nd_officer_ids) > 2:
                 names = ", ".join(nd_names)
-                self.lgr.info(f"\tUNMATCHED-nodate: {name_nows} -> [{len(set_nd_officer_ids)}]{names}]")
+                self.lgr.info("\tUNMATCHED-nodate: %s -> [%s]%s]", name_nows, len(set_nd_officer_ids), names)
             else:
-                self.lgr.info(f"\tUNMATCHED-nodate: {name_nows} -> no match")
+                self.lgr.info("\tUNMATCHED-nodate: %s -> no match", name_nows)
             return None
 
         dob, cadre = officer.birth_date, officer.cadre
@@ -211,32 +205,36 @@ class IDAssignerMultipleFields:
         if dob is None:
             return get_nodate_officer_id(name_nows)
 
-        mat_officers = names_dict.get(name_nows, [])
+        # date matches against every officer in the cadre, officers without a birth date
+        # match exactly as o.birth_date.__eq__(dob) used to return NotImplemented for them.
+        birth_dates, name_idxs_dict = self.cadre_birth_dates[cadre], self.cadre_name_idxs_dict[cadre]
+        exact_dates = birth_dates.exact(dob) | birth_dates.missing
+        inv_dates, lev_dates = birth_dates.inverted(dob), birth_dates.one_digit(dob)
 
-        officer_id = get_date_officer_id(mat_officers, dob)
+        officer_id = get_date_officer_id(name_nows)
         if officer_id:
-            self.lgr.info(f"Found: {officer.name} -> {officer_id}")
+            self.lgr.info("Found: %s -> %s", officer.name, officer_id)
             return officer_id
 
         unmatched = []
         for o_name_nows, mat_officers in names_dict.items():
             if levenshtein(o_name_nows, name_nows) <= cutoff:
-                officer_id = get_date_officer_id(mat_officers, dob)
+                officer_id = get_date_officer_id(o_name_nows)
                 if officer_id:
-                    self.lgr.info(f"Found-Sim: {officer.name} -> {officer_id} {o_name_nows}")
+                    self.lgr.info("Found-Sim: %s -> %s %s", officer.name, officer_id, o_name_nows)
                     return officer_id
                 else:
                     dobs = ", ".join(f"{o.birth_date}" for o in mat_officers)
-                    self.lgr.info(f"\tUNMATCHED-sim: {officer.name}({dob}) -> {o_name_nows}({dobs})")
+                    self.lgr.info("\tUNMATCHED-sim: %s(%s) -> %s(%s)", officer.name, dob, o_name_nows, dobs)
                     if len(mat_officers) == 1:
                         unmatched.append((mat_officers[0].officer_id, dobs, o_name_nows))
         if len(unmatched) == 1:
             officer_id, u_dob, u_name = unmatched[0]
             if levenshtein(f"{dob}", u_dob) == 1:
-                self.lgr.info(f"Found-date: {officer.name} -> {officer_id} {u_name} ({dob} = {u_dob})")
+                self.lgr.info("Found-date: %s -> %s %s (%s = %s)", officer.name, officer_id, u_name, dob, u_dob)
                 return officer_id
 
-        self.lgr.info(f"UNMATCHED: {officer.name}({dob})")
+        self.lgr.info("UNMATCHED: %s(%s)", officer.name, dob)
         return None
 
     def get_officer_id(self, doc, officer, path):
@@ -267,9 +265,10 @@ class IDAssignerMultipleFields:
 
         return officer_id, errors
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"id_assigner: {doc.pdf_name}")
+        self.lgr.info("id_assigner: %s", doc.pdf_name)
 
         errors = []
         for detail in doc.order.details:
@@ -283,7 +282,7 @@ class IDAssignerMultipleFields:
                 post.post_id = post_id if post_id else post.post_id
                 errors.extend(post_errors)
 
-        self.lgr.info(f"=={doc.pdf_name}.id_assigner {len(doc.order.details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==%s.id_assigner %s %s", doc.pdf_name, len(doc.order.details), DataError.error_counts(errors))
+        [self.lgr.info("%s", e) for e in errors]
         self.remove_log_handler(doc)
         return doc
@@ -1,17 +1,15 @@
-import datetime
-import logging
-import sys
 from pathlib import Path
 
-from dateutil import parser
 from docint.data_error import DataError
 from docint.region import Region
 from docint.util import load_config, read_config_from_disk
 from docint.vision import Vision
-from docint.vocab import Vocab
-from more_itertools import first
 
 from ..extracts.orgpedia import OfficerID, OfficerIDNotFoundError
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.name_index import NameIndex, NameSuggestions
+from ..tools.timeline import RoleTimelines
+from ..tools.timing import timed
 
 # b /Users/mukund/Software/docInt/docint/pipeline/id_assigner.py:34
 
@@ -45,9 +43,10 @@ class OfficerIDInfo(Region):
         "cadre_file_dict": {},
         "post_id_fields": [],
         "tenure_name_file": "prime_minister_tenures.yml",
+        "special_roles": {"pm": ["Prime Minister", "P. M.", "P.M"]},
     },
 )
-class IDAssignerVocab:
+class IDAssignerVocab(NameSuggestions):
     def __init__(
         self,
         conf_dir,
@@ -56,13 +55,15 @@ class IDAssignerVocab:
         cadre_file_dict,
         post_id_fields,
         tenure_name_file,
+        special_roles,
     ):
         self.conf_dir = Path(conf_dir)
         self.conf_stub = Path(conf_stub)
         self.pre_edit = pre_edit
         self.post_id_fields = post_id_fields
         self.cadre_names_dict = {}
-        self.cadre_names_vocab = {}
+        self.cadre_name_index = {}
+        self.cadre_suggestions_dict = {}
         self.officerID_dict = {}
 
         for cadre, cadre_file in cadre_file_dict.items():
@@ -75,7 +76,8 @@ class IDAssignerVocab:
 
                 self.officerID_dict[o.officer_id] = o
             self.cadre_names_dict[cadre] = names_dict
-            self.cadre_names_vocab[cadre] = Vocab(names_dict.keys())
+            self.cadre_name_index[cadre] = NameIndex(names_dict.keys())
+            self.cadre_suggestions_dict[cadre] = {}
 
             # dictionary_file = self.conf_dir / f"{cadre}.dict"
             # if not dictionary_file.exists():
@@ -83,44 +85,24 @@ class IDAssignerVocab:
 
             # self.cadre_names_dictionary[cadre] = request_pwl_dict(str(dictionary_file))
 
+        # special_roles maps a field of the tenures in tenure_name_file to the names that refer to it
         tenure_name_path = self.conf_dir / tenure_name_file
-        self.tenure_name_dict = self.load_tenure_name(tenure_name_path)
-        special_roles = ["Prime Minister", "P. M.", "P.M"]
-        self.special_roles = [n.replace(" ", "").strip().lower() for n in special_roles]
-
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
-
-    def load_tenure_name(self, tenures_file):
-        tenure_file_dict = read_config_from_disk(tenures_file)
-        tenure_name_dict = {}
-        for tenure in tenure_file_dict.get("ministries", []):
-            # s, e = tenure["start"], tenure["end"]
-            s, e = tenure["start_date"], tenure["end_date"]
-            sDate = parser.parse(s).date()
-            # eDate = parser.parse(e).date() if e != "current" else datetime.date.today()
-            eDate = parser.parse(e).date() if e != "today" else datetime.date.today()
-            # tenure_name_dict[(sDate, eDate)] = tenure["name"]
-            tenure_name_dict[(sDate, eDate)] = tenure.get("pm")
-        return tenure_name_dict
+        tenures = read_config_from_disk(tenure_name_path).get("ministries", [])
+        self.role_timelines = RoleTimelines(tenures, list(special_roles))
+        self.special_role_dict = {}
+        for (role_field, role_names) in special_roles.items():
+            [self.special_role_dict.setdefault(n.replace(" ", "").strip().lower(), role_field) for n in role_names]
+
+        self.lgr = get_logger(__name__)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_post_id(self, post, path):
         post_id_fields = post.fields if not self.post_id_fields else self.post_id_fields
@@ -132,34 +114,14 @@ class IDAssignerVocab:
         return ",".join(field_ids), []
 
     def get_officer_id(self, doc, officer, path):
-        def fix_name(name):
-            assert name.isascii()
-            name.strip(" .-")
-            name_nows = name.replace(" ", "").lower()
-            return name_nows
-
-        def get_role_name(order_date):
-            for (s, e), name in self.tenure_name_dict.items():
-                if s < order_date < e:  # the tenures are overlapping on last day
-                    return name
-            return None
-
-        name = officer.name
-        name_nows = fix_name(name)
+        name, name_nows = self.get_name_nows(doc, officer)
         if not name_nows:
             return None, []
 
-        min_name = name_nows.replace("the", "")
-        if any(r == min_name for r in self.special_roles):
-            name = get_role_name(doc.order.date)
-            name_nows = fix_name(name)
-
         names_dict = self.cadre_names_dict[officer.cadre]
         officer_id = names_dict.get(name_nows, None)
         if not officer_id:
-            names_vocab = self.cadre_names_vocab[officer.cadre]
-            suggestions = names_vocab.find_texts(name_nows, dist_cutoff=3)
-            suggestion, _ = first(suggestions, (None, None))
+            suggestion = self.get_suggestion(officer.cadre, name_nows)
             officer_id = names_dict.get(suggestion, None)
 
         errors = []
@@ -170,9 +132,10 @@ class IDAssignerVocab:
 
         return officer_id, errors
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"id_assigner: {doc.pdf_name}")
+        self.lgr.info("id_assigner: %s", doc.pdf_name)
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
         conf_officer_ids = doc_config.get("officer_ids", {})
@@ -182,12 +145,13 @@ class IDAssignerVocab:
 
         doc.officerIDs = []
 
+        self.add_suggestions(doc, conf_officer_ids)
         for detail in doc.order.details:
             officer = detail.officer
             method = 'computed'
             if detail.detail_idx in conf_officer_ids:
                 officer.officer_id = conf_officer_ids[detail.detail_idx]
-                self.lgr.info(f'** Setting officer_id: {officer.officer_id} {officer.name}')
+                self.lgr.info("** Setting officer_id: %s %s", officer.officer_id, officer.name)
                 officer_errors = []
                 method = 'manual'
 
@@ -226,10 +190,10 @@ class IDAssignerVocab:
                 post.post_id = post_id if post_id else post.post_id
                 errors.extend(post_errors)
 
-            self.lgr.debug(detail.to_id_str())
+            self.lgr.debug("%s", LazyStr(detail.to_id_str))
 
         doc.add_errors(errors)
-        self.lgr.info(f"=={doc.pdf_name}.id_assigner {len(doc.order.details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==%s.id_assigner %s %s", doc.pdf_name, len(doc.order.details), DataError.error_counts(errors))
+        [self.lgr.info("%s", e) for e in errors]
         self.remove_log_handler(doc)
         return doc
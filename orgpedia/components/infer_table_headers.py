@@ -2,11 +2,14 @@ from operator import attrgetter
 from pathlib import Path
 from typing import List
 
-from docint.hierarchy import Hierarchy, MatchOptions
+from docint.hierarchy import MatchOptions
 from docint.util import load_config
 from docint.vision import Vision
 from pydantic import BaseModel
 
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.timing import timed
+
 
 class TableHeaderInfo(BaseModel):
     header_types: List[str]
@@ -48,7 +51,7 @@ class InferTableHeaders:
         self.conf_dir = Path(conf_dir)
         self.conf_stub = conf_stub
         type_file_path = self.conf_dir / type_file
-        self.type_hierarchy = Hierarchy(type_file_path)
+        self.type_hierarchy = load_hierarchy(type_file_path)
         self.match_options = MatchOptions(ignore_case=True, allow_overlap=True)
 
     def get_header_info(self, header_rows, page_idx, table_idx):
@@ -76,6 +79,7 @@ class InferTableHeaders:
 
         return TableHeaderInfo.build(header_rows[0], header_types, page_idx, table_idx)
 
+    @timed
     def __call__(self, doc):
         doc.add_extra_page_field("table_header_infos", ("list", __name__, 'TableHeaderInfo'))
         last_table_header_info = None
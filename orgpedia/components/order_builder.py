@@ -1,7 +1,5 @@
 import calendar
-import logging
 import string
-import sys
 from collections import Counter
 from pathlib import Path
 
@@ -19,6 +17,8 @@ from ..extracts.orgpedia import (
     OrderDateNotFoundError,
     OrderDetail,
 )
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timing import timed
 
 """
 # TODO:
@@ -152,27 +152,17 @@ class OrderBuilder:
         self.month_names = list(calendar.month_name) + list(calendar.month_abbr)
         self.month_names = [m.lower() for m in self.month_names]
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.fixes_dict = {}
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_salut(self, name):
         short = "capt-col-dr.(smt.)-dr. (smt.)-dr. (shrimati)-dr-general (retd.)-general-km-kum-kumari-maj. gen. (retd.)-maj-miss-ms-prof. (dr.)-prof-sadhvi-sardar-shri-shrimati-shrinati-shrl-shrt-shr-smt-sushree-sushri"
@@ -349,21 +339,22 @@ class OrderBuilder:
         # if not ('minis' in u_texts_str or 'depa' in u_texts_str):
         #     return []
 
-        self.lgr.debug(list_item.orig_text())
-        self.lgr.debug(f'{"edits":13}: {edit_str}')
-        self.lgr.debug(f'{"person":13}: {person_str}')
-        self.lgr.debug(str(post_info))
+        self.lgr.debug("%s", LazyStr(list_item.orig_text))
+        self.lgr.debug("%-13s: %s", "edits", edit_str)
+        self.lgr.debug("%-13s: %s", "person", person_str)
+        self.lgr.debug("%s", post_info)
         if errors:
             self.lgr.debug("Error")
             # list_item.print_color_idx(self.color_config, width=150)
             for e in errors:
-                self.lgr.debug(f"\t{str(e)}")
+                self.lgr.debug("\t%s", e)
         self.lgr.debug("------------------------")
         return errors
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"order_builder: {doc.pdf_name}")
+        self.lgr.info("order_builder: %s", doc.pdf_name)
         doc.add_extra_field("order", ("obj", "orgpedia.extracts.orgpedia", "Order"))
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
@@ -383,7 +374,7 @@ class OrderBuilder:
         # order_number = self.get_order_number(doc)
         errors.extend(date_errors)
 
-        self.lgr.debug(f"*** order_date:{order_date}")
+        self.lgr.debug("*** order_date:%s", order_date)
         # self.lgr.debug(f'*** order_number:{doc.order_number}')
 
         for page in doc.pages:
@@ -395,7 +386,7 @@ class OrderBuilder:
                 if post_info.is_valid:
                     order_detail = self.build_detail(list_item, post_info, detail_idx)
                     if order_detail:
-                        self.lgr.debug(order_detail.to_str())
+                        self.lgr.debug("%s", LazyStr(order_detail.to_str))
                         print(order_detail.to_str())
                         order_details.append(order_detail)
                         detail_idx += 1
@@ -412,8 +403,8 @@ class OrderBuilder:
 
         # self.write_fixes(doc, errors)
 
-        self.lgr.info(f"=={doc.pdf_name}.order_builder {len(doc.order.details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==%s.order_builder %s %s", doc.pdf_name, len(doc.order.details), DataError.error_counts(errors))
+        [self.lgr.info("%s", e) for e in errors]
         self.remove_log_handler(doc)
         return doc
 
@@ -1,5 +1,3 @@
-import logging
-import sys
 from pathlib import Path
 
 from docint.hierarchy import Hierarchy, MatchOptions
@@ -18,6 +16,9 @@ from ..extracts.orgpedia import (
     OrderDetail,
     Post,
 )
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timing import timed
 
 
 @Vision.factory(
@@ -40,31 +41,21 @@ class OrderTagger:
         self.hierarchy_dict = {}
         for field, file_name in self.hierarchy_files.items():
             hierarchy_path = self.conf_dir / file_name
-            hierarchy = Hierarchy(hierarchy_path)
+            hierarchy = load_hierarchy(hierarchy_path)
             self.hierarchy_dict[field] = hierarchy
         self.match_options = MatchOptions(ignore_case=True)
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.fixes_dict = {}
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_order_date(self, doc):
         od_labels = doc.pages[0].word_labels.get("ORDERDATEPLACE", [])
@@ -125,7 +116,7 @@ class OrderTagger:
         officer_text = " ".join(w.text for w in words)
         officer_text = officer_text.strip(".|,-*@():%/1234567890$ '")
 
-        self.lgr.info(f"Building Officer on: >{officer_text}<")
+        self.lgr.info("Building Officer on: >%s<", officer_text)
 
         salut = self.get_salut(officer_text)
         name = officer_text[len(salut) :].strip()  # noqa: E203
@@ -136,14 +127,14 @@ class OrderTagger:
         words = [page.words[idx] for idx in conf_post["idxs"]]
         post_text = " ".join(w.text for w in words)
 
-        self.lgr.info(f"Building Post on: >{post_text}<")
+        self.lgr.info("Building Post on: >%s<", post_text)
 
         dept_sgs = self.hierarchy_dict["dept"].find_match(post_text, self.match_options)
-        self.lgr.debug(f"dept: {Hierarchy.to_str(dept_sgs)}")
+        self.lgr.debug("dept: %s", LazyStr(Hierarchy.to_str, dept_sgs))
 
         b_post_text = SpanGroup.blank_text(dept_sgs, post_text)
         role_sgs = self.hierarchy_dict["role"].find_match(b_post_text, self.match_options)
-        self.lgr.debug(f"role: {Hierarchy.to_str(role_sgs)}")
+        self.lgr.debug("role: %s", LazyStr(Hierarchy.to_str, role_sgs))
 
         assert len(dept_sgs) == 1 and len(role_sgs) in (0, 1)
         role_sg = role_sgs[0] if role_sgs else None
@@ -201,9 +192,10 @@ class OrderTagger:
         )
         return detail
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"manual_tagger: {doc.pdf_name}")
+        self.lgr.info("manual_tagger: %s", doc.pdf_name)
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
         conf_order = doc_config.get("order", None)
@@ -255,10 +247,10 @@ class OrderTagger:
 
         if "order_date" in conf_order:
             order_date, _ = find_date(conf_order["order_date"])
-            self.lgr.info(f"order_tagger: Date: {order_date}")
+            self.lgr.info("order_tagger: Date: %s", order_date)
         else:
             order_date, date_errors = self.get_order_date(doc)
-            self.lgr.info(f"order_tagger: Date: {order_date}")
+            self.lgr.info("order_tagger: Date: %s", order_date)
 
         if mode == "build":
             doc.order = Order.build(doc.pdf_name, order_date, doc.pdffile_path, details)
@@ -268,7 +260,7 @@ class OrderTagger:
 
         doc.add_errors([])
 
-        self.lgr.info(f"=={doc.pdf_name}.order_tagger {len(doc.order.details)}")
+        self.lgr.info("==%s.order_tagger %s", doc.pdf_name, len(doc.order.details))
         self.remove_log_handler(doc)
         return doc
 
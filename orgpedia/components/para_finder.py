@@ -1,11 +1,14 @@
 import json
+from bisect import bisect_right
 from pathlib import Path
 from operator import attrgetter
 
 from docint.region import Region
 from docint.para import Para
 from docint.vision import Vision
-from more_itertools import first
+
+from ..tools.page_geometry import get_page_geometry
+from ..tools.timing import timed
 
 
 def build_para(page, para_lines):
@@ -28,6 +31,27 @@ def build_para(page, para_lines):
     )
 
 
+def build_table_index(tables):
+    """Table idxs sorted by ymin, with their ymins and the running max of their ymaxs."""
+    sorted_idxs = sorted(range(len(tables)), key=lambda i: tables[i].box.ymin)
+    ymins = [tables[i].box.ymin for i in sorted_idxs]
+
+    reach_ymaxs, reach_ymax = [], float("-inf")
+    for i in sorted_idxs:
+        reach_ymax = max(reach_ymax, tables[i].box.ymax)
+        reach_ymaxs.append(reach_ymax)
+    return sorted_idxs, ymins, reach_ymaxs
+
+
+def find_table_idx(tables, table_index, line):
+    """Return the first table that y_subsumes the line, only tables starting above the line are tested."""
+    sorted_idxs, ymins, reach_ymaxs = table_index
+    pos = bisect_right(ymins, line.ymin)
+    if pos == 0 or reach_ymaxs[pos - 1] < line.ymax:
+        return None
+    return min((i for i in sorted_idxs[:pos] if tables[i].box.y_subsumes(line)), default=None)
+
+
 @Vision.factory(
     "para_finder",
     default_config={
@@ -43,36 +67,13 @@ class ParaFinder:
         self.write_output = write_output
         self.output_dir = Path(output_dir)
 
+    @timed
     def __call__(self, doc):
-        def has_period(line):
-            return (not line) or line.raw_text().strip().endswith(".")
-
-        def in_table(page, line):
-            if not page.tables:
-                return False
-
-            # if line.words[0].text == '|':
-            #     new_line = Region.from_words(line.words[1:])
-            # else:
-            new_line = line
-
-            return any(t.box.y_subsumes(new_line) for t in page.tables)
-
-        def in_table_idx(page, line):
-            # if line.words[0].text == '|':
-            #     new_line = Region.from_words(line.words[1:])
-            # else:
-            new_line = line
-
-            return first((i for (i, t) in enumerate(page.tables) if t.box.y_subsumes(new_line)), None)
-
-        def is_center_aligned(line):
-            padding = 0.1
-            return (l_xmin + padding) < line.xmin < line.xmax < (l_xmax - padding)
+        def has_period(line_raw_str):
+            return line_raw_str.endswith(".")
 
-        def is_last_line(line):
-            line_str = line.raw_text().strip()
-            return "www.maharashtra.gov.in" in line_str
+        def is_last_line(line_raw_str):
+            return "www.maharashtra.gov.in" in line_raw_str
 
         doc.add_extra_page_field("paras", ("list", "docint.para", "Para"))
         doc.add_extra_page_field("table_para_idxs", ("noparse", "", ""))
@@ -88,8 +89,8 @@ class ParaFinder:
                 continue
 
             table_para_idxs_set = set()
-            l_xmin = min((w.xmin for w in page.words), default=0.0)
-            l_xmax = max((w.xmax for w in page.words), default=1.0)
+            table_index = build_table_index(page.tables)
+            geometry = get_page_geometry(page)
 
             last_line_ymax = 1.2 # keeping some bufffer
 
@@ -97,29 +98,29 @@ class ParaFinder:
 
             for (line_idx, line) in enumerate(page.lines):
                 #print(f'{line_idx}:', end=" ")
-                if (not line) or (not line.arranged_text().strip()) or (line.arranged_text().strip() == "|"):
+                line_str = line.arranged_text().strip() if line else ""
+                if (not line_str) or (line_str == "|"):
                     #print("empty line", end=" ")
                     if para_lines:
                         #print("build_para", end=" ")
                         page.paras.append(build_para(page, para_lines))
                         para_lines.clear()
 
-                elif in_table(page, line):
+                elif (table_idx := find_table_idx(page.tables, table_index, line)) is not None:
                     #print("in table", end=" ")
                     if para_lines:
                         page.paras.append(build_para(page, para_lines))
                         para_lines.clear()
 
-                    table_idx = in_table_idx(page, line)
                     #print(f'[{line_idx}] ADDING: table_idx: {table_idx}, {len(page.paras)} >{line.arranged_text()[:10]}...<', end=" ")
                     table_para_idxs_set.add((table_idx, len(page.paras)))
-                elif has_period(line) or is_center_aligned(line):
+                elif has_period(line_raw_str := line.raw_text().strip()) or geometry.is_center_aligned(line_idx):
                     #print(f"has period|center_aligned >{line.arranged_text()[:15]}...<", end=" ")
                     para_lines.append(line)
                     page.paras.append(build_para(page, para_lines))
                     para_lines.clear()
 
-                elif is_last_line(line):
+                elif is_last_line(line_raw_str):
                     #print(" LAST LINE", end=" ")
                     last_line_seen = True
                     last_line_ymax = line.ymax
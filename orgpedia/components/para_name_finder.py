@@ -1,11 +1,12 @@
 import logging
 import string
-import sys
 from pathlib import Path
 
 from ..data_error import DataError
 from ..para import TextConfig
 from ..span import Span
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
 from ..util import get_full_path, load_config
 from ..vision import Vision
 
@@ -53,27 +54,16 @@ class ParaNameFinder:
         self.model_dir = get_full_path(model_dir)
         self.ner_model_name = ner_model_name
 
-        self.lgr = logging.getLogger(f"docint.pipeline.{self.conf_stub}")
-        self.lgr.setLevel(logging.DEBUG)
-
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(f"docint.pipeline.{self.conf_stub}", logging.INFO)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def mark_manual_words(self, list_item):
         if list_item.get_spans("officer"):
@@ -87,7 +77,7 @@ class ParaNameFinder:
             start = line_text.lower().index(d_name)
             end = start + len(d_name)
             list_item.add_label(Span(start=start, end=end), "officer", ignore_config)
-            self.lgr.debug(f"OFFICER {line_text[start:end]}")
+            self.lgr.debug("OFFICER %s", line_text[start:end])
             return 1
         else:
             return 0
@@ -99,7 +89,7 @@ class ParaNameFinder:
                 old_name = s.span_str(line_text)
                 s.end = line_text.index(" ", s.end)
                 new_name = s.span_str(line_text)
-                self.lgr.debug(f"NameExpansion: {old_name}->{new_name}")
+                self.lgr.debug("NameExpansion: %s->%s", old_name, new_name)
             return s
 
         def to_span(ner_result):
@@ -124,9 +114,10 @@ class ParaNameFinder:
 
         list_item.add_label(officer_spans, "officer", ignore_config)
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"word_fixer: {doc.pdf_name}")
+        self.lgr.info("word_fixer: %s", doc.pdf_name)
 
         doc_config = load_config(self.conf_dir, doc.pdf_name, self.conf_stub)
         if doc_config.edits:
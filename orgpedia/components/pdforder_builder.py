@@ -1,5 +1,4 @@
 import logging
-import sys
 from pathlib import Path
 
 from docint.data_error import DataError
@@ -7,6 +6,8 @@ from docint.util import find_date
 from docint.vision import Vision
 
 from ..extracts.orgpedia import Officer, Order, OrderDetail
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
 
 
 @Vision.factory(
@@ -58,20 +59,16 @@ class InferHeaders:
         self.pre_edit = pre_edit
         self.header_dict = header_dict
 
-        self.lgr = logging.getLogger(f"docint.pipeline.{self.conf_stub}")
-        self.lgr.setLevel(logging.DEBUG)
-
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
+        self.lgr = get_logger(f"docint.pipeline.{self.conf_stub}", logging.INFO)
 
+    @timed
     def __call__(self, doc):
-        self.lgr.info(f"Processing {doc.pdf_name}")
+        self.lgr.info("Processing %s", doc.pdf_name)
         try:
             header_row = doc.pages[0].tables[0].header_rows[0]
             cells = header_row.cells
         except Exception as e:  # noqa: F841
-            self.lgr.info(f"\t{doc.pdf_name} Empty Header Row")
+            self.lgr.info("\t%s Empty Header Row", doc.pdf_name)
             assert False
             cells = []
 
@@ -88,7 +85,7 @@ class InferHeaders:
                 .replace("*", "")
             )
             if header_text not in self.header_dict:
-                self.lgr.info(f"\tNot Found: {doc.pdf_name} {cell_text}->{header_text}")
+                self.lgr.info("\tNot Found: %s %s->%s", doc.pdf_name, cell_text, header_text)
                 continue
             header_info.append(self.header_dict[header_text])
         doc.header_info = header_info
@@ -109,26 +106,16 @@ class PDFOrderBuilder:
         self.conf_stub = conf_stub
         self.pre_edit = pre_edit
 
-        self.lgr = logging.getLogger(f"docint.pipeline.{self.conf_stub}")
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(f"docint.pipeline.{self.conf_stub}", logging.INFO)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def test_officer(self, officer):
         return []
@@ -220,9 +207,10 @@ class PDFOrderBuilder:
             for (row_idx, row) in enumerate(page.tables[0].body_rows):
                 yield page, row, row_idx
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"pdf_order_builder: {doc.pdf_name}")
+        self.lgr.info("pdf_order_builder: %s", doc.pdf_name)
         # doc.add_extra_field("order_details", ("list", __name__, "OrderDetails"))
         doc.add_extra_field("order", ("obj", "orgpedia.extracts.orgpedia", "Order"))
 
@@ -242,7 +230,7 @@ class PDFOrderBuilder:
 
         doc.order = Order.build(doc.pdf_name, order_date, doc.pdffile_path, details)
         doc.order.category = "civil_list"
-        self.lgr.info(f"==Total:{len(errors)} {DataError.error_counts(errors)}")
+        self.lgr.info("==Total:%s %s", len(errors), DataError.error_counts(errors))
         self.remove_log_handler(doc)
         return doc
 
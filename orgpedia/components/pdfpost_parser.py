@@ -13,6 +13,10 @@ from docint.vision import Vision
 from more_itertools import first
 
 from ..extracts.orgpedia import Post
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.lru_cache import LRUCache
+from ..tools.timing import phase, timed
 
 
 class PostEmptyDeptAndJuriError(DataError):
@@ -41,10 +45,11 @@ class PostUnmatchedTextsError(DataError):
         "noparse_file": "post.noparse.yml",
         "ignore_labels": ["ignore"],
         "conf_stub": "postparser",
+        "post_cache_size": 4096,
     },
 )
 class PostParser:
-    def __init__(self, doc_confdir, hierarchy_files, noparse_file, ignore_labels, conf_stub):
+    def __init__(self, doc_confdir, hierarchy_files, noparse_file, ignore_labels, conf_stub, post_cache_size=4096):
         print(noparse_file)
         self.doc_confdir = Path(doc_confdir)
         self.hierarchy_files = hierarchy_files
@@ -55,33 +60,24 @@ class PostParser:
         self.hierarchy_dict = {}
         for field, file_name in self.hierarchy_files.items():
             hierarchy_path = self.doc_confdir / file_name
-            hierarchy = Hierarchy(hierarchy_path)
+            hierarchy = load_hierarchy(hierarchy_path)
             self.hierarchy_dict[field] = hierarchy
 
         self.noparse_dict = self.load_noparse(self.noparse_file)
+        self.post_cache = LRUCache(post_cache_size)
 
         self.text_config = TextConfig(rm_labels=self.ignore_labels)
         self.match_options = MatchOptions(ignore_case=True)
-        self.lgr = logging.getLogger(__name__ + ".")
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__ + ".")
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def _enable_hierarchy_logger(self):
         logging.getLogger("docint.hierarchy").addHandler(logging.StreamHandler(sys.stdout))
@@ -151,7 +147,7 @@ class PostParser:
                     for sg in sel_sgs:
                         print(f"\t{sg.new_str()} {sg.sum_match_len} {sg.sum_span_len} {sg.sum_span_len_start}")
 
-            self.lgr.debug(f"\tJuri: is_comm_role: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: is_comm_role: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             return sel_sgs
         elif is_dept_with_juri:
             label = dept_sg.get_label_val("_juri")
@@ -166,7 +162,7 @@ class PostParser:
                     if len(sel_sgs) > 1:
                         sel_sgs = HierarchySpanGroup.select_unique(sel_sgs)
 
-            self.lgr.debug(f"\tJuri: dept_has_juri_label: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: dept_has_juri_label: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             assert (
                 len(sel_sgs) <= 1
             ), f"label: {label} {len(sel_sgs)}  span_groups found, {post_str} {Hierarchy.to_str(sel_sgs)}"
@@ -195,7 +191,7 @@ class PostParser:
 
                     sel_sgs = sel_sgs[:1]
 
-            self.lgr.debug(f"\tJuri: sum_matching_len: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: sum_matching_len: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             assert len(sel_sgs) <= 1, f"{len(sel_sgs)}  span_groups found, {post_str} {Hierarchy.to_str(sel_sgs)}"
             return sel_sgs
 
@@ -236,16 +232,8 @@ class PostParser:
             errors.append(PostUnmatchedTextsError(msg=msg, path=post_path, texts=u_texts, name='PostUnmatchedTexts'))
         return errors
 
-    def parse(self, post_words, post_str, post_path, rank=None):
-        self.lgr.info(f">{post_str}")
-
-        if post_str in self.noparse_dict:
-            path_dict = self.noparse_dict[post_str]
-            post = Post.build_no_spans(post_words, post_str, **path_dict)
-            return post
-
+    def parse_fields(self, post_str, rank):
         field_dict = {}
-        post_str = post_str.replace("‐", "-")
         select_strategy_dict = {
             "dept": "connected_sum_span_len",
             # "role": "at_start",
@@ -266,7 +254,8 @@ class PostParser:
                 match_options.match_on_word_boundary = False
 
             try:
-                span_groups = hierarchy.find_match(post_str, match_options)
+                with phase("hierarchy_match"):
+                    span_groups = hierarchy.find_match(post_str, match_options)
             except AssertionError as e:  # noqa: F841
                 _, _, vtb = sys.exc_info()
                 field_dict[field] = span_groups = []
@@ -291,9 +280,24 @@ class PostParser:
                 field_dict["juri"] = sgs
 
             h_paths = [sg.hierarchy_path for sg in field_dict[field]]
-            self.lgr.info(f"{field}: {Hierarchy.to_str(field_dict[field])} {h_paths[:1]}")
+            self.lgr.info("%s: %s %s", field, LazyStr(Hierarchy.to_str, field_dict[field]), h_paths[:1])
 
-        field_dict = dict((k, first(v, None)) for k, v in field_dict.items())
+        return dict((k, first(v, None)) for k, v in field_dict.items())
+
+    def parse(self, post_words, post_str, post_path, rank=None):
+        self.lgr.info(">%s", post_str)
+
+        if post_str in self.noparse_dict:
+            path_dict = self.noparse_dict[post_str]
+            post = Post.build_no_spans(post_words, post_str, **path_dict)
+            return post
+
+        # the span groups depend only on the text, the words are bound in Post.build
+        post_str = post_str.replace("‐", "-")
+        cache_key = (post_str, rank)
+        if cache_key in self.post_cache:
+            self.lgr.info("\tcached parse: %s", cache_key)
+        field_dict = self.post_cache.get(cache_key, lambda: self.parse_fields(post_str, rank))
 
         if post_path == "p0.t0.r14.c4":
             # b /Users/mukund/Software/docInt/docint/pipeline/pdfpost_parser.py:282
@@ -321,9 +325,10 @@ class PostParser:
                 return rank
         return None
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"post_parser: {doc.pdf_name}")
+        self.lgr.info("post_parser: %s", doc.pdf_name)
 
         doc.add_extra_page_field("posts", ("list", "orgpedia.extracts.orgpedia", "Post"))
         header_info = doc.header_info
@@ -362,8 +367,9 @@ class PostParser:
             total_posts += len(page.posts)
 
         doc.add_errors(errors)
-        self.lgr.info(f"==Total:{total_posts} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info("==Total:%s %s", total_posts, DataError.error_counts(errors))
+        self.lgr.info("post cache: %s", self.post_cache.stats_str())
+        [self.lgr.info("%s", e) for e in errors]
 
         self.remove_log_handler(doc)
         return doc
@@ -1,5 +1,4 @@
 import logging
-import sys
 from pathlib import Path
 from textwrap import wrap
 from typing import List
@@ -11,6 +10,9 @@ from docint.region import Region
 from docint.vision import Vision
 
 from ..extracts.orgpedia import Post
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timing import phase, timed
 
 
 class PostEmptyError(DataError):
@@ -100,32 +102,22 @@ class PostParserOnSentence:
         self.hierarchy_dict = {}
         for field, file_name in self.hierarchy_files.items():
             hierarchy_path = self.doc_confdir / file_name
-            hierarchy = Hierarchy(hierarchy_path)
+            hierarchy = load_hierarchy(hierarchy_path)
             self.hierarchy_dict[field] = hierarchy
 
         self.match_options = MatchOptions(ignore_case=True)
         self.text_config = TextConfig(rm_labels=self.ignore_labels)
 
-        self.lgr = logging.getLogger(__name__ + ".")
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__ + ".", logging.INFO)
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def check_span_groups(self, posts_groups_dict, path):
         errors = []
@@ -233,17 +225,19 @@ class PostParserOnSentence:
 
         self.lgr.debug("SpanGroups:\n----------")
         for (field, hierarchy) in self.hierarchy_dict.items():
-            match_paths = hierarchy.find_match(post_str, self.match_options)
+            with phase("hierarchy_match"):
+                match_paths = hierarchy.find_match(post_str, self.match_options)
             match_paths_dict[field] = match_paths
-            self.lgr.debug(f"{field}: {Hierarchy.to_str(match_paths)}")
+            self.lgr.debug("%s: %s", field, LazyStr(Hierarchy.to_str, match_paths))
             # [self.lgr.debug(f"\t{str(mp)}") for mp in match_paths]
         # end for
         post_info = self.build_post_info(post_region, match_paths_dict, detail_idx)
         return post_info
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler(doc)
-        self.lgr.info(f"post_parser: {doc.pdf_name}")
+        self.lgr.info("post_parser: %s", doc.pdf_name)
 
         doc.add_extra_page_field("post_infos", ("list", __name__, "PostInfo"))
         for page in doc.pages:
@@ -253,7 +247,7 @@ class PostParserOnSentence:
             for postinfo_idx, list_item in enumerate(list_items):
                 # TODO Should we remove excess space and normalize it ? worthwhile...
                 post_str = list_item.line_text(self.text_config)
-                self.lgr.debug(f"{post_str}\nSpans:\n----------")
+                self.lgr.debug("%s\nSpans:\n----------", post_str)
                 self.lgr.debug(list_item.str_spans(indent="\t"))
                 post_info = self.parse(list_item, post_str, postinfo_idx)
                 doc.add_errors(post_info.errors)
@@ -29,6 +29,9 @@ from ..extracts.orgpedia import (
     OrderDetail,
     Post,
 )
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timing import timed
 
 
 @Vision.factory(
@@ -57,7 +60,7 @@ class TableOrderBuidler:
         self.hierarchy_dict = {}
         for field, file_name in self.hierarchy_files.items():
             hierarchy_path = self.conf_dir / file_name
-            hierarchy = Hierarchy(hierarchy_path)
+            hierarchy = load_hierarchy(hierarchy_path)
             self.hierarchy_dict[field] = hierarchy
         self.match_options = MatchOptions(ignore_case=True)
 
@@ -89,28 +92,18 @@ class TableOrderBuidler:
 
         self.missing_unicode_dict = {}
 
-        self.lgr = logging.getLogger(f"docint.pipeline.{self.conf_stub}")
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(f"docint.pipeline.{self.conf_stub}", logging.INFO)
 
         self.fixes_dict = {}
 
     def add_log_handler(self, doc):
         handler_name = f"{doc.pdf_name}.{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self, doc):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def add_missing_unicodes(self, missing):
         [self.missing_unicode_dict.setdefault(k, "missing") for k in missing]
@@ -207,7 +200,7 @@ class TableOrderBuidler:
                 continue
             else:
                 s, e = m.span()
-                self.lgr.debug(f"BLANKPAREN: {m.group(0)} ->[{s}: {e}]")
+                self.lgr.debug("BLANKPAREN: %s ->[%s: %s]", m.group(0), s, e)
                 paren_spans.append(Span(start=s, end=e))
         return paren_spans
 
@@ -271,23 +264,23 @@ class TableOrderBuidler:
         post_str, hier_span_groups = post_cell.line_text(ignore_config), []
         # replacing double space
         post_str = post_str.replace("  ", " ")
-        self.lgr.debug(f"{post_str}")
+        self.lgr.debug("%s", post_str)
 
         dept_sgs = self.hierarchy_dict["dept"].find_match(post_str, self.match_options)
-        self.lgr.debug(f"dept: {Hierarchy.to_str(dept_sgs)}")
+        self.lgr.debug("dept: %s", LazyStr(Hierarchy.to_str, dept_sgs))
 
         table_role_sgs = self.hierarchy_dict["role"].find_match(table_role, self.match_options)
 
         b_post_str = SpanGroup.blank_text(dept_sgs, post_str)
         role_sgs = self.hierarchy_dict["role"].find_match(b_post_str, self.match_options)
 
-        self.lgr.debug(f"role: {Hierarchy.to_str(role_sgs)}")
+        self.lgr.debug("role: %s", LazyStr(Hierarchy.to_str, role_sgs))
 
         if any(r for r in role_sgs if r.leaf == 'Prime Minister') and 'ta0.ro0' not in path:
             # if post_str has 'Will be assisting Prime Minister with '
             role_sgs = [r for r in role_sgs if r.leaf != 'Prime Minister']
             assert role_sgs or table_role_sgs
-            self.lgr.debug(f"REMOVAL role: {Hierarchy.to_str(role_sgs)}")
+            self.lgr.debug("REMOVAL role: %s", LazyStr(Hierarchy.to_str, role_sgs))
 
         hier_span_groups = dept_sgs + role_sgs
         hier_span_groups = sorted(hier_span_groups, key=op.attrgetter("min_start"))
@@ -297,7 +290,7 @@ class TableOrderBuidler:
             if span_group.root == "__department__":
                 dept_sg = span_group
                 if not role_sg:
-                    self.lgr.debug(f'*SETTING {path} table:{table_role}|{post_str}')
+                    self.lgr.debug("*SETTING %s table:%s|%s", path, table_role, post_str)
                     role_sg = table_role_sgs[0]
                 elif role_sg.leaf != table_role_sgs[0].leaf and 'Prime Minister' not in role_sg.leaf:
                     print(f'*MISMATCH {post_str} table: {table_role_sgs[0].leaf} role: {role_sg.leaf}')
@@ -360,7 +353,7 @@ class TableOrderBuidler:
             print(f"  {[str(e) for e in all_errors]}")
 
         self.lgr.debug("--------")
-        self.lgr.debug(d.to_str())
+        self.lgr.debug("%s", LazyStr(d.to_str))
 
         return d, all_errors
 
@@ -453,11 +446,12 @@ class TableOrderBuidler:
             else:
                 return 'continues'
 
+    @timed
     def __call__(self, doc):
         def get_title_role(line):
             line = line.replace(' ', '').replace('()', '').strip().lower()
             if not line:
-                self.lgr.debug(f"{doc.pdf_name}: Line is empty ")
+                self.lgr.debug("%s: Line is empty ", doc.pdf_name)
                 return 'Cabinet Minister'
             elif ('cabin' in line or 'inet' in line or 'cablnet' in line) and 'ministersofstate' not in line:
                 return 'Cabinet Minister'
@@ -473,11 +467,11 @@ class TableOrderBuidler:
             ):
                 return 'Minister of State (Independent Charge)'
             else:
-                self.lgr.debug(f"MINISTER OF STATE** {line}")
+                self.lgr.debug("MINISTER OF STATE** %s", line)
                 return 'Minister of State'
 
         self.add_log_handler(doc)
-        self.lgr.info(f"table_order_builder: {doc.pdf_name}")
+        self.lgr.info("table_order_builder: %s", doc.pdf_name)
 
         doc.add_extra_field("order", ("obj", "orgpedia.extracts.orgpedia", "Order"))
 
@@ -530,8 +524,10 @@ class TableOrderBuidler:
 
         doc.add_errors(errors)
 
-        self.lgr.info(f"=={doc.pdf_name}.table_order_builder {len(doc.order.details)} {DataError.error_counts(errors)}")
-        [self.lgr.info(str(e)) for e in errors]
+        self.lgr.info(
+            "==%s.table_order_builder %s %s", doc.pdf_name, len(doc.order.details), DataError.error_counts(errors)
+        )
+        [self.lgr.info("%s", e) for e in errors]
 
         self.verb_pages = old_verb_pages
         self.remove_log_handler(doc)
@@ -1,25 +1,45 @@
 import bisect
 import datetime
+import hashlib
 import json
 import logging
-import sys
+import pickle
+import zlib
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from itertools import groupby
 from operator import attrgetter
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import yaml
 from dateutil import parser
 from docint.data_error import DataError
 from docint.vision import Vision
-from more_itertools import flatten, pairwise
+from more_itertools import pairwise
 
 from ..extracts.orgpedia import Tenure
+from ..tools.file_cache import get_package_version, read_pickle, write_pickle
+from ..tools.log_utils import LazyStr, close_log, get_logger, open_log
+from ..tools.timeline import DateTimeline, find_key_overlaps
+from ..tools.timing import timed
 
 # b /Users/mukund/Software/docInt/docint/pipeline/id_assigner.py:34
 
+# Officers are split into shards by a hash of their officer_id, so an officer
+# stays in the same shard across runs and a shard's checkpoint can be reused
+# as long as its detail infos are unchanged.
+NUM_SHARDS = 64
+
+# part of the checkpoint key, bump it when the tenures built from the same detail infos change
+TENURE_BUILDER_VERSION = 1
+ORGPEDIA_VERSION = get_package_version("orgpedia")
+
+VERBS = ("continues", "relinquishes", "assumes")
+VERB_SORT_CODES = np.array([0, 0, 1], dtype=np.int8)  # DetailInfo.verb_code of VERBS
+
 
 class TenureManagerWithLeafRole(DataError):
     @classmethod
@@ -106,6 +126,137 @@ class DetailInfo:
         return 0 if self.verb == 'relinquishes' else 1 if self.verb == 'assumes' else 0
 
 
+def get_shard_idx(officer_id, num_shards=NUM_SHARDS):
+    return zlib.crc32(officer_id.encode()) % num_shards
+
+
+_worker_builder = None
+
+
+def init_worker(builder):
+    # the builder is sent once to each worker, the shards are sent without it
+    global _worker_builder
+    _worker_builder = builder
+
+    # the log files are written by a thread of the main process, not available in the workers
+    logging.getLogger(__name__).disabled = True
+
+
+class DetailInfoStore:
+    """The detail infos of all the orders as columns of codes, a row per (detail, verb, post).
+
+    Strings are coded into tables, the officer_id, order_id and post_id tables
+    are sorted so that sorting the codes sorts the strings. The rows are kept
+    sorted by officer and in the order build_officer_tenures processes them,
+    DetailInfo objects are built for a single officer's slice of rows at a time.
+    """
+
+    Columns = ("order_idx", "order_date", "detail_idx", "officer_code", "verb_code", "post_code", "role_code")
+
+    def __init__(self, orders, officer_ids, post_ids, roles, columns):
+        self.orders = orders  # [(order_id, order_date, order_category)] indexed by order_idx
+        self.officer_ids = officer_ids
+        self.post_ids = post_ids
+        self.roles = roles
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["order_idx"])
+
+    @classmethod
+    def build(cls, order_rows):
+        """Build from [(order, [(detail_idx, officer_id, verb, post_id, role)])]."""
+
+        def sort_table(table):
+            # returns the sorted values and the rank of each code in them
+            values, ranks = sorted(table), np.zeros(len(table), dtype=np.int32)
+            ranks[[table[v] for v in values]] = np.arange(len(values), dtype=np.int32)
+            return values, ranks
+
+        orders, order_id_table, officer_table, post_table, role_table = [], {}, {}, {}, {}
+        order_id_codes, rows = [], dict((name, []) for name in cls.Columns)
+        for order, detail_rows in order_rows:
+            if not detail_rows:
+                continue
+
+            order_idx, order_date = len(orders), order.date.toordinal()
+            orders.append((order.order_id, order.date, order.category))
+            order_id_codes.append(order_id_table.setdefault(order.order_id, len(order_id_table)))
+            for detail_idx, officer_id, verb, post_id, role in detail_rows:
+                rows["order_idx"].append(order_idx)
+                rows["order_date"].append(order_date)
+                rows["detail_idx"].append(detail_idx)
+                rows["officer_code"].append(officer_table.setdefault(officer_id, len(officer_table)))
+                rows["verb_code"].append(VERBS.index(verb))
+                rows["post_code"].append(post_table.setdefault(post_id, len(post_table)))
+                rows["role_code"].append(role_table.setdefault(role, len(role_table)))
+
+        columns = dict((name, np.array(values, dtype=np.int32)) for (name, values) in rows.items())
+        officer_ids, officer_ranks = sort_table(officer_table)
+        post_ids, post_ranks = sort_table(post_table)
+        _, order_id_ranks = sort_table(order_id_table)
+
+        columns["officer_code"] = officer_ranks[columns["officer_code"]]
+        columns["post_code"] = post_ranks[columns["post_code"]]
+        order_id_ranks = order_id_ranks[np.array(order_id_codes, dtype=np.int32)]
+
+        # the last key is the primary one, ties are broken by the row order as in a stable sort
+        sort_keys = (
+            np.arange(len(columns["order_idx"])),
+            columns["post_code"],
+            order_id_ranks[columns["order_idx"]],
+            VERB_SORT_CODES[columns["verb_code"]],
+            columns["order_date"],
+            columns["officer_code"],
+        )
+        sorted_idxs = np.lexsort(sort_keys)
+        columns = dict((name, values[sorted_idxs]) for (name, values) in columns.items())
+        return DetailInfoStore(orders, officer_ids, post_ids, list(role_table), columns)
+
+    def take(self, row_idxs):
+        """Returns a store of the given rows, with tables of only the strings used by them."""
+        columns = dict((name, values[row_idxs]) for (name, values) in self.columns.items())
+
+        def compact(name, table):
+            used_codes, codes = np.unique(columns[name], return_inverse=True)
+            columns[name] = codes.astype(np.int32)
+            return [table[c] for c in used_codes.tolist()]
+
+        orders, officer_ids = compact("order_idx", self.orders), compact("officer_code", self.officer_ids)
+        post_ids, roles = compact("post_code", self.post_ids), compact("role_code", self.roles)
+        return DetailInfoStore(orders, officer_ids, post_ids, roles, columns)
+
+    def iter_officer_slices(self):
+        officer_codes = self.columns["officer_code"]
+        starts = np.flatnonzero(np.diff(officer_codes, prepend=-1)).tolist()
+        for start, end in zip(starts, starts[1:] + [len(officer_codes)]):
+            yield self.officer_ids[officer_codes[start]], start, end
+
+    def get_detail_infos(self, start, end):
+        def build_info(order_idx, detail_idx, officer_code, verb_code, post_code, role_code):
+            order_id, order_date, order_category = self.orders[order_idx]
+            officer_id, verb, post_id, role = o_ids[officer_code], VERBS[verb_code], p_ids[post_code], roles[role_code]
+            return DetailInfo(order_id, order_date, detail_idx, officer_id, verb, post_id, role, order_category, [])
+
+        o_ids, p_ids, roles = self.officer_ids, self.post_ids, self.roles
+        names = ("order_idx", "detail_idx", "officer_code", "verb_code", "post_code", "role_code")
+        return [build_info(*r) for r in zip(*(self.columns[n][start:end].tolist() for n in names))]
+
+    def iter_officer_infos(self):
+        for officer_id, start, end in self.iter_officer_slices():
+            yield officer_id, self.get_detail_infos(start, end)
+
+
+def build_shard_tenures(builder, shard_store):
+    """Build the tenures of the officers in a shard, returns [(officer_id, tenures, errors)]."""
+    officer_infos = shard_store.iter_officer_infos()
+    return [(officer_id, *builder.build_officer_tenures(officer_id, infos)) for (officer_id, infos) in officer_infos]
+
+
+def build_worker_shard_tenures(shard_store):
+    return build_shard_tenures(_worker_builder, shard_store)
+
+
 @Vision.factory(
     "tenure_builder",
     default_config={
@@ -113,13 +264,28 @@ class DetailInfo:
         "conf_stub": "tenure_builder",
         "ministry_file": "conf/ministries.yml",
         "default_role": "Cabinet Minister",
+        "tenure_workers": 1,
+        "checkpoint_dir": "",
+        "duplicates_file": "output/duplicate_post_tenures.json",
     },
 )
 class TenureBuilder:
-    def __init__(self, conf_dir, conf_stub, ministry_file, default_role):
+    def __init__(
+        self,
+        conf_dir,
+        conf_stub,
+        ministry_file,
+        default_role,
+        tenure_workers=1,
+        checkpoint_dir="",
+        duplicates_file="output/duplicate_post_tenures.json",
+    ):
         self.conf_dir = conf_dir
         self.conf_stub = conf_stub
         self.ministry_path = Path(ministry_file)
+        self.tenure_workers = tenure_workers
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.duplicates_path = Path(duplicates_file) if duplicates_file else None
 
         self.first_orders_dict = {}
         if self.ministry_path.exists():
@@ -132,12 +298,10 @@ class TenureBuilder:
         else:
             self.ministry_dict = {}
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        ministries = self.ministry_dict.get("ministries", [])
+        self.ministry_timeline = DateTimeline([(m["start_date"], m["end_date"]) for m in ministries], ministries)
+
+        self.lgr = get_logger(__name__)
         self.curr_tenure_idx = -1
         self.default_role = default_role
         self.officer_start_date_dict = defaultdict(list)
@@ -145,18 +309,13 @@ class TenureBuilder:
     def add_log_handler(self):
         handler_name = f"{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
-    def build_detail_infos(self, order):
+    def build_detail_rows(self, order):
         def valid_date(order):
             if not order.date:
                 return False
@@ -168,7 +327,7 @@ class TenureBuilder:
             if not detail.officer.officer_id:
                 return
 
-            for verb in ["continues", "relinquishes", "assumes"]:
+            for verb in VERBS:
                 for post in getattr(detail, verb):
                     yield verb, post
 
@@ -176,26 +335,15 @@ class TenureBuilder:
             seen = set()
             return set(i for i in iter if i in seen or seen.add(i))
 
-        def build_info(detail, verb, post):
+        def build_row(detail, verb, post):
             role = post.role_hpath[-1] if post.role_hpath else None
 
-            order_date = order.date
             # if order.order_id in self.first_orders_dict:
             #     order_date = self.first_orders_dict[order.order_id]
             #     order.date = order_date
             #     print(f'Changing {order.date} -> {order_date}')
 
-            return DetailInfo(
-                order.order_id,
-                order_date,
-                detail.detail_idx,
-                detail.officer.officer_id,
-                verb,
-                post.post_id,
-                role,
-                order.category,
-                [],
-            )
+            return (detail.detail_idx, detail.officer.officer_id, verb, post.post_id, role)
 
         if order.order_id == "1_Upload_3296.pdf":
             pass
@@ -211,15 +359,13 @@ class TenureBuilder:
 
         v_details = [d for d in order.details if d.officer.officer_id not in dup_o_ids]
 
-        return [build_info(d, v, p) for d in v_details for (v, p) in iter_posts(d)]
+        return [build_row(d, v, p) for d in v_details for (v, p) in iter_posts(d)]
 
     def ministry_end_date(self, date):
         assert self.ministry_dict
-        for m in self.ministry_dict["ministries"]:
-            if m["start_date"] <= date < m["end_date"]:
-                return m["end_date"]
-        assert False
-        return None
+        ministry, _ = self.ministry_timeline.find(date)
+        assert ministry, f"No ministry found for {date}"
+        return ministry["end_date"]
 
     def get_council_end_date(self, date):
         idx = bisect.bisect(self.council_order_dates, date)
@@ -227,10 +373,8 @@ class TenureBuilder:
 
     def get_ministry(self, date):
         assert self.ministry_dict
-        for m in self.ministry_dict["ministries"]:
-            if m["start_date"] <= date < m["end_date"]:
-                return m["name"]
-        return None
+        ministry, _ = self.ministry_timeline.find(date)
+        return ministry["name"] if ministry else None
 
     def build_officer_tenures(self, officer_id, detail_infos):  # noqa C901
         officer_tenure_idx = -1
@@ -253,7 +397,9 @@ class TenureBuilder:
 
             osd_key = f'{start_info.officer_id}-{start_info.order_date}'
             officer_start_date_idx = len(self.officer_start_date_dict[osd_key])
-            self.lgr.info(f'\t\tNEW T: [{start_info.officer_id},{start_info.order_date}->{end_order_id},{end_date}]')
+            self.lgr.info(
+                "\t\tNEW T: [%s,%s->%s,%s]", start_info.officer_id, start_info.order_date, end_order_id, end_date
+            )
             return Tenure(
                 tenure_id=f'{start_info.officer_id}-{officer_tenure_idx}',
                 tenure_idx=officer_tenure_idx,
@@ -288,7 +434,7 @@ class TenureBuilder:
             o_id, o_date, d_idx = first.order_id, first.order_date, first.detail_idx
             o_tenures = []
             active_posts = set(postid_info_dict.keys())
-            self.lgr.info(f"\tActive{get_postids(active_posts)} Order{get_postids(order_infos)}")
+            self.lgr.info("\tActive%s Order%s", LazyStr(get_postids, active_posts), LazyStr(get_postids, order_infos))
             if first.order_category == "Council of Ministers":
                 ### TODO COUNCIL OF MINISTERS CAN HAVE RELINQUISHED POST AS WELL, THIS handles CONTINUES
                 order_posts = set(i.post_id for i in order_infos)
@@ -299,7 +445,7 @@ class TenureBuilder:
                         ignored_info = postid_info_dict[post_id]
                         o_tenures.append(build_tenure(ignored_info, o_id, o_date, d_idx))
                         del postid_info_dict[post_id]
-                    self.lgr.info(f"\t\tClosing Actives*{get_postids(ignored_posts)} {o_id} {d_idx}")
+                    self.lgr.info("\t\tClosing Actives*%s %s %s", LazyStr(get_postids, ignored_posts), o_id, d_idx)
 
             for info in order_infos:
                 if info.verb in ("assumes", "continues"):
@@ -313,7 +459,7 @@ class TenureBuilder:
                 elif info.verb == "relinquishes":
                     start_info = postid_info_dict.get(info.post_id, None)
                     if not start_info:
-                        self.lgr.warning(f"***Missing Assume post_id: {info.post_id} not found in {str(info)}")
+                        self.lgr.warning("***Missing Assume post_id: %s not found in %s", info.post_id, info)
                         errors.append(TenureMissingAssumeError.build(info))
                         continue
                     start_info.all_infos.append(info)
@@ -321,7 +467,7 @@ class TenureBuilder:
                         o_id == info.order_id and d_idx == info.detail_idx
                     ), f'{o_id} == {info.order_id}, {d_idx} == {info.detail_idx}'
                     o_tenures.append(build_tenure(start_info, o_id, o_date, d_idx))
-                    self.lgr.info(f"\t\tClosing Active: {info.post_id} {o_id} {d_idx}")
+                    self.lgr.info("\t\tClosing Active: %s %s %s", info.post_id, o_id, d_idx)
                     del postid_info_dict[info.post_id]
                 else:
                     raise NotImplementedError(f"Unknown verb: {info.verb}")
@@ -338,13 +484,18 @@ class TenureBuilder:
         #     import pdb
         #     pdb.set_trace()
 
-        detail_infos = sorted(detail_infos, key=lambda i: (i.order_date, i.verb_code, i.order_id, i.post_id))
-        self.lgr.info(f"\n## Processing Officer: {officer_id} #detailpost_infos: {len(detail_infos)}")
-        self.lgr.info(f"\n\tOrders: {set(d.order_id for d in detail_infos)}")
+        def info_key(info):
+            return (info.order_date, info.verb_code, info.order_id, info.post_id)
+
+        # the DetailInfoStore already keeps the infos in this order, sorting them again is linear
+        sorted_detail_infos = sorted(detail_infos, key=info_key)
+
+        self.lgr.info("\n## Processing Officer: %s #detailpost_infos: %s", officer_id, len(sorted_detail_infos))
+        self.lgr.info("\n\tOrders: %s", LazyStr(lambda: set(d.order_id for d in sorted_detail_infos)))
 
 
         postid_info_dict, officer_tenures, prev_ministry = {}, [], None
-        for order_id, order_infos in groupby(detail_infos, key=attrgetter("order_id")):
+        for order_id, order_infos in groupby(sorted_detail_infos, key=attrgetter("order_id")):
             order_infos = list(order_infos)
             if self.ministry_dict:
                 curr_ministry = self.get_ministry(order_infos[0].order_date)
@@ -353,11 +504,11 @@ class TenureBuilder:
                     close_order_infos()
                 prev_ministry = curr_ministry
 
-            self.lgr.info(f"Order: {order_id} #detailpost_infos: {len(order_infos)}")
+            self.lgr.info("Order: %s #detailpost_infos: %s", order_id, len(order_infos))
             officer_tenures += handle_order_infos(order_infos)
 
         if postid_info_dict:
-            self.lgr.warning(f"***No Closing Orders{get_postids(postid_info_dict.keys())}")
+            self.lgr.warning("***No Closing Orders%s", LazyStr(get_postids, postid_info_dict.keys()))
             if self.ministry_dict:
                 for post_id, info in postid_info_dict.items():
                     max_order_date  = max(i.order_date for i in info.all_infos)
@@ -379,6 +530,53 @@ class TenureBuilder:
                 errors.append(TenureGapError.build(t2, gap_years))
         return officer_tenures, errors
 
+    def get_checkpoint_path(self, shard_idx, shard_store):
+        inputs = (shard_store, self.council_order_dates, self.ministry_dict, self.default_role, list(Tenure.__fields__))
+        versions = (TENURE_BUILDER_VERSION, ORGPEDIA_VERSION)
+        digest = hashlib.sha1(pickle.dumps((versions, inputs))).hexdigest()
+        return self.checkpoint_dir / f"{self.conf_stub}-{shard_idx}-{digest}.pkl"
+
+    def build_sharded_tenures(self, detail_store):
+        """Build the tenures shard by shard in a process pool, returns [(tenures, errors)] in officer_id order."""
+        officer_shard_idxs = np.array([get_shard_idx(o_id) for o_id in detail_store.officer_ids], dtype=np.int32)
+        row_shard_idxs = officer_shard_idxs[detail_store.columns["officer_code"]]
+        shard_idxs = np.unique(row_shard_idxs).tolist()
+        shards = dict((idx, detail_store.take(np.flatnonzero(row_shard_idxs == idx))) for idx in shard_idxs)
+
+        shard_results, checkpoint_paths = {}, {}
+        if self.checkpoint_dir:
+            for shard_idx in shard_idxs:
+                checkpoint_paths[shard_idx] = self.get_checkpoint_path(shard_idx, shards[shard_idx])
+                if checkpoint_paths[shard_idx].exists():
+                    shard_results[shard_idx] = read_pickle(checkpoint_paths[shard_idx])
+
+        todo_idxs = [idx for idx in shard_idxs if shard_results.get(idx, None) is None]
+        self.lgr.info("#Shards: %s #Checkpointed: %s", len(shard_idxs), len(shard_idxs) - len(todo_idxs))
+
+        def save_result(shard_idx, result):
+            shard_results[shard_idx] = result
+            if self.checkpoint_dir:
+                checkpoint_path = checkpoint_paths[shard_idx]
+                write_pickle(checkpoint_path, result)
+
+                # checkpoints of the earlier inputs of the shard are not read again
+                for old_path in self.checkpoint_dir.glob(f"{self.conf_stub}-{shard_idx}-*.pkl"):
+                    if old_path != checkpoint_path:
+                        old_path.unlink(missing_ok=True)
+
+        if self.tenure_workers > 1 and len(todo_idxs) > 1:
+            pool_args = dict(max_workers=self.tenure_workers, initializer=init_worker, initargs=(self,))
+            with ProcessPoolExecutor(**pool_args) as executor:
+                futures = dict((executor.submit(build_worker_shard_tenures, shards[idx]), idx) for idx in todo_idxs)
+                for future in as_completed(futures):
+                    save_result(futures[future], future.result())
+        else:
+            for shard_idx in todo_idxs:
+                save_result(shard_idx, build_shard_tenures(self, shards[shard_idx]))
+
+        officer_results = dict((o_id, (ts, es)) for r in shard_results.values() for (o_id, ts, es) in r)
+        return [officer_results[officer_id] for officer_id in sorted(officer_results)]
+
     def compute_manager(self, tenures):
         leaf_roles = ('Minister of State', 'Deputy Minister')
         leaf_tenures = [t for t in tenures if t.role in leaf_roles]
@@ -393,7 +591,7 @@ class TenureBuilder:
             leaf_ts = [t for t in manager_ts if t.role in leaf_roles]
             if leaf_ts:
                 e = TenureManagerWithLeafRole.build(tenure, leaf_ts)
-                self.lgr.debug(f'{e.name} {e.msg} {str(tenure)}')
+                self.lgr.debug("%s %s %s", e.name, e.msg, tenure)
                 errors.append(e)
 
             manager_ts = [t for t in manager_ts if t.role not in leaf_roles]
@@ -404,7 +602,7 @@ class TenureBuilder:
             for manager_tenure in manager_ts:
                 manager_tenure.reportee_ids.append(tenure.tenure_id)
 
-            self.lgr.debug(f"T: {str(tenure)} M: {'|'.join(str(t) for t in manager_ts)}")
+            self.lgr.debug("T: %s M: %s", tenure, LazyStr(lambda: '|'.join(str(t) for t in manager_ts)))
         return errors
 
     def write_tenures(self, tenures):
@@ -417,29 +615,42 @@ class TenureBuilder:
         tenure_output_path = Path("output/tenures.json")
         tenure_output_path.write_text(json.dumps({"tenures": tenure_dicts}, indent=2))
 
-    def find_overlapping_tenures(self, sorted_tenures, dt, start_idx):
-        s_idx, o_tenures = -1, []
-        for (idx, tenure) in enumerate(sorted_tenures[start_idx:]):
-            if dt in tenure:
-                if s_idx == -1:
-                    s_idx = idx + start_idx
-                o_tenures.append(tenure)
-        return s_idx, o_tenures
+    def find_duplicate_post_tenures(self, tenures):
+        """Returns the periods in which a post is held by multiple tenures with the same role."""
 
-    def check_duplicate_post_tenures(self, date_tenures):
         def post_key(tenure):
             return (tenure.post_id, tenure.role if tenure.role else '')
 
-        post_sorted_tenures = sorted(date_tenures, key=post_key)
+        def get_end_date(tenure):
+            return datetime.date.today() if tenure.end_date == "to_date" else tenure.end_date
+
+        intervals = [(t.start_date, get_end_date(t)) for t in tenures]
+        post_keys = [post_key(t) for t in tenures]
+
+        duplicates = []
+        for (post_id, role), start_date, end_date, idxs in find_key_overlaps(intervals, post_keys):
+            if role == 'Minister of State':
+                continue
+
+            dup_tenures = [tenures[idx] for idx in idxs]
+            duplicates.append(
+                {
+                    "post_id": post_id,
+                    "role": role,
+                    "start_date": str(start_date),
+                    "end_date": str(end_date),
+                    "tenure_ids": [t.tenure_id for t in dup_tenures],
+                    "officer_ids": [t.officer_id for t in dup_tenures],
+                }
+            )
+            self.lgr.info("Duplicate Post: %s %s [%s->%s] %s", post_id, role, start_date, end_date, dup_tenures[0])
+        return duplicates
 
-        duplicate_posts_tenures = []
-        for dup_post_key, duplicates in groupby(post_sorted_tenures, key=post_key):
-            duplicates = list(duplicates)
-            if len(duplicates) > 1 and dup_post_key[1] != 'Minister of State':
-                print(f'\n** Duplicates: {dup_post_key}')
-                [ print(t) for t in duplicates ]
-                duplicate_posts_tenures.append(duplicates)
+    def write_duplicates_report(self, duplicates):
+        self.duplicates_path.parent.mkdir(parents=True, exist_ok=True)
+        self.duplicates_path.write_text(json.dumps({"duplicate_post_tenures": duplicates}, indent=2))
 
+    @timed
     def pipe(self, docs, **kwargs):
         self.add_log_handler()
         print("Inside tenure_builder")
@@ -451,23 +662,25 @@ class TenureBuilder:
             doc.add_extra_field("tenures", ("list", "orgpedia.extracts.orgpedia", "Tenure"))
 
         orders = [doc.order for doc in docs]
-        detail_infos = list(flatten(self.build_detail_infos(o) for o in orders))
+        detail_store = DetailInfoStore.build((o, self.build_detail_rows(o)) for o in orders)
 
         self.council_order_dates = [o.date for o in orders if o.category == 'Council of Ministers']
         self.council_order_dates.sort()
 
-        detail_infos.sort(key=attrgetter("officer_id"))
-        officer_groupby = groupby(detail_infos, key=attrgetter("officer_id"))
+        if self.tenure_workers > 1 or self.checkpoint_dir:
+            officer_results = self.build_sharded_tenures(detail_store)
+        else:
+            officer_infos = detail_store.iter_officer_infos()
+            officer_results = (self.build_officer_tenures(o_id, o_infos) for (o_id, o_infos) in officer_infos)
 
         tenures, errors = [], []
-        for officer_id, officer_infos in officer_groupby:
-            o_tenures, o_errors = self.build_officer_tenures(officer_id, officer_infos)
+        for o_tenures, o_errors in officer_results:
             tenures += o_tenures
             errors += o_errors
 
         errors += self.compute_manager(tenures)
 
-        self.lgr.info(f"#Tenures: {len(tenures)}")
+        self.lgr.info("#Tenures: %s", len(tenures))
         order_id_doc_dict = {}
         for doc in docs:
             order_id_doc_dict[doc.order.order_id] = doc
@@ -477,21 +690,14 @@ class TenureBuilder:
             doc = order_id_doc_dict[tenure.start_order_id]
             doc.tenures.append(tenure)
 
-        # find multiple tenures on a single day
-        print('*** DUPLICATE POST TENURES ***')
-
-        sorted_tenures = sorted(tenures, key=attrgetter('start_date'))
-
-        all_dates = [t.start_date for t in tenures] + [t.end_date for t in tenures if t.end_date]
-        all_dates = sorted(set(d for d in all_dates))
-
-        start_idx = 0
-        for t_date in all_dates:
-            new_sidx, o_tenures = self.find_overlapping_tenures(sorted_tenures, t_date, start_idx)
-            duplicate_posts_tenures = self.check_duplicate_post_tenures(o_tenures)
+        # find posts held by multiple tenures at the same time
+        duplicates = self.find_duplicate_post_tenures(tenures)
+        print(f'*** DUPLICATE POST TENURES: {len(duplicates)} ***')
+        if self.duplicates_path:
+            self.write_duplicates_report(duplicates)
 
         # self.write_tenures(tenures)
-        self.lgr.info(f"=={doc.pdf_name}.tenure_builder {len(tenures)} {DataError.error_counts(errors)}")
+        self.lgr.info("==%s.tenure_builder %s %s", doc.pdf_name, len(tenures), DataError.error_counts(errors))
         self.lgr.info("Leaving tenure_builder")
         self.remove_log_handler()
         return docs
@@ -1,18 +1,19 @@
-import csv
 import datetime
 import json
-import logging
-import sys
 from operator import attrgetter
 from pathlib import Path
 
 import pydantic
 import yaml
-from docint.hierarchy import Hierarchy
 from docint.vision import Vision
 from more_itertools import flatten
 
 from ..extracts.orgpedia import OfficerID, Order, Tenure
+from ..tools.columns import ARROW_FORMATS, build_columns, write_arrow, write_csv
+from ..tools.hierarchy_cache import load_hierarchy
+from ..tools.json_stream import write_json_dict, write_json_list
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timing import timed
 
 
 # b /Users/mukund/Software/docInt/docint/pipeline/id_assigner.py:34
@@ -32,6 +33,7 @@ from ..extracts.orgpedia import OfficerID, Order, Tenure
         "post_id_fields": [],
         "output_dir": "output",
         "translations_file": "trans.yml",
+        "compress": False,
     },
 )
 class TenureWriter:
@@ -45,6 +47,7 @@ class TenureWriter:
         post_id_fields,
         output_dir,
         translations_file,
+        compress=False,
     ):
         self.conf_dir = Path(conf_dir)
         self.conf_stub = conf_stub
@@ -52,6 +55,7 @@ class TenureWriter:
         self.output_dir = Path(output_dir)
         self.hierarchy_files = hierarchy_files
         self.translations_file = self.conf_dir / translations_file
+        self.compress = compress
 
         self.officer_infos = []
         self.officer_id_dict = {}
@@ -64,7 +68,7 @@ class TenureWriter:
         self.hierarchy_dict = {}
         for field, file_name in self.hierarchy_files.items():
             hierarchy_path = self.conf_dir / file_name
-            hierarchy = Hierarchy(hierarchy_path)
+            hierarchy = load_hierarchy(hierarchy_path)
             self.hierarchy_dict[field] = hierarchy
 
         if self.translations_file.exists():
@@ -72,39 +76,24 @@ class TenureWriter:
         else:
             self.translations = {}
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
 
     def add_log_handler(self):
         handler_name = f"{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.lgr.info(f"adding handler {log_path}")
-
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
+        self.lgr.info("adding handler %s", log_path)
 
     def remove_log_handler(self):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
-
-    def get_tenures_header(self):
-        keys = Tenure.__fields__.keys()
-        return ['officer_name'] + list(keys)
-
-    def get_tenures_csv(self, tenures):
-        tenure_dicts = []
-        for tenure in tenures:
-            name = self.officer_id_dict[tenure.officer_id].name
-            fields = [(f, getattr(tenure, f)) for f in Tenure.__fields__.keys()]
-            tenure_dicts.append(dict([('officer_name', name)] + fields))
-        return tenure_dicts
+        close_log(self.lgr)
+
+    def get_tenure_columns(self, tenures):
+        officer_names = dict((officer_id, officer.name) for (officer_id, officer) in self.officer_id_dict.items())
+        columns = {'officer_name': [officer_names[t.officer_id] for t in tenures]}
+        columns.update(build_columns(tenures, list(Tenure.__fields__.keys())))
+        return columns
 
+    @timed
     def pipe(self, docs, **kwargs):
         self.add_log_handler()
         print("Inside tenure_writer")
@@ -116,8 +105,8 @@ class TenureWriter:
         #     doc.remove_all_extra_fields(except_fields=['order', 'tenures', 'words', 'lines', 'page_image'])
 
         # export removes region fields from docs, region is the parent class for all extracts
-        orders = [d.order.export() for d in docs]
-        (self.output_dir / 'orders.json').write_text(json.dumps(orders, default=pydantic.json.pydantic_encoder))
+        orders = (d.order.export() for d in docs)
+        write_json_list(self.output_dir / 'orders', orders, self.formats, self.compress)
 
         self.tenures = list(flatten(doc.tenures for doc in docs))
         for tenure in self.tenures:
@@ -125,18 +114,16 @@ class TenureWriter:
                 tenure.end_date = "to_date"
 
         self.tenures.sort(key=attrgetter('tenure_id'))
-        (self.output_dir / 'tenures.json').write_text(json.dumps(self.tenures, default=pydantic.json.pydantic_encoder))
-        with open((self.output_dir / 'tenures.csv'), 'w') as tenures_csv:
-            csv_writer = csv.DictWriter(tenures_csv, fieldnames=self.get_tenures_header())
-            csv_writer.writeheader()
-            csv_writer.writerows(self.get_tenures_csv(self.tenures))
-
-        with open((self.output_dir / 'tenures-sample.csv'), 'w') as tenures_sample_csv:
-            csv_writer = csv.DictWriter(tenures_sample_csv, fieldnames=self.get_tenures_header())
-            csv_writer.writeheader()
-            csv_writer.writerows(self.get_tenures_csv(self.tenures[:100]))
-
-        officer_infos_path = self.output_dir / 'officer_infos.json'
+        write_json_list(self.output_dir / 'tenures', self.tenures, self.formats, self.compress)
+        column_formats = [fmt for fmt in self.formats if fmt == 'csv' or fmt in ARROW_FORMATS]
+        tenure_columns = self.get_tenure_columns(self.tenures) if column_formats else None
+        for fmt in column_formats:
+            if fmt == 'csv':
+                write_csv(self.output_dir / 'tenures.csv', tenure_columns)
+                write_csv(self.output_dir / 'tenures-sample.csv', tenure_columns, num_rows=100)
+            else:
+                write_arrow(self.output_dir / f'tenures.{fmt}', tenure_columns, fmt)
+
         for officer_info in self.officer_infos:
             if self.translations:
                 officer_info.language_names = self.translations['names'][officer_info.name]
@@ -144,7 +131,7 @@ class TenureWriter:
                 officer_info.language_names = []
 
         self.officer_infos.sort(key=attrgetter('officer_id'))
-        officer_infos_path.write_text(json.dumps(self.officer_infos, default=pydantic.json.pydantic_encoder))
+        write_json_list(self.output_dir / 'officer_infos', self.officer_infos, self.formats, self.compress)
 
         post_infos = {}
         for field in self.hierarchy_files:
@@ -159,7 +146,8 @@ class TenureWriter:
                 print(f'Unable to find translations for {missing_names}')
             post_infos[f'translations_{field}'] = self.translations[field]
 
-        (self.output_dir / 'post_infos.json').write_text(json.dumps(post_infos, default=pydantic.json.pydantic_encoder))
+        if 'json' in self.formats:
+            write_json_dict(self.output_dir / 'post_infos.json', post_infos, self.compress)
 
         # export removes region fields from docs, region is the parent class for all extracts
         # orders = [d.order.export() for d in docs]
@@ -4,6 +4,8 @@ from pathlib import Path
 
 from docint.vision import Vision
 
+from ..tools.timing import timed
+
 
 @Vision.factory(
     "text_writer",
@@ -57,6 +59,7 @@ class TextWriter:
             row_infos.append({"mr": f"|{mr_txt}|", "en": f"|{en_txt}|"})
         return {"rows": row_infos}
 
+    @timed
     def __call__(self, doc):
         lang_lines_dict = dict((lang, []) for lang in self.languages)
         for page_idx, page in enumerate(doc.pages):
@@ -1,12 +1,14 @@
 import json
-import logging
-import sys
 from pathlib import Path
 
 import yaml
 from docint.vision import Vision
-from more_itertools import first, flatten
+from more_itertools import flatten
 
+from ..tools.lang_runtime import load_lang_bundles
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timeline import DateTimeline
+from ..tools.timing import timed
 from .website_lang_gen import (
     DetailInfo,
     DetailPipeInfo,
@@ -18,9 +20,6 @@ from .website_lang_gen import (
     lang_year,  # noqa
 )
 
-DIGIT_LANG_DICT = {}
-TODATE_DICT = {}  # Ugliness
-
 
 @Vision.factory(
     "detail_language_generator",
@@ -71,21 +70,17 @@ class WebsiteDetailGenerator:
         else:
             self.depts = []
 
-        self.officer_info_dict = self.get_officer_infos(self.officer_info_files)
-        print(f"#Officer_info: {len(self.officer_info_dict)}")
-
         if self.translation_file.exists():
             self.translations = yaml.load(self.translation_file.read_text(), Loader=yaml.FullLoader)
         else:
             self.translations = {}
 
-        global DIGIT_LANG_DICT
-        DIGIT_LANG_DICT = self.translations['digits']
+        languages = self.languages + ['en'] if 'en' not in self.languages else self.languages
+        self.lang_bundles = load_lang_bundles(self.translations, languages)
+        self.lang_label_info_dict = self.build_lang_label_infos(self.lang_bundles)
 
-        self.lang_label_info_dict = self.build_lang_label_infos(self.translations['labels'])
-
-        global TODATE_DICT
-        TODATE_DICT = dict((lang, getattr(ld, 'to_date')) for (lang, ld) in self.lang_label_info_dict.items())
+        self.officer_info_dict = self.get_officer_infos(self.officer_info_files)
+        print(f"#Officer_info: {len(self.officer_info_dict)}")
 
         self.post_dict = {}
         self.order_dict = {}
@@ -104,6 +99,8 @@ class WebsiteDetailGenerator:
             self.ministry_infos = self.build_ministryinfos(min_dict)
         else:
             self.ministry_infos = []
+        ministry_dates = [(m.start_date, m.end_date) for m in self.ministry_infos]
+        self.ministry_timeline = DateTimeline(ministry_dates, self.ministry_infos)
 
         self.template_dir = Path("conf") / Path("templates") / Path(template_stub)
 
@@ -116,53 +113,29 @@ class WebsiteDetailGenerator:
             lstrip_blocks=True,
         )
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.curr_tenure_idx = 0
 
     def has_ministry(self):
         return True
 
-    def build_lang_label_infos(self, labels_trans_dict):
-        labels = [l for l in labels_trans_dict.keys()]
-        labels = [l.replace(',', '').replace(' ', '_').lower() for l in labels]
-
-        languages = self.languages + ['en'] if 'en' not in self.languages else self.languages  # noqa F841
-
-        init_dicts = dict((lang, {}) for lang in languages)
-
-        for (attr, label) in zip(labels, labels_trans_dict.keys()):
-            for lang in languages:
-                init_dicts[lang][attr] = labels_trans_dict[label][lang]
-
-        label_info_dict = {}
-        for (lang, init_dict) in init_dicts.items():
-            label_info_dict[lang] = LabelsInfo(init_dict, lang)
-
-        return label_info_dict
+    def build_lang_label_infos(self, lang_bundles):
+        return dict((lang, LabelsInfo(bundle.labels, lang)) for (lang, bundle) in lang_bundles.items())
 
     def build_ministryinfos(self, ministry_yml):
-        return [MinistryInfo(m) for m in ministry_yml["ministries"]]
+        return [MinistryInfo(m, self.lang_bundles) for m in ministry_yml["ministries"]]
 
     def get_ministry(self, dt):
-        ministry = first([m for m in self.ministry_infos if m.has_date(dt)], None)
+        ministry, _ = self.ministry_timeline.find(dt)
         return ministry
 
     def add_log_handler(self):
         handler_name = f"{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
 
     def remove_log_handler(self):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_officer_infos(self, officer_info_files):
         result_dict = {}
@@ -176,7 +149,10 @@ class WebsiteDetailGenerator:
             else:
                 info_dict = json.loads(o_path.read_text())
 
-            info_dict = dict((d["officer_id"], OfficerInfo(d, idx + 1)) for idx, d in enumerate(info_dict["officers"]))
+            info_dict = dict(
+                (d["officer_id"], OfficerInfo(d, idx + 1, self.lang_bundles))
+                for idx, d in enumerate(info_dict["officers"])
+            )
             result_dict = {**result_dict, **info_dict}
             print(f"\t{officer_info_file} {len(info_dict)} {len(result_dict)}")
         return result_dict
@@ -236,9 +212,9 @@ class WebsiteDetailGenerator:
         if self.has_ministry():
             m = self.get_ministry(order.date)
             assert m, f'Unknown {order.date} in {order.order_id}'
-            order_info = OrderInfo(order, details, m.name, m.start_date, m.end_date, num_pages)
+            order_info = OrderInfo(order, details, m.name, m.start_date, m.end_date, num_pages, self.lang_bundles)
         else:
-            order_info = OrderInfo(order, details, '', None, None, num_pages)
+            order_info = OrderInfo(order, details, '', None, None, num_pages, self.lang_bundles)
 
         return order_info
 
@@ -286,6 +262,7 @@ class WebsiteDetailGenerator:
             else:
                 return self.output_dir / f"{entity}.html"
 
+    @timed
     def __call__(self, doc):
         self.add_log_handler()
         order_info = self.build_orderinfo(doc.order)
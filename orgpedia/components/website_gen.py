@@ -1,7 +1,5 @@
 import datetime
 import json
-import logging
-import sys
 from itertools import groupby
 from operator import attrgetter
 from pathlib import Path
@@ -11,6 +9,10 @@ from dateutil import parser
 from docint.vision import Vision
 from more_itertools import flatten
 
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timeline import DateTimeline
+from ..tools.timing import timed
+
 # from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 # b /Users/mukund/Software/docInt/docint/pipeline/website_gen.py:164
@@ -188,29 +190,23 @@ class WebsiteGenerator:
         else:
             self.ministry_dict = {}
 
+        ministries = self.ministry_dict.get("ministries", [])
+        self.ministry_timeline = DateTimeline([(m["start_date"], m["end_date"]) for m in ministries], ministries)
+
         from jinja2 import Environment, FileSystemLoader, select_autoescape
 
         self.env = Environment(loader=FileSystemLoader("conf/templates"), autoescape=select_autoescape())
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.curr_tenure_idx = 0
 
     def add_log_handler(self):
         handler_name = f"{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
 
     def remove_log_handler(self):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_officer_infos(self, officer_info_files):
         result_dict = {}
@@ -293,10 +289,8 @@ class WebsiteGenerator:
         if not self.ministry_dict:
             return "No Ministry", None
 
-        for m in self.ministry_dict["ministries"]:
-            if m["start_date"] <= date < m["end_date"]:
-                return m["name"], m["start_date"]
-        return None, None
+        ministry, _ = self.ministry_timeline.find(date)
+        return (ministry["name"], ministry["start_date"]) if ministry else (None, None)
 
     def gen_officer_page(self, officer_idx, officer_id, tenures):
         def seniority(tenure):
@@ -308,13 +302,10 @@ class WebsiteGenerator:
             if not self.ministry_dict:
                 return "No Ministry"
 
-            for m in self.ministry_dict["ministries"]:
-                if m["start_date"] <= tenure.start_date < m["end_date"]:
-                    return m["name"]
-            return None
+            return self.get_ministry(tenure.start_date)[0]
 
         tenures = sorted(tenures, key=attrgetter("start_date"))
-        self.lgr.info(f"Generating officer page: {officer_id} {len(tenures)}")
+        self.lgr.info("Generating officer page: %s %s", officer_id, len(tenures))
 
         ministry_tenures = groupby(tenures, key=lambda t: tenure_ministry(t))
 
@@ -363,25 +354,26 @@ class WebsiteGenerator:
         docs_file = self.output_dir / "docs.json"
         docs_file.write_text(json.dumps(docs))
 
+    @timed
     def pipe(self, docs, **kwargs):
         self.add_log_handler()
         docs = list(docs)
         print("Entering website builder")
         self.lgr.info("Entering website builder")
 
-        self.lgr.info(f"Handling #docs: {len(docs)}")
+        self.lgr.info("Handling #docs: %s", len(docs))
 
         orders = [doc.order for doc in docs if doc.order.date]
         orders.sort(key=attrgetter("date"))
         self.order_dict = dict((o.order_id, o) for o in orders)
         self.order_idx_dict = dict((o.order_id, i) for (i, o) in enumerate(orders))
 
-        self.lgr.info(f"Handling #orders: {len(orders)}")
+        self.lgr.info("Handling #orders: %s", len(orders))
 
         self.post_dict = dict((p.post_id, p) for o in orders for p in o.get_posts())
 
         tenures = list(flatten(doc.tenures for doc in docs))
-        self.lgr.info(f"Handling #tenures: {len(tenures)}")
+        self.lgr.info("Handling #tenures: %s", len(tenures))
 
         officer_key = attrgetter("officer_id")
         officer_groups = groupby(sorted(tenures, key=officer_key), key=officer_key)
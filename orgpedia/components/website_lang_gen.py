@@ -3,10 +3,9 @@ import copy
 import datetime
 import functools
 import json
-import logging
 import string
 import sys
-from collections import Counter
+from collections import Counter, namedtuple
 from itertools import groupby
 from operator import attrgetter, itemgetter
 from pathlib import Path
@@ -18,6 +17,13 @@ from more_itertools import first, flatten
 
 from orgpedia.extracts.orgpedia import Order, Tenure
 
+from ..tools.json_template import JsonTemplate
+from ..tools.lang_runtime import get_run_languages, load_lang_bundles
+from ..tools.lang_view import LangView
+from ..tools.log_utils import close_log, get_logger, open_log
+from ..tools.timeline import DateTimeline
+from ..tools.timing import timed, timed_phase
+
 # from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 # TODO
@@ -74,6 +80,12 @@ ROLE_SENIORITY = [
     'Minister of State',
     'Deputy Minister',
 ]
+ROLE_RANK = dict((r, idx) for (idx, r) in enumerate(ROLE_SENIORITY))
+DEFAULT_ROLE = 'Cabinet Minister'
+UNKNOWN_DEPT_RANK = 1000
+
+# sort and group keys of a tenure, parsed once from its role and post_id
+TenureKey = namedtuple('TenureKey', ['role', 'dept', 'role_rank', 'dept_rank', 'ministry'])
 
 KEY_DEPTS = [
     'Ministry of Home Affairs',
@@ -82,40 +94,33 @@ KEY_DEPTS = [
     'Ministry of Finance',
     'Ministry of Railways',
 ]
-DIGIT_LANG_DICT = {}
-TODATE_DICT = {}  # Ugliness
-
 RUN_START_DATE = datetime.date(year=1947, month=8, day=15)
 RUN_END_DATE = datetime.date(year=2024, month=12, day=25)
 
 
-def format_lang_date(dt, lang, pattern_str):
+def format_lang_date(dt, bundle, pattern_str):
     if dt == "to_date" or dt >= RUN_END_DATE:
-        return TODATE_DICT[lang]
+        return bundle.to_date
+    return bundle.format_date(dt, pattern_str)
 
-    loc_lang = 'kok' if lang == 'gom' else ('hi' if lang == 'sd' else lang)
-    from babel.dates import format_date
 
-    dt_str = format_date(dt, format=pattern_str, locale=loc_lang)
-    # digits are not translated by babel
-
-    lang_dt_str = []
-    for c in dt_str:
-        if c.isdigit():
-            lang_dt_str.append(str(DIGIT_LANG_DICT[c][lang]))
-        else:
-            lang_dt_str.append(c)
-    return ''.join(lang_dt_str)
+def build_lang_dates(date_patterns, bundles):
+    """Format all (dates, pattern_strs) pairs with all the bundles, the bundles cache them."""
+    for bundle in bundles:
+        for (dates, pattern_strs) in date_patterns:
+            for pattern_str in pattern_strs:
+                for dt in dates:
+                    if dt != "to_date" and dt < RUN_END_DATE:
+                        bundle.format_date(dt, pattern_str)
 
 
-def lang_year(dt, lang):
+def lang_year(dt, bundle):
     # if lang == 'en':
     #     return str(dt)
 
     if dt == "to_date" or dt >= RUN_END_DATE.year:
-        return TODATE_DICT[lang]
-    else:
-        return ''.join(DIGIT_LANG_DICT[c][lang] for c in str(dt))
+        return bundle.to_date
+    return bundle.format_year(dt)
 
 
 class LabelsInfo:
@@ -126,7 +131,7 @@ class LabelsInfo:
 
 
 class MinistryInfo:
-    def __init__(self, yml_dict):
+    def __init__(self, yml_dict, lang_bundles):
         self.name = yml_dict['name']
 
         e = yml_dict['end_date']
@@ -135,7 +140,7 @@ class MinistryInfo:
         self.prime_name = yml_dict['pm']
         self.pm_id = yml_dict['pm_officer_id']
         self.deputy_pms = yml_dict.get('deputy_pms', [])
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
         for deputy_pm in self.deputy_pms:
             deputy_pm['start_date'] = parser.parse(deputy_pm['start_date']).date()
             de = deputy_pm['end_date']
@@ -151,8 +156,8 @@ class MinistryInfo:
 
     @property
     def period_str(self):
-        s_date_str = format_lang_date(self.start_date, self.lang, 'd MMMM YYYY')
-        e_date_str = format_lang_date(self.end_date, self.lang, 'd MMMM YYYY')
+        s_date_str = format_lang_date(self.start_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
+        e_date_str = format_lang_date(self.end_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
         return f'{s_date_str} - {e_date_str}'
 
     def has_date(self, dt):
@@ -206,7 +211,7 @@ class OfficerGroupInfo:
 
 
 class OfficerInfo:
-    def __init__(self, yml_dict, officer_idx):
+    def __init__(self, yml_dict, officer_idx, lang_bundles):
         assert officer_idx != 0
         self.officer_id = yml_dict["officer_id"]
         self.image_url = yml_dict.get("image_url", "")
@@ -223,7 +228,7 @@ class OfficerInfo:
         self.prime_tenure_date_pairs = []
         self.deputy_tenure_date_pairs = []
         self.crumbs = []
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
         self.url_name = self.abbr_name.replace(' ', '_')
         self.url = f'o-{self.url_name}.html'
 
@@ -264,14 +269,14 @@ class OfficerInfo:
 
     @property
     def prime_tenure_str(self):
-        dps, l = self.prime_tenure_date_pairs, self.lang
-        lang_pairs = [f'{lang_year(s, l)} - {lang_year(e, l)}' for (s, e) in dps]
+        dps, b = self.prime_tenure_date_pairs, self.lang_bundles[self.lang]
+        lang_pairs = [f'{lang_year(s, b)} - {lang_year(e, b)}' for (s, e) in dps]
         return ', '.join(lang_pairs)
 
     @property
     def deputy_tenure_str(self):
-        dps, l = self.deputy_tenure_date_pairs, self.lang
-        lang_pairs = [f'{lang_year(s, l)} - {lang_year(e, l)}' for (s, e) in dps]
+        dps, b = self.deputy_tenure_date_pairs, self.lang_bundles[self.lang]
+        lang_pairs = [f'{lang_year(s, b)} - {lang_year(e, b)}' for (s, e) in dps]
         return ', '.join(lang_pairs)
 
     @property
@@ -313,57 +318,57 @@ class PostInfo:
 
 
 class ManagerInfo:
-    def __init__(self, full_name, url, image_url, role, start_date, end_date):
+    def __init__(self, full_name, url, image_url, role, start_date, end_date, lang_bundles):
         self.full_name = full_name
         self.url = url
         self.image_url = image_url
         self.role = role
         self.start_date = start_date
         self.end_date = end_date
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
         self.border = ''
         self.top_margin = ''
 
     @classmethod
     def build(cls, officer_info, tenure):
         o, t = officer_info, tenure
-        return ManagerInfo(o.full_name, o.url, o.image_url, t.role, t.start_date, t.end_date)
+        return ManagerInfo(o.full_name, o.url, o.image_url, t.role, t.start_date, t.end_date, o.lang_bundles)
 
     @classmethod
     def build_pm(cls, ministry, url, image_url):
         s, e = ministry.start_date, ministry.end_date
-        return ManagerInfo(ministry.prime_name, url, image_url, 'Prime Minister', s, e)
+        return ManagerInfo(ministry.prime_name, url, image_url, 'Prime Minister', s, e, ministry.lang_bundles)
 
     @property
     def start_date_str(self):
-        return format_lang_date(self.start_date, self.lang, 'd MMMM YYYY')
+        return format_lang_date(self.start_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
 
     @property
     def end_date_str(self):
-        return format_lang_date(self.end_date, self.lang, 'd MMMM YYYY')
+        return format_lang_date(self.end_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
 
 
 class KeyInfo:
-    def __init__(self, dept, role, tenure_dates):
+    def __init__(self, dept, role, tenure_dates, lang_bundles):
         self.dept = dept
         self.role = role
         self.tenure_dates = tenure_dates
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
 
     @property
     def tenure_str(self):
         if isinstance(self.tenure_dates, tuple):
-            smy = format_lang_date(self.tenure_dates[0], self.lang, 'MMMM YYYY')
-            emy = format_lang_date(self.tenure_dates[1], self.lang, 'MMMM YYYY')
+            smy = format_lang_date(self.tenure_dates[0], self.lang_bundles[self.lang], 'MMMM YYYY')
+            emy = format_lang_date(self.tenure_dates[1], self.lang_bundles[self.lang], 'MMMM YYYY')
             return f'{smy} - {emy}'
         else:
-            dps, l = self.tenure_dates, self.lang
-            lang_pairs = [f'{lang_year(s, l)} - {lang_year(e, l)}' for (s, e) in dps]
+            dps, b = self.tenure_dates, self.lang_bundles[self.lang]
+            lang_pairs = [f'{lang_year(s, b)} - {lang_year(e, b)}' for (s, e) in dps]
             return ', '.join(lang_pairs)
 
 
 class TenureInfo:
-    def __init__(self, tenure, post, start_order_url, end_order_url, all_orderid_detailidxs):
+    def __init__(self, tenure, post, start_order_url, end_order_url, all_orderid_detailidxs, lang_bundles):
         self.tenure = tenure
         self._dept = post.dept
         self._role = tenure.role if tenure.role else "Cabinet Minister"
@@ -373,7 +378,7 @@ class TenureInfo:
         self.manager_infos = []  # always will have 3, check manager_infos_count
         self.tenure_pos = -1
         self.all_orderid_detailidxs = all_orderid_detailidxs
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
 
     @property
     def tenure_idx(self):
@@ -395,30 +400,30 @@ class TenureInfo:
     @property
     def start_month_year(self):
         # return self.tenure.start_date.strftime("%b %Y")
-        return format_lang_date(self.tenure.start_date, self.lang, 'MMMM YYYY')
+        return format_lang_date(self.tenure.start_date, self.lang_bundles[self.lang], 'MMMM YYYY')
 
     @property
     def end_month_year(self):
         # return self.tenure.end_date.strftime("%b %Y")
-        return format_lang_date(self.tenure.end_date, self.lang, 'MMMM YYYY')
+        return format_lang_date(self.tenure.end_date, self.lang_bundles[self.lang], 'MMMM YYYY')
 
     @property
     def start_date_str(self):
         # return self.tenure.start_date.strftime("%d %b %Y")
-        return format_lang_date(self.tenure.start_date, self.lang, 'd MMMM YYYY')
+        return format_lang_date(self.tenure.start_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
 
     @property
     def end_date_str(self):
-        return format_lang_date(self.tenure.end_date, self.lang, 'd MMMM YYYY')
+        return format_lang_date(self.tenure.end_date, self.lang_bundles[self.lang], 'd MMMM YYYY')
 
     @property
     def start_year(self):
-        return lang_year(self.tenure.start_date.year, self.lang)
+        return lang_year(self.tenure.start_date.year, self.lang_bundles[self.lang])
 
     @property
     def end_year(self):
         end_year = "to_date" if self.tenure.end_date == "to_date" else self.tenure.end_date.year
-        return lang_year(end_year, self.lang)
+        return lang_year(end_year, self.lang_bundles[self.lang])
 
     @property
     def start_order_id(self):
@@ -433,7 +438,7 @@ PAGEURL = "/Users/mukund/orgpedia/cabsec/import/html/"
 
 
 class OrderInfo:
-    def __init__(self, order, details, ministry, ministry_start_date, ministry_end_date, num_pages):
+    def __init__(self, order, details, ministry, ministry_start_date, ministry_end_date, num_pages, lang_bundles):
         def get_image_url(idx):
             idx += 1
             # return f'{PAGEURL}{order.order_id.replace(".pdf","")}/svg-{idx:03d}.svg'
@@ -457,7 +462,7 @@ class OrderInfo:
         self.ministry_start_date = ministry_start_date
         self.ministry_end_date = ministry_end_date
         self.num_pages = num_pages
-        self.lang = 'en'
+        self.lang, self.lang_bundles = 'en', lang_bundles
         self.url = f"order-{order.order_id}.html"
 
         self.images = [get_image_url(idx) for idx in range(num_pages)]
@@ -488,7 +493,7 @@ class OrderInfo:
 
     @property
     def num_detailed_pages(self):
-        return lang_year(len(self.page_details_dict), self.lang)
+        return lang_year(len(self.page_details_dict), self.lang_bundles[self.lang])
 
     @property
     def order_id(self):
@@ -505,11 +510,11 @@ class OrderInfo:
     @property
     def date_str(self):
         # return self.order.date.strftime("%d %b %Y")
-        return format_lang_date(self.order.date, self.lang, 'd MMMM YYYY')
+        return format_lang_date(self.order.date, self.lang_bundles[self.lang], 'd MMMM YYYY')
 
     @property
     def short_date_str(self):
-        return format_lang_date(self.order.date, self.lang, 'd MMM yyyy')
+        return format_lang_date(self.order.date, self.lang_bundles[self.lang], 'd MMM yyyy')
 
     # @property
     # def url(self):
@@ -521,7 +526,8 @@ class OrderInfo:
 
     def get_ministry_years_str(self, lang='en'):
         if self.ministry_start_date:
-            return f'{lang_year(self.ministry_start_date.year, lang)}-{lang_year(self.ministry_end_date.year, lang)}'
+            b = self.lang_bundles[lang]
+            return f'{lang_year(self.ministry_start_date.year, b)}-{lang_year(self.ministry_end_date.year, b)}'
         else:
             return ''
 
@@ -530,6 +536,46 @@ class OrderInfo:
         return self._num_details
 
 
+class OrderSummary:
+    """The fields of an OrderInfo shown in the order listings, without its details."""
+
+    def __init__(self, order_info):
+        o = order_info
+        self.order_id, self.order_number, self.url = o.order_id, o.order.number, o.url
+        self.date, self.category, self._num_details = o.date, o.category, o._num_details
+        self.ministry = o.ministry
+        self.ministry_start_date, self.ministry_end_date = o.ministry_start_date, o.ministry_end_date
+        self.first_image_url, self.first_svg_url = o.first_image_url, o.first_svg_url
+        self._num_detailed_pages = len(o.page_details_dict)
+        self.lang, self.lang_bundles = 'en', o.lang_bundles
+
+    def __getattr__(self, name):
+        # only called for missing attributes, a listing field not copied from OrderInfo fails loudly
+        raise AttributeError(f"OrderSummary has no field '{name}', copy it from OrderInfo in OrderSummary.__init__")
+
+    @property
+    def date_str(self):
+        return format_lang_date(self.date, self.lang_bundles[self.lang], 'd MMMM YYYY')
+
+    @property
+    def short_date_str(self):
+        return format_lang_date(self.date, self.lang_bundles[self.lang], 'd MMM yyyy')
+
+    @property
+    def num_details(self):
+        return self._num_details
+
+    @property
+    def num_detailed_pages(self):
+        return lang_year(self._num_detailed_pages, self.lang_bundles[self.lang])
+
+    @property
+    def url_name(self):
+        return f"http://cabsec.gov.in/{self.order_id}"
+
+    get_ministry_years_str = OrderInfo.get_ministry_years_str
+
+
 # VERB_CLASS= "text-base font-semibold leading-5" # a-a
 # DEPT_CLASS= "text-sm font-normal leading-4" # a-b
 
@@ -861,31 +907,6 @@ class CabinetInfo:
     #         minister['long_post_str'] = '\n'.join(post_strs[3:])
 
 
-LANG_CODES = [
-    'as',
-    'bn',
-    'brx',
-    'doi',
-    'gu',
-    'hi',
-    'kn',
-    'ks',
-    'gom',
-    'mai',
-    'mni',
-    'ml',
-    'mr',
-    'ne',
-    'or',
-    'pa',
-    'sa',
-    'sat',
-    'sd',
-    'ta',
-    'te',
-    'ur',
-    'en',
-]
 # LANG_CODES = [ 'en', 'hi']
 
 
@@ -925,7 +946,6 @@ class WebsiteLanguageGenerator:
         self.officer_info_files = officer_info_files
         self.ministry_path = Path(ministry_file)
         self.output_dir = Path(output_dir)
-        self.languages = languages
         self.translation_file = Path(translation_file)
         self.post_infos_path = Path(post_infos_file)
         self.tenures_file = Path(tenures_file)
@@ -937,28 +957,25 @@ class WebsiteLanguageGenerator:
             self.depts.append('')
         else:
             self.depts = []
+        self.dept_rank = dict((d, idx) for (idx, d) in reversed(list(enumerate(self.depts))))
+        self.tenure_key_dict = {}
 
-        ### TODO CHANGE THIS, to read from input file
-        self.languages = LANG_CODES
-        # self.languages = ['en', 'hi']
-
-        self.officer_info_dict = self.get_officer_infos(self.officer_info_files)
-        print(f"#Officer_info: {len(self.officer_info_dict)}")
-
-        # self.officer_idx_dict = dict((o.officer_idx, o.officer_id) for o in self.officer_info_dict.values())
+        self.languages = get_run_languages(languages)
 
         if self.translation_file.exists():
             self.translations = yaml.load(self.translation_file.read_text(), Loader=yaml.FullLoader)
         else:
             self.translations = {}
 
-        global DIGIT_LANG_DICT
-        DIGIT_LANG_DICT = self.translations['digits']
+        # the info objects format their dates and years with the bundles of this generator
+        languages = self.languages + ['en'] if 'en' not in self.languages else self.languages
+        self.lang_bundles = load_lang_bundles(self.translations, languages)
+        self.lang_label_info_dict = self.build_lang_label_infos(self.lang_bundles)
 
-        self.lang_label_info_dict = self.build_lang_label_infos(self.translations['labels'])
+        self.officer_info_dict = self.get_officer_infos(self.officer_info_files)
+        print(f"#Officer_info: {len(self.officer_info_dict)}")
 
-        global TODATE_DICT
-        TODATE_DICT = dict((lang, getattr(ld, 'to_date')) for (lang, ld) in self.lang_label_info_dict.items())
+        # self.officer_idx_dict = dict((o.officer_idx, o.officer_id) for o in self.officer_info_dict.values())
 
         self.post_dict = {}
         self.order_dict = {}
@@ -977,6 +994,8 @@ class WebsiteLanguageGenerator:
             self.ministry_infos = self.build_ministryinfos(min_dict)
         else:
             self.ministry_infos = []
+        ministry_dates = [(m.start_date, m.end_date) for m in self.ministry_infos]
+        self.ministry_timeline = DateTimeline(ministry_dates, self.ministry_infos)
 
         self.template_dir = Path("conf") / Path("templates") / Path(template_stub)
 
@@ -989,12 +1008,7 @@ class WebsiteLanguageGenerator:
             lstrip_blocks=True,
         )
 
-        self.lgr = logging.getLogger(__name__)
-        self.lgr.setLevel(logging.DEBUG)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(stream_handler)
-        self.file_handler = None
+        self.lgr = get_logger(__name__)
         self.curr_tenure_idx = 0
 
     def has_ministry(self):
@@ -1003,14 +1017,10 @@ class WebsiteLanguageGenerator:
     def add_log_handler(self):
         handler_name = f"{self.conf_stub}.log"
         log_path = Path("logs") / handler_name
-        self.file_handler = logging.FileHandler(log_path, mode="w")
-        self.file_handler.setLevel(logging.DEBUG)
-        self.lgr.addHandler(self.file_handler)
+        open_log(self.lgr, log_path)
 
     def remove_log_handler(self):
-        self.file_handler.flush()
-        self.lgr.removeHandler(self.file_handler)
-        self.file_handler = None
+        close_log(self.lgr)
 
     def get_officer_infos(self, officer_info_files):
         result_dict = {}
@@ -1024,7 +1034,10 @@ class WebsiteLanguageGenerator:
             else:
                 info_dict = json.loads(o_path.read_text())
 
-            info_dict = dict((d["officer_id"], OfficerInfo(d, idx + 1)) for idx, d in enumerate(info_dict["officers"]))
+            info_dict = dict(
+                (d["officer_id"], OfficerInfo(d, idx + 1, self.lang_bundles))
+                for idx, d in enumerate(info_dict["officers"])
+            )
             result_dict = {**result_dict, **info_dict}
             print(f"\t{officer_info_file} {len(info_dict)} {len(result_dict)}")
         return result_dict
@@ -1058,92 +1071,110 @@ class WebsiteLanguageGenerator:
         return self.translations[field][text][lang]
 
     def translate_postinfo(self, post_info, lang):
-        p, l = post_info, copy.copy(post_info)
-        for field in ['dept', 'role', 'juri', 'loca', 'stat']:
-            text = getattr(p, field)
-            if text:
-                setattr(l, field, self.translate_post_field(field, text, lang))
-        return l
+        p = post_info
+        fields = ['dept', 'role', 'juri', 'loca', 'stat']
+        l_fields = dict((f, self.translate_post_field(f, getattr(p, f), lang)) for f in fields if getattr(p, f))
+        return LangView(p, lang, **l_fields)
 
     def translate_digits(self, digts_str, lang):
-        l_digits = []
-        for c in digts_str:
-            if c.isdigit():
-                l_digits.append(self.translations['digits'][c][lang])
-            else:
-                l_digits.append(c)
-        return ''.join(l_digits)
+        return self.lang_bundles[lang].translate_digits(digts_str)
 
     def translate_keyinfo(self, key_info, lang):
-        k, l = key_info, copy.copy(key_info)
-        l.dept = self.translate_post_field('dept', k.dept, lang)
-        l.role = self.translate_post_field('role', k.role, lang)
-        l.lang = lang
-        return l
+        k = key_info
+        l_dept = self.translate_post_field('dept', k.dept, lang)
+        l_role = self.translate_post_field('role', k.role, lang)
+        return LangView(k, lang, dept=l_dept, role=l_role)
 
     def translate_managerinfo(self, manager_info, lang):
-        m, l = manager_info, copy.copy(manager_info)
-        l.full_name = self.translate_name(m.full_name, lang)
-        l.role = self.translate_post_field('role', m.role, lang)
-        l.lang = lang
-        return l
+        m = manager_info
+        l_full_name = self.translate_name(m.full_name, lang)
+        l_role = self.translate_post_field('role', m.role, lang)
+        return LangView(m, lang, full_name=l_full_name, role=l_role)
 
     def translate_tenureinfo(self, tenure_info, lang):
-        t, l = tenure_info, copy.copy(tenure_info)
-        l._dept = self.translate_post_field('dept', t.dept, lang)
-        l._role = self.translate_post_field('role', t.role, lang)
-        # l.post = self.translate_postinfo(t.post, lang)
-        l.manager_infos = [self.translate_managerinfo(m, lang) for m in t.manager_infos]
-
-        l.all_orderid_detailidxs = []
-        for (o_id, category, d_idx, short_date_str) in t.all_orderid_detailidxs:
-            o_info = self.order_info_dict[o_id]
-            l_category = self.translate_label(category, lang)
-            l_short_date_str = format_lang_date(o_info.order.date, lang, 'd MMM yyyy')
-            l.all_orderid_detailidxs.append((o_id, l_category, d_idx, l_short_date_str))
-        l.lang = lang
-        return l
+        t = tenure_info
+
+        def all_orderid_detailidxs():
+            l_orderid_detailidxs = []
+            for (o_id, category, d_idx, short_date_str) in t.all_orderid_detailidxs:
+                o_info = self.order_info_dict[o_id]
+                l_category = self.translate_label(category, lang)
+                l_short_date_str = format_lang_date(o_info.order.date, self.lang_bundles[lang], 'd MMM yyyy')
+                l_orderid_detailidxs.append((o_id, l_category, d_idx, l_short_date_str))
+            return l_orderid_detailidxs
+
+        return LangView(
+            t,
+            lang,
+            _dept=lambda: self.translate_post_field('dept', t.dept, lang),
+            _role=lambda: self.translate_post_field('role', t.role, lang),
+            manager_infos=lambda: [self.translate_managerinfo(m, lang) for m in t.manager_infos],
+            all_orderid_detailidxs=all_orderid_detailidxs,
+        )
 
     def translate_tenureinfos(self, tenure_infos, lang):
         return [self.translate_tenureinfo(t, lang) for t in tenure_infos]
 
+    @timed_phase("translation")
     def translate_officerinfo(self, officer_info, lang):
-        o, l = officer_info, copy.copy(officer_info)
-
-        l._first_tenure = None
-        l._first_ministry = None
-        l.lang = lang
-
-        l.full_name = self.translate_name(o.full_name, lang)
-        l.key_infos = [self.translate_keyinfo(t, lang) for t in o.key_infos]
-
-        l.ministries = dict(
-            (self.translate_ministry(m, lang), self.translate_tenureinfos(ts, lang)) for m, ts in o.ministries.items()
+        o = officer_info
+
+        def ministries():
+            m_items = o.ministries.items()
+            return dict((self.translate_ministry(m, lang), self.translate_tenureinfos(ts, lang)) for m, ts in m_items)
+
+        return LangView(
+            o,
+            lang,
+            _first_tenure=None,
+            _first_ministry=None,
+            full_name=lambda: self.translate_name(o.full_name, lang),
+            key_infos=lambda: [self.translate_keyinfo(t, lang) for t in o.key_infos],
+            ministries=ministries,
         )
-        return l
 
     def translate_detailinfo(self, detail_info, lang):
-        d, l = detail_info, copy.copy(detail_info)
-        l.name = self.translate_name(d.name, lang)
-
-        l.postinfo_dict = {}
-        for (pType, posts) in d.postinfo_dict.items():
-            l_posts = [self.translate_postinfo(p, lang) for p in posts]
-            l_pType = self.translate_label(pType, lang)
-            l.postinfo_dict[l_pType] = l_posts
-
-        l.short_post_str, l.long_post_str = l.get_all_html_post_str()
+        d = detail_info
+
+        def postinfo_dict():
+            l_postinfo_dict = {}
+            for (pType, posts) in d.postinfo_dict.items():
+                l_posts = [self.translate_postinfo(p, lang) for p in posts]
+                l_pType = self.translate_label(pType, lang)
+                l_postinfo_dict[l_pType] = l_posts
+            return l_postinfo_dict
+
+        l = LangView(
+            d,
+            lang,
+            name=lambda: self.translate_name(d.name, lang),
+            postinfo_dict=postinfo_dict,
+            short_post_str=lambda: l.get_all_html_post_str()[0],
+            long_post_str=lambda: l.get_all_html_post_str()[1],
+        )
         return l
 
+    @timed_phase("translation")
     def translate_orderinfo(self, order_info, lang):
-        o, l = order_info, copy.copy(order_info)
-        l.ministry = self.translate_ministry(o.ministry, lang)
-        l.category = self.translate_label(o.category, lang)
+        o = order_info
+        return LangView(
+            o,
+            lang,
+            ministry=lambda: self.translate_ministry(o.ministry, lang),
+            category=lambda: self.translate_label(o.category, lang),
+            details=lambda: [self.translate_detailinfo(d, lang) for d in o.details],
+            _num_details=lambda: self.translate_digits(str(o._num_details), lang),
+        )
 
-        l.details = [self.translate_detailinfo(d, lang) for d in o.details]
-        l._num_details = self.translate_digits(str(o._num_details), lang)
-        l.lang = lang
-        return l
+    def translate_ordersummary(self, order_summary, lang):
+        o = order_summary
+        return LangView(
+            o,
+            lang,
+            ministry=lambda: self.translate_ministry(o.ministry, lang),
+            category=lambda: self.translate_label(o.category, lang),
+            _num_details=lambda: self.translate_digits(str(o._num_details), lang),
+        )
 
     def translate_cabinetinfo(self, cabinet_info, lang):
         def t_dept(dept):
@@ -1159,34 +1190,45 @@ class WebsiteLanguageGenerator:
             pStr = f'<p class=a-b>{pStr}</p>'
             return pStr
 
-        c, l = cabinet_info, copy.copy(cabinet_info)
-        l.lang = lang
-
-        l.name = self.translate_ministry(c.name, lang)
-        l_sorted_ministers = []
-        for m in c.sorted_ministers:
-            l_m = {}
-            l_m['name'] = self.translate_name(m['name'], lang)
-            l_m['url'] = m['url']
-            l_m['image_url'] = m['image_url']
-            posts = [get_post_str(d, r) for (d, r) in m['posts']]
-            l_m['short_post_str'] = ''.join(posts[:3])
-            l_m['long_post_str'] = ''.join(posts[3:])
-            l_sorted_ministers.append(l_m)
-        l.sorted_ministers = l_sorted_ministers
-        l.key_info = [(self.translate_name(n, lang), t_dept(d)) for (n, d) in c.key_info]
-        l.composition = [(t_role(r), self.translate_digits(str(c), lang)) for (r, c) in c.composition if c > 0]
-        return l
+        def sorted_ministers():
+            l_sorted_ministers = []
+            for m in c.sorted_ministers:
+                l_m = {}
+                l_m['name'] = self.translate_name(m['name'], lang)
+                l_m['url'] = m['url']
+                l_m['image_url'] = m['image_url']
+                posts = [get_post_str(d, r) for (d, r) in m['posts']]
+                l_m['short_post_str'] = ''.join(posts[:3])
+                l_m['long_post_str'] = ''.join(posts[3:])
+                l_sorted_ministers.append(l_m)
+            return l_sorted_ministers
+
+        c = cabinet_info
+        return LangView(
+            c,
+            lang,
+            name=lambda: self.translate_ministry(c.name, lang),
+            sorted_ministers=sorted_ministers,
+            key_info=lambda: [(self.translate_name(n, lang), t_dept(d)) for (n, d) in c.key_info],
+            composition=lambda: [(t_role(r), self.translate_digits(str(c), lang)) for (r, c) in c.composition if c > 0],
+        )
 
     def translate_months(self, lang):
-        from babel.dates import format_date
-        def get_month(month_idx):
-            dt = datetime.date(year=2022, month=month_idx, day=1)
-            dt_str = format_date(dt, format='d MMMM YYYY', locale=loc_lang)
-            return dt_str.split()[1]
-
-        loc_lang = 'kok' if lang == 'gom' else ('hi' if lang == 'sd' else lang)
-        return [''] + [get_month(m) for m in range(1, 13)]
+        return list(self.lang_bundles[lang].months)
+
+    @timed_phase("lang_dates")
+    def build_lang_dates(self, orders, tenures):
+        languages = self.languages + ['en'] if 'en' not in self.languages else self.languages
+        order_dates = set(o.date for o in orders)
+        tenure_dates = set(flatten((t.start_date, t.end_date) for t in tenures))
+        ministry_dates = set(flatten((m.start_date, m.end_date) for m in self.ministry_infos))
+
+        date_patterns = [
+            (order_dates, ['d MMMM YYYY', 'd MMM yyyy']),
+            (tenure_dates, ['d MMMM YYYY', 'MMMM YYYY']),
+            (ministry_dates, ['d MMMM YYYY']),
+        ]
+        build_lang_dates(date_patterns, [self.lang_bundles[lang] for lang in languages])
 
     def translate_idx2str(self, idx2str, lang):
         def t_dept(dept):
@@ -1200,36 +1242,21 @@ class WebsiteLanguageGenerator:
         l_idx2str['dept'] = [t_dept(d) for d in idx2str['dept']]
         l_idx2str['role'] = [t_role(r) for r in idx2str['role']]
         l_idx2str['mini'] = [self.translate_ministry(m, lang) for m in idx2str['mini']]
-        l_idx2str['digits'] = [self.translations['digits'][c][lang] for c in idx2str['digits']]
+        l_idx2str['digits'] = [self.lang_bundles[lang].digits[c] for c in idx2str['digits']]
         l_idx2str['months'] = self.translate_months(lang)
         return l_idx2str
 
-    def build_lang_label_infos(self, labels_trans_dict):
-        labels = [l for l in labels_trans_dict.keys()]
-        labels = [l.replace(',', '').replace(' ', '_').lower() for l in labels]
-
-        languages = self.languages + ['en'] if 'en' not in self.languages else self.languages  # noqa F841
-
-        init_dicts = dict((lang, {}) for lang in languages)
-
-        for (attr, label) in zip(labels, labels_trans_dict.keys()):
-            for lang in languages:
-                init_dicts[lang][attr] = labels_trans_dict[label][lang]
-
-        label_info_dict = {}
-        for (lang, init_dict) in init_dicts.items():
-            label_info_dict[lang] = LabelsInfo(init_dict, lang)
-
-        return label_info_dict
+    def build_lang_label_infos(self, lang_bundles):
+        return dict((lang, LabelsInfo(bundle.labels, lang)) for (lang, bundle) in lang_bundles.items())
 
     def build_ministryinfos(self, ministry_yml):
-        return [MinistryInfo(m) for m in ministry_yml["ministries"]]
+        return [MinistryInfo(m, self.lang_bundles) for m in ministry_yml["ministries"]]
 
     def build_keyinfo(self, tenure):
         post = self.post_dict[tenure.post_id]
         tenure_dates = (tenure.start_date, tenure.end_date)
         role = tenure.role if tenure.role else 'Cabinet Minister'
-        return KeyInfo(post.dept, role, tenure_dates)
+        return KeyInfo(post.dept, role, tenure_dates, self.lang_bundles)
 
     def build_tenureinfo(self, tenure):
         post = self.post_dict[tenure.post_id]
@@ -1247,7 +1274,7 @@ class WebsiteLanguageGenerator:
             [o_id, o_dict[o_id].category, d_idx, o_dict[o_id].short_date_str]
             for (o_id, d_idx) in tenure.all_order_infos
         ]
-        return TenureInfo(tenure, post, start_url, end_url, oid_didxs)
+        return TenureInfo(tenure, post, start_url, end_url, oid_didxs, self.lang_bundles)
 
     def populate_manager_infos(self, officer_info):
         all_tenure_infos = flatten(officer_info.ministries.values())
@@ -1293,32 +1320,35 @@ class WebsiteLanguageGenerator:
 
         # end
 
-    def get_tenure_jsons(self, officer_info):
+    def get_tenure_jsons(self, officer_info, slot=None):
+        # values that change with the language are wrapped with slot, see JsonTemplate
+        slot = slot if slot else (lambda v: v)
+
         tenure_jsons = []
         for (ministry_idx, (ministry, tenures)) in enumerate(officer_info.ministries.items()):
             for tenure_info in tenures:
-                t_json = {'ministry': ministry}
+                t_json = {'ministry': slot(ministry)}
                 t_json['tenure_start_date_idx'] = f'{tenure_info.tenure_start_date_idx}'
                 t_json['tenure_idx'] = f'{tenure_info.tenure_idx}'
                 t_json['ministry_idx'] = ministry_idx
-                t_json['dept'] = f'{tenure_info.dept}'
-                t_json['role'] = f'{tenure_info.role}'
-                t_json['date_str'] = f'{tenure_info.start_date_str} - {tenure_info.end_date_str}'
+                t_json['dept'] = slot(f'{tenure_info.dept}')
+                t_json['role'] = slot(f'{tenure_info.role}')
+                t_json['date_str'] = slot(f'{tenure_info.start_date_str} - {tenure_info.end_date_str}')
                 t_json['start_order_id'] = tenure_info.start_order_id
                 t_json['end_order_id'] = tenure_info.end_order_id
                 t_json['start_order_url'] = tenure_info.start_order_url
                 t_json['end_order_url'] = tenure_info.end_order_url
                 t_json['manager_infos_count'] = tenure_info.manager_infos_count
-                t_json['all_orderid_detailidxs'] = tenure_info.all_orderid_detailidxs
+                t_json['all_orderid_detailidxs'] = slot(tenure_info.all_orderid_detailidxs)
 
                 t_json['manager_infos'] = []
                 for manager_info in tenure_info.manager_infos:
                     m_info = {
-                        'full_name': manager_info.full_name,
+                        'full_name': slot(manager_info.full_name),
                         'url': manager_info.url,
                         'image_url': manager_info.image_url,
-                        'role': manager_info.role,
-                        'date_str': f'{manager_info.start_date_str} - {manager_info.end_date_str}',
+                        'role': slot(manager_info.role),
+                        'date_str': slot(f'{manager_info.start_date_str} - {manager_info.end_date_str}'),
                     }
                     t_json['manager_infos'].append(m_info)
                 tenure_jsons.append(t_json)
@@ -1340,9 +1370,9 @@ class WebsiteLanguageGenerator:
         if self.has_ministry():
             m = self.get_ministry(order.date)
             assert m, f'Unknown {order.date} in {order.order_id}'
-            order_info = OrderInfo(order, details, m.name, m.start_date, m.end_date, num_pages)
+            order_info = OrderInfo(order, details, m.name, m.start_date, m.end_date, num_pages, self.lang_bundles)
         else:
-            order_info = OrderInfo(order, details, '', None, None, num_pages)
+            order_info = OrderInfo(order, details, '', None, None, num_pages, self.lang_bundles)
 
         return order_info
 
@@ -1394,8 +1424,7 @@ class WebsiteLanguageGenerator:
             detail_idx  = council_offi_didx_dict.get(m['officer_id'], 1000) # hope this suffices :)
             return (min_role_idx, detail_idx)
 
-        ministry = self.get_ministry(date)
-        ministry_idx = [idx for (idx, m) in enumerate(self.ministry_infos) if m.name == ministry.name][0]
+        ministry, ministry_idx = self.ministry_timeline.find(date)
         m_s, m_e = (ministry.start_date, ministry.end_date)
         ministry_date_idxs = [[m_s.year, m_s.month, m_s.day], [m_e.year, m_e.month, m_e.day]]
 
@@ -1463,12 +1492,6 @@ class WebsiteLanguageGenerator:
                     o_tenures.append(tenure)
             return s_idx, o_tenures
 
-        def get_prev_order(council_orders, tenure_date, idx):
-            for idx, order in enumerate(council_orders[idx:], idx):
-                if order.date > tenure_date:
-                    return council_orders[idx-1], (idx-1)
-            return council_orders[-1], len(council_orders) -1
-
         # build str2idx
         offi_dict = dict((oid, idx) for (idx, oid) in enumerate(self.officer_info_dict))
         dept_dict = dict((d, idx) for (idx, d) in enumerate(self.depts))
@@ -1498,10 +1521,12 @@ class WebsiteLanguageGenerator:
         council_orders = [o for o in self.order_dict.values() if o.category == 'Council of Ministers']
         print(f'Council_Orders: {len(council_orders)}')
 
-        prev_idx, date_council_orders = 0, []
+        # dates before the first council order get the last one, as the linear scan did
+        council_timeline = DateTimeline.from_start_dates(council_orders, [o.date for o in council_orders])
+        date_council_orders = []
         for tenure_date in all_dates:
-            prev_council_order, prev_idx = get_prev_order(council_orders, tenure_date, prev_idx)
-            date_council_orders.append(prev_council_order)
+            prev_council_order, _ = council_timeline.find(tenure_date)
+            date_council_orders.append(prev_council_order if prev_council_order else council_orders[-1])
 
         assert len(date_council_orders) == len(all_dates), f'{len(date_council_orders)} != {len(all_dates)}'
 
@@ -1536,6 +1561,7 @@ class WebsiteLanguageGenerator:
             else:
                 return self.output_dir / f"{entity}.html"
 
+    @timed_phase("template_render")
     def render_html(self, entity, obj, lang='en'):
         template = self.env.get_template(f"{entity}.html")
         # l_site_info = self.translate_siteinfo(self.site_info, lang)
@@ -1650,34 +1676,34 @@ class WebsiteLanguageGenerator:
             html_path.write_text(self.render_html("order", lang_order_info, lang))
 
     def get_ministry(self, dt):
-        ministry = first([m for m in self.ministry_infos if m.has_date(dt)], None)
+        ministry, _ = self.ministry_timeline.find(dt)
         return ministry
 
+    def build_tenure_key(self, tenure):
+        role = tenure.role if tenure.role else DEFAULT_ROLE
+        dept = tenure.post_id.split('>')[1] if '>' in tenure.post_id else None
+        dept_rank = self.dept_rank.get(dept, UNKNOWN_DEPT_RANK)
+        ministry = self.get_ministry(tenure.start_date).name if self.ministry_infos else "No Ministry"
+        return TenureKey(role, dept, ROLE_RANK[role], dept_rank, ministry)
+
+    def get_tenure_key(self, tenure):
+        tenure_key = self.tenure_key_dict.get(tenure.tenure_id, None)
+        if tenure_key is None:
+            tenure_key = self.build_tenure_key(tenure)
+            self.tenure_key_dict[tenure.tenure_id] = tenure_key
+        return tenure_key
+
     def gen_officer_page(self, officer_idx, officer_id, tenures):
         def seniority(tenure):
-            role_s = ROLE_SENIORITY.index(tenure.role if tenure.role else 'Cabinet Minister')
-            if '>' in tenure.post_id:
-                dept = tenure.post_id.split('>')[1]
-                dept_idx = self.depts.index(dept) if dept in self.depts else 1000
-            else:
-                dept_idx = 1000
-
-            return (role_s, dept_idx, -tenure.duration_days)
+            tenure_key = self.get_tenure_key(tenure)
+            return (tenure_key.role_rank, tenure_key.dept_rank, -tenure.duration_days)
 
         def role_dept(tenure):
-            role_s = ROLE_SENIORITY.index(tenure.role if tenure.role else 'Cabinet Minister')
-            if '>' in tenure.post_id:
-                dept = tenure.post_id.split('>')[1]
-                dept_idx = self.depts.index(dept) if dept in self.depts else 1000
-            else:
-                dept_idx = 1000
-            return (role_s, dept_idx)
+            tenure_key = self.get_tenure_key(tenure)
+            return (tenure_key.role_rank, tenure_key.dept_rank)
 
         def tenure_ministry(tenure):
-            if not self.ministry_infos:
-                return "No Ministry"
-            ministry = self.get_ministry(tenure.start_date)
-            return ministry.name
+            return self.get_tenure_key(tenure).ministry
 
         def merge_pairs(spans, span):
             if not spans:
@@ -1691,7 +1717,7 @@ class WebsiteLanguageGenerator:
             return spans
 
         tenures = sorted(tenures, key=attrgetter("start_date"))
-        self.lgr.info(f"Generating officer page: {officer_id} {len(tenures)}")
+        self.lgr.info("Generating officer page: %s %s", officer_id, len(tenures))
 
         if len(tenures) == 0:
             return
@@ -1707,10 +1733,11 @@ class WebsiteLanguageGenerator:
 
         key_infos = []
         if officer_info.prime_tenure_date_pairs:
-            key_infos.append(KeyInfo('', 'Prime Minister', officer_info.prime_tenure_date_pairs))
+            key_infos.append(KeyInfo('', 'Prime Minister', officer_info.prime_tenure_date_pairs, self.lang_bundles))
 
         if officer_info.deputy_tenure_date_pairs:
-            key_infos.append(KeyInfo('', 'Deputy Prime Minister', officer_info.deputy_tenure_date_pairs))
+            deputy_date_pairs = officer_info.deputy_tenure_date_pairs
+            key_infos.append(KeyInfo('', 'Deputy Prime Minister', deputy_date_pairs, self.lang_bundles))
 
         # key_tenures = sorted(tenures, key=seniority)[:3]
         # key_infos += [self.build_keyinfo(t) for t in key_tenures]
@@ -1718,17 +1745,16 @@ class WebsiteLanguageGenerator:
         tenures = sorted(tenures, key=role_dept)
         for (group_key, group_tenures) in groupby(tenures, key=role_dept):
             group_tenures = list(group_tenures)
-            tenure = group_tenures[0]
-            if '>' not in tenure.post_id:
+            tenure_key = self.get_tenure_key(group_tenures[0])
+            if tenure_key.dept is None:
                 continue
-            role = tenure.role if tenure.role else 'Cabinet Minister'
-            dept = tenure.post_id.split('>')[1]
+            role, dept = tenure_key.role, tenure_key.dept
             date_pairs = [
                 (t.start_date.year, t.end_date.year if t.end_date != "to_date" else "to_date") for t in group_tenures
             ]
             date_pairs = functools.reduce(merge_pairs, date_pairs, [])
 
-            key_infos.append(KeyInfo(dept, role, date_pairs))
+            key_infos.append(KeyInfo(dept, role, date_pairs, self.lang_bundles))
 
         officer_info.ministries = ministries
         officer_info.key_infos = key_infos[:3]
@@ -1736,9 +1762,12 @@ class WebsiteLanguageGenerator:
         # officer_info.officer_idx = officer_idx
 
         self.populate_manager_infos(officer_info)
-        officer_info.tenure_json_str = json.dumps(
-            self.get_tenure_jsons(officer_info), separators=(',', ':'), ensure_ascii=False
-        )  # , indent=2)
+
+        # the tenure json differs across languages only in the strings, encode the rest once
+        tenure_json = JsonTemplate(
+            functools.partial(self.get_tenure_jsons, officer_info), separators=(',', ':'), ensure_ascii=False
+        )
+        officer_info.tenure_json_str = tenure_json.fill(functools.partial(self.get_tenure_jsons, officer_info))
 
         html_path = self.get_html_path("o", officer_info.url_name)
         if not self.has_ministry():
@@ -1747,9 +1776,9 @@ class WebsiteLanguageGenerator:
         for lang in self.languages:
             html_path = self.get_html_path("o", officer_info.url_name, lang)
             lang_officer_info = self.translate_officerinfo(officer_info, lang)
-            lang_officer_info.tenure_json_str = json.dumps(
-                self.get_tenure_jsons(lang_officer_info), separators=(',', ':'), ensure_ascii=False
-            )  # , indent=2)
+            lang_officer_info.tenure_json_str = tenure_json.fill(
+                functools.partial(self.get_tenure_jsons, lang_officer_info)
+            )
             html_path.write_text(self.render_html("officer", lang_officer_info, lang))
 
     def gen_officers_page(self):
@@ -1780,12 +1809,12 @@ class WebsiteLanguageGenerator:
                 html_path.write_text(self.render_html("officers", lang_og_info, lang))
 
     def gen_orders_page(self):
-        def group_infos(order_infos):
-            infos = sorted(order_infos, key=attrgetter("ministry_start_date", "date"))
-            return [list(g) for k, g in groupby(infos, key=attrgetter("ministry_start_date"))]
+        def group_summaries(order_infos):
+            summaries = sorted(map(OrderSummary, order_infos), key=attrgetter("ministry_start_date", "date"))
+            return [list(g) for k, g in groupby(summaries, key=attrgetter("ministry_start_date"))]
 
-        en_order_infos = self.order_info_dict.values()
-        order_groups = group_infos(en_order_infos)
+        # the listings show only the summary fields, the orders' details are not translated
+        order_groups = group_summaries(self.order_info_dict.values())
 
         all_idxs = [g[0].get_ministry_years_str() for g in order_groups]
         all_ministries = [g[0].ministry for g in order_groups]
@@ -1803,7 +1832,7 @@ class WebsiteLanguageGenerator:
             all_lang_idxs = [g[0].get_ministry_years_str(lang) for g in order_groups]
             all_lang_ministries = [self.translate_ministry(m, lang) for m in all_ministries]
             for og in order_group_infos:
-                lang_infos = [self.translate_orderinfo(o, lang) for o in og.order_infos]
+                lang_infos = [self.translate_ordersummary(o, lang) for o in og.order_infos]
                 idx = lang_infos[0].get_ministry_years_str(lang)
                 en_idx = og.order_infos[0].get_ministry_years_str('en')
                 lang_og_info = OrderGroupInfo(lang_infos, idx, all_idxs, all_lang_idxs, all_lang_ministries)
@@ -1889,6 +1918,7 @@ class WebsiteLanguageGenerator:
         docs_file = self.output_dir / "docs.json"
         docs_file.write_text(json.dumps(docs, separators=(',', ':')))
 
+    @timed
     def pipe(self, docs, **kwargs):
         self.add_log_handler()
         # docs = list(docs)
@@ -1907,7 +1937,7 @@ class WebsiteLanguageGenerator:
         self.order_dict = dict((o.order_id, o) for o in orders)
         self.order_idx_dict = dict((o.order_id, i) for (i, o) in enumerate(orders))
 
-        self.lgr.info(f"Handling #orders: {len(orders)}")
+        self.lgr.info("Handling #orders: %s", len(orders))
 
         self.post_dict = dict((p.post_id, p) for o in orders for p in o.get_posts())
 
@@ -1917,10 +1947,12 @@ class WebsiteLanguageGenerator:
 
         self.tenures.sort(key=attrgetter("tenure_id"))
         self.tenure_dict = dict((t.tenure_id, t) for t in self.tenures)
+        self.tenure_key_dict = dict((t.tenure_id, self.build_tenure_key(t)) for t in self.tenures)
+        self.build_lang_dates(orders, self.tenures)
 
         # assert [t.tenure_idx for t in self.tenures] == list(range(len(self.tenures)))
 
-        self.lgr.info(f"Handling #tenures: {len(self.tenures)}")
+        self.lgr.info("Handling #tenures: %s", len(self.tenures))
 
         if self.has_ministry():
             self.gen_cabinet_page(self.tenures)
@@ -3,6 +3,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Type, Union
 
+import pydantic
 import yaml
 from docint.data_error import DataError
 from docint.region import Region
@@ -10,6 +11,10 @@ from docint.span import Span
 from more_itertools import flatten
 from pydantic import BaseModel
 
+from ..tools.file_cache import load_cached
+
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)  # libyaml when it is available
+
 
 class IncorrectOfficerNameError(DataError):
     pass
@@ -612,17 +617,21 @@ class OfficerID(BaseModel):
 
     @classmethod
     def from_disk(self, json_file):
+        def load_officers(file_bytes):
+            if json_file.suffix.lower() in (".json", ".jsn"):
+                officer_jsons = json.loads(file_bytes)
+            elif json_file.suffix.lower() in (".yml", ".yaml"):
+                officer_jsons = yaml.load(file_bytes, Loader=YAML_LOADER)
+            return [OfficerID(**d) for d in officer_jsons["officers"]]
+
         json_file = Path(json_file)
         if not json_file.exists():
             return []
 
-        if json_file.suffix.lower() in (".json", ".jsn"):
-            officer_jsons = json.loads(json_file.read_text())
-        elif json_file.suffix.lower() in (".yml", ".yaml"):
-            officer_jsons = yaml.load(json_file.read_text(), Loader=yaml.FullLoader)
-
-        officers = [OfficerID(**d) for d in officer_jsons["officers"]]
-        return officers
+        # parsed once per process, components get their own copies as some of them edit the officers
+        cache_version = f'{pydantic.VERSION}:{",".join(OfficerID.__fields__)}'
+        officers = load_cached(json_file, load_officers, cache_version)
+        return [o.copy(deep=True) for o in officers]
 
     def get_html_lines(self):
         return [f'OfficerID: {self.officer_id}', f'Name: {self.full_name}' f'Method: {self.method}']
@@ -0,0 +1,45 @@
+import csv
+from itertools import islice
+from operator import attrgetter
+
+# Exports built as columns, a list of values per field, from which CSV files
+# and (with pyarrow installed) Parquet/Feather files are written.
+
+ARROW_FORMATS = ("parquet", "feather")
+
+
+def build_columns(objs, fields):
+    if not objs:
+        return dict((field, []) for field in fields)
+
+    get_fields = attrgetter(*fields)
+    rows = map(get_fields, objs) if len(fields) > 1 else ((v,) for v in map(get_fields, objs))
+    return dict(zip(fields, map(list, zip(*rows))))
+
+
+def write_csv(path, columns, num_rows=None):
+    rows = zip(*columns.values())
+    with open(path, 'w') as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(columns.keys())
+        csv_writer.writerows(islice(rows, num_rows))
+
+
+def write_arrow(path, columns, fmt):
+    import pyarrow as pa
+
+    def to_array(values):
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):  # mixed types, like dates and 'to_date'
+            return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    table = pa.table(dict((name, to_array(values)) for (name, values) in columns.items()))
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(table, path)
@@ -0,0 +1,57 @@
+import numpy as np
+
+# Birth dates are compared as packed YYYYMMDD integers. str(date) is always
+# 'YYYY-MM-DD', so levenshtein(str(d1), str(d2)) <= 1 reduces to at most one
+# differing digit among the eight, which is what one_digit() checks.
+
+DIGIT_DIVISORS = 10 ** np.arange(7, -1, -1)
+
+
+def pack_date(dt):
+    return dt.year * 10000 + dt.month * 100 + dt.day
+
+
+def pack_inverted(dt):
+    return dt.year * 10000 + dt.day * 100 + dt.month
+
+
+def date_digits(packed):
+    return (packed // DIGIT_DIVISORS) % 10
+
+
+class BirthDates:
+    """Array of optional birth dates, all the match methods return a boolean mask."""
+
+    def __init__(self, dates):
+        dates = list(dates)
+        self.missing = np.array([d is None for d in dates], dtype=bool)
+        self.packed = np.array([pack_date(d) if d is not None else 0 for d in dates], dtype=np.int64)
+        self.digits = date_digits(self.packed[:, None])
+
+    def __len__(self):
+        return len(self.packed)
+
+    def take(self, idxs):
+        idxs = np.asarray(idxs, dtype=np.intp)
+        sub = BirthDates.__new__(BirthDates)
+        sub.missing, sub.packed, sub.digits = self.missing[idxs], self.packed[idxs], self.digits[idxs]
+        return sub
+
+    def exact(self, dt):
+        return self.packed == pack_date(dt)
+
+    def inverted(self, dt):
+        return self.packed == pack_inverted(dt)
+
+    def one_digit(self, dt):
+        num_diffs = (self.digits != date_digits(pack_date(dt))).sum(axis=1)
+        return (num_diffs <= 1) & ~self.missing
+
+    def fuzzy(self, dt):
+        return self.exact(dt) | self.inverted(dt) | self.one_digit(dt)
+
+    def any_exact(self, dts):
+        return np.logical_or.reduce([self.exact(dt) for dt in dts] + [np.zeros(len(self), dtype=bool)])
+
+    def any_fuzzy(self, dts):
+        return np.logical_or.reduce([self.fuzzy(dt) for dt in dts] + [np.zeros(len(self), dtype=bool)])
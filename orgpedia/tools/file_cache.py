@@ -0,0 +1,77 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+# Parsed files are kept in memory for the life of the process, and pickled in
+# the cache directory under the hash of their contents, a changed source file
+# is parsed again. ORGPEDIA_CACHE_DIR sets the directory, an empty value turns
+# off the disk cache.
+
+_memory = {}
+
+
+def get_package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def get_cache_dir():
+    cache_dir = os.environ.get("ORGPEDIA_CACHE_DIR", None)
+    if cache_dir is None:
+        xdg_cache_dir = os.environ.get("XDG_CACHE_HOME", None)
+        return (Path(xdg_cache_dir) if xdg_cache_dir else Path.home() / ".cache") / "orgpedia"
+    return Path(cache_dir) if cache_dir else None
+
+
+def read_pickle(cache_path):
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except Exception:
+        return None
+
+
+def write_pickle(cache_path, value):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as tmp_file:
+            pickle.dump(value, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file.name, cache_path)
+    except OSError:
+        pass
+
+
+def load_cached(path, load_fn, version=""):
+    """Return load_fn(file_bytes), from memory or the disk cache when the file is unchanged.
+
+    `version` is part of the key, change it when the output of load_fn changes.
+    """
+    path = Path(path)
+    stat = path.stat()
+    memory_key, file_key = (str(path.resolve()), version), (stat.st_mtime_ns, stat.st_size)
+    memory_entry = _memory.get(memory_key, None)
+    if memory_entry and memory_entry[0] == file_key:
+        return memory_entry[1]
+
+    file_bytes = path.read_bytes()
+    digest = hashlib.sha1(file_bytes + version.encode()).hexdigest()
+    cache_dir = get_cache_dir()
+    cache_path = cache_dir / f"{path.stem}-{digest}.pkl" if cache_dir else None
+
+    value = read_pickle(cache_path) if cache_path and cache_path.exists() else None
+    if value is None:
+        value = load_fn(file_bytes)
+        if cache_path:
+            write_pickle(cache_path, value)
+
+    # the entry of a changed file is replaced, only its latest contents are kept
+    _memory[memory_key] = (file_key, value)
+    return value
+
+
+def clear():
+    _memory.clear()
@@ -8,6 +8,8 @@ from collections import Counter
 import yaml
 from more_itertools import first
 
+from orgpedia.tools.timing import TIMING_FILE_NAME, summarize_timings
+
 
 def get_all_exts(path):
     if '.' in path.name:
@@ -344,6 +346,15 @@ class Task:
 
         return s
 
+    def show_timings(self):
+        timing_file = self.taskDir / TIMING_FILE_NAME
+        if not timing_file.exists():
+            return ''
+
+        s = '## Timings\n'
+        s += summarize_timings(timing_file)
+        return s
+
     def show_footer(self):
         s = '\n---\n'
         st_files = [p.relative_to(self.taskDir) for p in self.sub_task_files]
@@ -358,6 +369,7 @@ class Task:
         s += self.show_counts() + '\n'
         s += self.show_skipped_docs() + '\n'
         s += self.show_sub_tasks() + '\n'
+        s += self.show_timings() + '\n'
         s += self.show_footer() + '\n'
         return s
 
@@ -0,0 +1,25 @@
+import pickle
+from pathlib import Path
+
+from docint.hierarchy import Hierarchy
+
+from .file_cache import get_package_version, load_cached
+
+# Building a Hierarchy parses the yml, builds the tree and expands the names,
+# the built hierarchy is pickled once per process (and on disk) and every
+# caller unpickles its own copy, as a hierarchy caches names for the match
+# options it was last called with.
+
+
+DOCINT_VERSION = get_package_version("docint")
+
+
+def load_hierarchy(file_path):
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return Hierarchy(file_path)  # raises the usual error
+
+    hierarchy_bytes = load_cached(
+        file_path, lambda _: pickle.dumps(Hierarchy(file_path)), f"hierarchy:{DOCINT_VERSION}"
+    )
+    return pickle.loads(hierarchy_bytes)
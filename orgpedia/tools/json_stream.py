@@ -0,0 +1,66 @@
+import gzip
+import json
+
+import pydantic
+
+# Exports are encoded and written an item at a time, a .json file has the same
+# text as json.dumps of the whole list, a .jsonl file has an item per line.
+# With compress the files are written gzipped with a .gz suffix, in place of
+# the plain files and not next to them.
+
+JSON_FORMATS = ("json", "jsonl")
+
+
+def open_text(path, compress=False):
+    """Open path for writing text, or path.gz instead of path when compress is set."""
+    return gzip.open(f"{path}.gz", "wt", encoding="utf-8") if compress else open(path, "w")
+
+
+class JsonListWriter:
+    def __init__(self, path_stem, formats=("json",), compress=False, default=pydantic.json.pydantic_encoder):
+        self.encode = json.JSONEncoder(default=default).encode
+        self.files = dict((fmt, open_text(f"{path_stem}.{fmt}", compress)) for fmt in formats)
+        self.num_items = 0
+
+        if "json" in self.files:
+            self.files["json"].write("[")
+
+    def write(self, obj):
+        obj_str = self.encode(obj)
+        for fmt, out_file in self.files.items():
+            if fmt == "json":
+                out_file.write(f", {obj_str}" if self.num_items else obj_str)
+            else:
+                out_file.write(f"{obj_str}\n")
+        self.num_items += 1
+
+    def close(self):
+        if "json" in self.files:
+            self.files["json"].write("]")
+        [out_file.close() for out_file in self.files.values()]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_json_list(path_stem, objs, formats=("json",), compress=False):
+    formats = [fmt for fmt in formats if fmt in JSON_FORMATS]
+    if not formats:
+        return 0
+
+    with JsonListWriter(path_stem, formats, compress) as writer:
+        [writer.write(obj) for obj in objs]
+    return writer.num_items
+
+
+def write_json_dict(path, obj_dict, compress=False, default=pydantic.json.pydantic_encoder):
+    """Write a dict with str keys a value at a time, the text is the same as json.dumps."""
+    encode = json.JSONEncoder(default=default).encode
+    with open_text(path, compress) as out_file:
+        out_file.write("{")
+        for idx, (key, value) in enumerate(obj_dict.items()):
+            out_file.write(f'{", " if idx else ""}{encode(key)}: {encode(value)}')
+        out_file.write("}")
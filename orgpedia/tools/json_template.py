@@ -0,0 +1,44 @@
+import json
+import re
+
+SLOT_RE = re.compile(r'"\\u0000(\d+)\\u0000"')
+
+
+class JsonTemplate:
+    """JSON text with slots, the static parts are encoded once and only the slot values on every fill.
+
+    `build_obj(slot)` returns the object to encode and wraps every varying value
+    with `slot(value)`, it must wrap the same number of values on every call.
+    """
+
+    def __init__(self, build_obj, **json_kwargs):
+        self.json_kwargs = json_kwargs
+        self.encode = json.JSONEncoder(**json_kwargs).encode
+
+        values = []
+
+        def slot(value):
+            values.append(value)
+            return f'\x00{len(values) - 1}\x00'
+
+        parts = SLOT_RE.split(json.dumps(build_obj(slot), **json_kwargs))
+        assert [int(p) for p in parts[1::2]] == list(range(len(values)))
+        self.static_parts = parts[0::2]
+        self.num_slots = len(values)
+
+    def fill(self, build_obj):
+        values = []
+
+        def slot(value):
+            values.append(value)
+            return value
+
+        obj = build_obj(slot)
+        if len(values) != self.num_slots:  # the structure has changed, encode all of it
+            return json.dumps(obj, **self.json_kwargs)
+
+        text_parts = [self.static_parts[0]]
+        for (value, static_part) in zip(values, self.static_parts[1:]):
+            text_parts.append(self.encode(value))
+            text_parts.append(static_part)
+        return ''.join(text_parts)
@@ -0,0 +1,106 @@
+import datetime
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+# The data needed to render a language, its babel locale, digits, month names
+# and labels, is loaded once into a read-only bundle per language. Each website
+# generator owns the bundles of its translations, a run can be limited to a
+# subset of the languages. Formatted dates and years are cached in the bundles,
+# as the distinct dates are few.
+
+LANG_CODES = [
+    'as',
+    'bn',
+    'brx',
+    'doi',
+    'gu',
+    'hi',
+    'kn',
+    'ks',
+    'gom',
+    'mai',
+    'mni',
+    'ml',
+    'mr',
+    'ne',
+    'or',
+    'pa',
+    'sa',
+    'sat',
+    'sd',
+    'ta',
+    'te',
+    'ur',
+    'en',
+]
+
+
+def get_locale_lang(lang):
+    return 'kok' if lang == 'gom' else ('hi' if lang == 'sd' else lang)
+
+
+def get_label_attr(label):
+    return label.replace(',', '').replace(' ', '_').lower()
+
+
+def get_run_languages(languages):
+    """Returns the languages of a run, all of LANG_CODES if none are given."""
+    if not languages:
+        return list(LANG_CODES)
+
+    unknown_langs = [lang for lang in languages if lang not in LANG_CODES]
+    if unknown_langs:
+        raise ValueError(f'Unknown languages: {unknown_langs}')
+    return list(languages)
+
+
+@dataclass(frozen=True)
+class LangBundle:
+    lang: str
+    locale: object
+    digits: MappingProxyType
+    months: tuple
+    labels: MappingProxyType
+    date_strs: dict = field(default_factory=dict, compare=False, repr=False)
+    year_strs: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, lang, translations):
+        from babel import Locale
+        from babel.dates import format_date
+
+        locale = Locale.parse(get_locale_lang(lang))
+        digits = dict((c, str(lang_digits[lang])) for (c, lang_digits) in translations['digits'].items())
+        labels = dict((get_label_attr(label), ts[lang]) for (label, ts) in translations['labels'].items())
+
+        month_dts = [datetime.date(year=2022, month=m, day=1) for m in range(1, 13)]
+        months = [''] + [format_date(dt, format='d MMMM YYYY', locale=locale).split()[1] for dt in month_dts]
+        return LangBundle(lang, locale, MappingProxyType(digits), tuple(months), MappingProxyType(labels))
+
+    @property
+    def to_date(self):
+        return self.labels['to_date']
+
+    def translate_digits(self, text):
+        return ''.join(self.digits[c] if c.isdigit() else c for c in text)
+
+    def format_date(self, dt, pattern_str):
+        from babel.dates import format_date
+
+        dt_str = self.date_strs.get((dt, pattern_str), None)
+        if dt_str is None:
+            # digits are not translated by babel
+            dt_str = format_date(dt, format=pattern_str, locale=self.locale)
+            dt_str = self.date_strs[(dt, pattern_str)] = self.translate_digits(dt_str)
+        return dt_str
+
+    def format_year(self, year):
+        year_str = self.year_strs.get(year, None)
+        if year_str is None:
+            year_str = self.year_strs[year] = self.translate_digits(str(year))
+        return year_str
+
+
+def load_lang_bundles(translations, languages):
+    """Returns a read-only {lang: LangBundle} of the languages."""
+    return MappingProxyType(dict((lang, LangBundle.build(lang, translations)) for lang in languages))
@@ -0,0 +1,37 @@
+import inspect
+import types
+
+
+class LangView:
+    """A language view of an info object, without copying it.
+
+    `fields` maps attribute names to values, or to zero-argument callables that
+    are called on first access. Every other attribute is read from the wrapped
+    object, its properties and methods run with the view as `self`, so they see
+    the translated fields and the view's `lang`.
+    """
+
+    def __init__(self, obj, lang, **fields):
+        self.__dict__['_obj'] = obj
+        self.__dict__['_lazy_fields'] = dict((k, v) for (k, v) in fields.items() if callable(v))
+        self.__dict__.update((k, v) for (k, v) in fields.items() if not callable(v))
+        self.lang = lang
+
+    def __getattr__(self, name):
+        lazy_field = self._lazy_fields.get(name, None)
+        if lazy_field is not None:
+            # a field that fails to translate stays lazy, it never falls back to the wrapped value
+            value = self.__dict__[name] = lazy_field()
+            del self._lazy_fields[name]
+            return value
+
+        obj = self.__dict__['_obj']
+        cls_attr = inspect.getattr_static(type(obj), name, None)
+        if isinstance(cls_attr, property):
+            return cls_attr.fget(self)
+        elif isinstance(cls_attr, types.FunctionType):
+            return types.MethodType(cls_attr, self)
+        return getattr(obj, name)
+
+    def __repr__(self):
+        return f'LangView({self._obj!r}, {self.lang!r})'
@@ -0,0 +1,159 @@
+import atexit
+import datetime
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path, PurePath
+
+# All component loggers share a single QueueHandler, the records are written by
+# one listener thread. Per-document log files are selected by routing the
+# record to the path opened for its logger, instead of attaching and removing
+# a FileHandler for every document.
+#
+# ORGPEDIA_LOG_LEVEL raises the stdout level of every component (QUIET turns
+# stdout off), ORGPEDIA_DOC_LOG_LEVEL sets the level of the per-document files.
+
+QUIET = logging.CRITICAL + 10
+LOG_FORMAT = "%(message)s"
+
+
+def _env_level(env_var, default):
+    level_name = os.environ.get(env_var, "").strip().upper()
+    if not level_name:
+        return default
+    elif level_name == "QUIET":
+        return QUIET
+    elif level_name.isdigit():
+        return int(level_name)
+    level = logging.getLevelName(level_name)
+    return level if isinstance(level, int) else default
+
+
+STREAM_LEVEL = _env_level("ORGPEDIA_LOG_LEVEL", logging.NOTSET)
+DOC_LEVEL = _env_level("ORGPEDIA_DOC_LOG_LEVEL", logging.DEBUG)
+
+_CLOSE = "__close_log__"
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), datetime.date, PurePath)
+
+_queue = queue.SimpleQueue()
+_routes = {}
+_stream_levels = {}
+_lock = threading.Lock()
+_listener = None
+
+
+class LazyStr:
+    """A log argument computed only when its record is written: lgr.debug("%s", LazyStr(to_str, obj))."""
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn, *args):
+        self.fn, self.args = fn, args
+
+    def __str__(self):
+        return str(self.fn(*self.args))
+
+
+class _RouteHandler(QueueHandler):
+    """Stamps the destination on the record, formatting is left to the listener."""
+
+    def prepare(self, record):
+        # objects that could change before the listener gets to them are formatted now
+        if record.args and not all(isinstance(a, _IMMUTABLE_ARGS) for a in record.args):
+            record.msg, record.args = record.getMessage(), None
+        return record
+
+    def emit(self, record):
+        # records that no handler wants are dropped before their arguments are formatted
+        record.log_path = _routes.get(record.name)
+        record.to_stream = record.levelno >= _stream_levels.get(record.name, QUIET)
+        if record.to_stream or (record.log_path and record.levelno >= DOC_LEVEL):
+            self.enqueue(self.prepare(record))
+
+
+class _WriteHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.log_files = {}
+
+    def handle(self, record):
+        if record.msg == _CLOSE:
+            log_file = self.log_files.pop(record.args[0], None)
+            if log_file:
+                log_file.close()
+            return True
+        return super().handle(record)
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + "\n"
+            if record.to_stream:
+                sys.stdout.write(msg)  # looked up on each write, follows redirection of sys.stdout
+            if record.log_path and record.levelno >= DOC_LEVEL:
+                log_file = self.log_files.get(record.log_path)
+                if log_file is None:
+                    log_file = self.log_files[record.log_path] = open(record.log_path, "w")
+                log_file.write(msg)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        [f.close() for f in self.log_files.values()]
+        self.log_files.clear()
+        super().close()
+
+
+def _start_listener():
+    global _listener
+    with _lock:
+        if _listener is None:
+            _listener = QueueListener(_queue, _WriteHandler(), respect_handler_level=False)
+            _listener.start()
+
+
+def stop():
+    """Drain the queue and close all the open log files."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            [h.close() for h in _listener.handlers]
+            _listener = None
+
+
+atexit.register(stop)
+
+
+def get_logger(name, stream_level=logging.DEBUG):
+    """Return a logger writing through the shared queue, stdout gets records >= stream_level."""
+    lgr = logging.getLogger(name)
+    stream_level = max(stream_level, STREAM_LEVEL)
+    _stream_levels[name] = stream_level
+    lgr.setLevel(min(stream_level, DOC_LEVEL))
+
+    if not any(isinstance(h, _RouteHandler) for h in lgr.handlers):
+        lgr.addHandler(_RouteHandler(_queue))
+    _start_listener()
+    return lgr
+
+
+def open_log(lgr, log_path):
+    """Route the records of `lgr` to `log_path` until close_log is called."""
+    _routes[lgr.name] = str(Path(log_path).absolute())
+
+
+def close_log(lgr):
+    log_path = _routes.pop(lgr.name, None)
+    if log_path:
+        _queue.put(lgr.makeRecord(lgr.name, logging.CRITICAL, __file__, 0, _CLOSE, (log_path,), None))
+
+
+def flush():
+    """Block till all the queued records are written."""
+    if _listener is not None:
+        stop()
+        _start_listener()
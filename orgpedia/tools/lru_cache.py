@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Values built by build_fn on a miss, at most maxsize of them (None is unbounded, 0 turns off caching).
+
+    The least recently used value is dropped when the cache is full, hits and
+    misses are counted for reporting.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key, build_fn):
+        if key in self.values:
+            self.hits += 1
+            self.values.move_to_end(key)
+            return self.values[key]
+
+        self.misses += 1
+        value = build_fn()
+        if self.maxsize != 0:
+            self.values[key] = value
+            if self.maxsize is not None and len(self.values) > self.maxsize:
+                self.values.popitem(last=False)
+        return value
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_str(self):
+        return f"hits: {self.hits} misses: {self.misses} hit_rate: {self.hit_rate:.1%} size: {len(self)}/{self.maxsize}"
+
+    def clear(self):
+        self.values.clear()
+        self.hits, self.misses = 0, 0
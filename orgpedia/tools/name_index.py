@@ -0,0 +1,115 @@
+import numpy as np
+from polyleven import levenshtein
+
+from .timing import phase
+
+MAX_NAME_DIST = 3
+
+# Names within levenshtein distance k of a query share at least
+# max(|Gq|, |Gn|) - k * n of their distinct padded n-grams, as an edit changes
+# at most n grams. The index counts the shared grams of all the names at once
+# and runs levenshtein only on the names that pass this bound and the length
+# bound, so the result is the same as comparing with every name.
+
+
+def name_grams(name, n=3):
+    padded = f'{"$" * (n - 1)}{name}{"$" * (n - 1)}'
+    return set(padded[i : i + n] for i in range(len(padded) - n + 1))
+
+
+class NameIndex:
+    def __init__(self, names, n=3):
+        self.names = list(names)
+        self.n = n
+
+        postings, num_grams = {}, []
+        for (idx, name) in enumerate(self.names):
+            grams = name_grams(name, n)
+            [postings.setdefault(g, []).append(idx) for g in grams]
+            num_grams.append(len(grams))
+
+        self.postings = dict((g, np.array(idxs, dtype=np.int32)) for (g, idxs) in postings.items())
+        self.num_grams = np.array(num_grams, dtype=np.int32)
+        self.lens = np.array([len(name) for name in self.names], dtype=np.int32)
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_candidate_idxs(self, name, max_dist):
+        grams = name_grams(name, self.n)
+        name_postings = [self.postings[g] for g in grams if g in self.postings]
+        if name_postings:
+            shared = np.bincount(np.concatenate(name_postings), minlength=len(self.names))
+        else:
+            shared = np.zeros(len(self.names), dtype=np.int64)
+
+        min_shared = np.maximum(self.num_grams, len(grams)) - max_dist * self.n
+        return np.flatnonzero((shared >= min_shared) & (np.abs(self.lens - len(name)) <= max_dist))
+
+    def find_nearest(self, name, max_dist=3):
+        """Return (name, dist) of the closest name within max_dist, the earliest one on ties, or (None, None)."""
+        best_idx, best_dist = None, max_dist + 1
+        for idx in self.get_candidate_idxs(name, max_dist):
+            dist = levenshtein(name, self.names[idx], best_dist - 1)
+            if dist < best_dist:
+                best_idx, best_dist = idx, dist
+                if dist == 0:
+                    break
+        return (self.names[best_idx], best_dist) if best_idx is not None else (None, None)
+
+    def find_nearest_batch(self, names, max_dist=3):
+        """Return a dict of name -> (name, dist) for all the distinct names."""
+        return dict((name, self.find_nearest(name, max_dist)) for name in set(names))
+
+
+class NameSuggestions:
+    """Closest officer names for the id assigners, cached per cadre.
+
+    Expects cadre_names_dict, cadre_name_index, cadre_suggestions_dict,
+    special_role_dict and role_timelines on the component.
+    """
+
+    def get_name_nows(self, doc, officer):
+        def fix_name(name):
+            assert name.isascii()
+            name.strip(" .-")
+            name_nows = name.replace(" ", "").lower()
+            return name_nows
+
+        name = officer.name
+        name_nows = fix_name(name)
+        if not name_nows:
+            return name, name_nows
+
+        min_name = name_nows.replace("the", "")
+        role_field = self.special_role_dict.get(min_name, None)
+        if role_field:
+            name = self.role_timelines.get_role_name(role_field, doc.order.date)
+            name_nows = fix_name(name)
+        return name, name_nows
+
+    def get_suggestion(self, cadre, name_nows):
+        suggestions_dict = self.cadre_suggestions_dict[cadre]
+        if name_nows not in suggestions_dict:
+            suggestions_dict[name_nows], _ = self.cadre_name_index[cadre].find_nearest(name_nows, MAX_NAME_DIST)
+        return suggestions_dict[name_nows]
+
+    def add_suggestions(self, doc, conf_officer_ids):
+        """Look up the closest names of all the unknown names in the document in one batch."""
+        cadre_names = {}
+        for detail in doc.order.details:
+            officer = detail.officer
+            if detail.detail_idx in conf_officer_ids:
+                continue
+
+            _, name_nows = self.get_name_nows(doc, officer)
+            if not name_nows or name_nows in self.cadre_names_dict[officer.cadre]:
+                continue
+
+            if name_nows not in self.cadre_suggestions_dict[officer.cadre]:
+                cadre_names.setdefault(officer.cadre, []).append(name_nows)
+
+        with phase("levenshtein_search"):
+            for cadre, names in cadre_names.items():
+                nearest_dict = self.cadre_name_index[cadre].find_nearest_batch(names, MAX_NAME_DIST)
+                self.cadre_suggestions_dict[cadre].update((n, s) for (n, (s, _)) in nearest_dict.items())
@@ -0,0 +1,79 @@
+from more_itertools import pairwise
+
+# The horizontal extents of a page and its lines are computed once and shared
+# by the components that check line alignment. Pages can neither be hashed nor
+# weakly referenced, the geometries of the pages of the current document are
+# kept by page id and dropped when a page of another document is seen, so at
+# most one document is held. A geometry is rebuilt when the words or lines of
+# its page are replaced or change in number.
+
+NO_GAP = float("-inf")
+
+_doc_geometries = {"doc": None, "pages": {}}
+
+
+class PageGeometry:
+    def __init__(self, page):
+        self.xmin = min((w.xmin for w in page.words), default=0.0)
+        self.xmax = max((w.xmax for w in page.words), default=1.0)
+
+        self.line_xmins, self.line_xmaxs, self.line_gaps = [], [], []
+        for line in page.lines:
+            if line:
+                gaps = (w2.xmin - w1.xmax for (w1, w2) in pairwise(line.words))
+                self.line_xmins.append(line.xmin)
+                self.line_xmaxs.append(line.xmax)
+                self.line_gaps.append(max(gaps, default=NO_GAP))
+            else:
+                self.line_xmins.append(None)
+                self.line_xmaxs.append(None)
+                self.line_gaps.append(NO_GAP)
+
+    def has_line(self, line_idx):
+        return self.line_xmins[line_idx] is not None
+
+    def has_gap(self, line_idx, gap):
+        return self.line_gaps[line_idx] > gap
+
+    def is_center_aligned(self, line_idx, padding=0.1):
+        if not self.has_line(line_idx):
+            return False
+        xmin, xmax = self.line_xmins[line_idx], self.line_xmaxs[line_idx]
+        return (self.xmin + padding) < xmin < xmax < (self.xmax - padding)
+
+    def is_center_balanced(self, line_idx, tolerance=0.1):
+        if not self.has_line(line_idx):
+            return False
+        left_gap, right_gap = (self.line_xmins[line_idx] - self.xmin), (self.xmax - self.line_xmaxs[line_idx])
+        return abs(left_gap - right_gap) < tolerance and left_gap > tolerance
+
+    def is_left_aligned(self, line_idx, tolerance=0.1):
+        return self.has_line(line_idx) and abs(self.xmin - self.line_xmins[line_idx]) < tolerance
+
+    def is_right_aligned(self, line_idx, tolerance=0.1):
+        return self.has_line(line_idx) and abs(self.xmax - self.line_xmaxs[line_idx]) < tolerance
+
+    def is_full_line(self, line_idx, tolerance=0.05):
+        return self.is_left_aligned(line_idx, tolerance) and self.is_right_aligned(line_idx, tolerance)
+
+
+def get_page_geometry(page):
+    doc = getattr(page, "doc", None)
+    if doc is not _doc_geometries["doc"]:
+        clear_page_geometries()
+        _doc_geometries["doc"] = doc
+
+    # an entry holds its page, words and lines, so their ids are not reused while it is cached
+    words, lines = page.words, page.lines
+    entry = _doc_geometries["pages"].get(id(page), None)
+    if entry and entry[1] is words and entry[2] is lines and entry[3] == (len(words), len(lines)):
+        return entry[4]
+
+    geometry = PageGeometry(page)
+    _doc_geometries["pages"][id(page)] = (page, words, lines, (len(words), len(lines)), geometry)
+    return geometry
+
+
+def clear_page_geometries():
+    _doc_geometries["doc"] = None
+    _doc_geometries["pages"].clear()
@@ -1,7 +1,6 @@
 import logging
 import re
 import sys
-from pathlib import Path
 from typing import List
 
 from docint.data_error import DataError
@@ -11,6 +10,9 @@ from docint.util import read_config_from_disk
 from more_itertools import first
 
 from ..extracts.orgpedia import Post
+from .hierarchy_cache import load_hierarchy
+from .log_utils import LazyStr
+from .lru_cache import LRUCache
 
 
 class PostEmptyDeptAndJuriError(DataError):
@@ -26,13 +28,14 @@ class PostUnmatchedTextsError(DataError):
 
 
 class PostParser:
-    def __init__(self, hierarchy_files, noparse_file=None):
+    def __init__(self, hierarchy_files, noparse_file=None, post_cache_size=4096):
         self.hierarchy_dict = {}
         for field, file_name in hierarchy_files.items():
-            hierarchy = Hierarchy(Path(file_name))
+            hierarchy = load_hierarchy(file_name)
             self.hierarchy_dict[field] = hierarchy
 
         self.noparse_dict = self.load_noparse(noparse_file)
+        self.post_cache = LRUCache(post_cache_size)
         self.match_options = MatchOptions(ignore_case=True)
         self.lgr = logging.getLogger(__name__ + ".")
         self.lgr.setLevel(logging.DEBUG)
@@ -110,7 +113,7 @@ class PostParser:
                         print(f"\t{sg.new_str()} {sg.sum_match_len} {sg.sum_span_len}", end="")
                         print(" {sg.sum_span_len_start}")
 
-            self.lgr.debug(f"\tJuri: is_comm_role: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: is_comm_role: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             return sel_sgs
         elif is_dept_with_juri:
             label = dept_sg.get_label_val("_juri")
@@ -125,7 +128,7 @@ class PostParser:
                     if len(sel_sgs) > 1:
                         sel_sgs = HierarchySpanGroup.select_unique(sel_sgs)
 
-            self.lgr.debug(f"\tJuri: dept_has_juri_label: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: dept_has_juri_label: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             assert (
                 len(sel_sgs) <= 1
             ), f"{post_path} label: {label} {len(sel_sgs)} span_groups: {post_str} {Hierarchy.to_str(sel_sgs)}"
@@ -153,7 +156,7 @@ class PostParser:
 
                     sel_sgs = sel_sgs[:1]
 
-            self.lgr.debug(f"\tJuri: sum_matching_len: {Hierarchy.to_str(sel_sgs)}")
+            self.lgr.debug("\tJuri: sum_matching_len: %s", LazyStr(Hierarchy.to_str, sel_sgs))
             assert len(sel_sgs) <= 1, f"{len(sel_sgs)} span_groups:, {post_str} {Hierarchy.to_str(sel_sgs)}"
             return sel_sgs
 
@@ -196,16 +199,8 @@ class PostParser:
             errors.append(e)
         return errors
 
-    def parse(self, post_words, post_str, post_path, rank=None):
-        self.lgr.info(f">{post_str}")
-
-        if post_str in self.noparse_dict:
-            path_dict = self.noparse_dict[post_str]
-            post = Post.build_no_spans(post_words, post_str, **path_dict)
-            return post
-
+    def parse_fields(self, post_str, post_path, rank):
         field_dict = {}
-        post_str = post_str.replace("‐", "-")
         select_strategy_dict = {
             "dept": "connected_sum_span_len",
             # "role": "at_start",
@@ -251,9 +246,24 @@ class PostParser:
                 field_dict["juri"] = sgs
 
             h_paths = [sg.hierarchy_path for sg in field_dict[field]]
-            self.lgr.info(f"{field}: {Hierarchy.to_str(field_dict[field])} {h_paths[:1]}")
+            self.lgr.info("%s: %s %s", field, LazyStr(Hierarchy.to_str, field_dict[field]), h_paths[:1])
+
+        return dict((k, first(v, None)) for k, v in field_dict.items())
 
-        field_dict = dict((k, first(v, None)) for k, v in field_dict.items())
+    def parse(self, post_words, post_str, post_path, rank=None):
+        self.lgr.info(">%s", post_str)
+
+        if post_str in self.noparse_dict:
+            path_dict = self.noparse_dict[post_str]
+            post = Post.build_no_spans(post_words, post_str, **path_dict)
+            return post
+
+        # the span groups depend only on the text, the words are bound in Post.build
+        post_str = post_str.replace("‐", "-")
+        cache_key = (post_str, rank)
+        if cache_key in self.post_cache:
+            self.lgr.info("\tcached parse: %s %s", cache_key, LazyStr(self.post_cache.stats_str))
+        field_dict = self.post_cache.get(cache_key, lambda: self.parse_fields(post_str, post_path, rank))
 
         # if post_path == "p0.t0.r14.c4":
         #     # b /Users/mukund/Software/docInt/docint/pipeline/pdfpost_parser.py:282
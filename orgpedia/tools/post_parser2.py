@@ -1,16 +1,18 @@
 import logging
 import re
 import sys
-from pathlib import Path
 from typing import List
 
 from docint.data_error import DataError
-from docint.hierarchy import Hierarchy, HierarchySpanGroup, MatchOptions
+from docint.hierarchy import HierarchySpanGroup, MatchOptions
 from docint.span import Span
 from docint.util import read_config_from_disk
 from more_itertools import first
 
 from ..extracts.orgpedia import Post
+from .hierarchy_cache import load_hierarchy
+from .log_utils import LazyStr
+from .lru_cache import LRUCache
 
 
 class PostEmptyDeptAndJuriError(DataError):
@@ -35,11 +37,12 @@ class PostParser:
         merge_strategy="child_span",
         select_strategy="connected_sum_span_len",
         match_on_word_boundary=True,
+        post_cache_size=4096,
     ):
 
         self.hierarchy_dict = {}
         for field, file_name in hierarchy_files.items():
-            hierarchy = Hierarchy(Path(file_name))
+            hierarchy = load_hierarchy(file_name)
             self.hierarchy_dict[field] = hierarchy
 
         self.noparse_dict = self.load_noparse(noparse_file)
@@ -51,6 +54,7 @@ class PostParser:
         self.match_on_word_boundary = match_on_word_boundary
 
         self.match_options = None
+        self.post_cache = LRUCache(post_cache_size)
 
         # self._enable_hierarchy_logger()
         self.lgr = logging.getLogger(__name__ + ".")
@@ -106,7 +110,7 @@ class PostParser:
         print(f'P:{doc_path}{he}:')
 
     def parse(self, post_words, post_str, doc_path="", role_str=""):
-        self.lgr.info(f">{post_str}")
+        self.lgr.info(">%s", post_str)
 
         orig_str = post_str
         post_str = self.fix_post_str(post_str).strip()
@@ -121,6 +125,20 @@ class PostParser:
             post = Post.build_no_spans(post_words, post_str, **path_dict)
             return post, []
 
+        # the span groups depend only on the text, the words are bound in Post.build
+        cache_key = (post_str, role_str)
+        if cache_key in self.post_cache:
+            self.lgr.info("\tcached parse: %s %s", cache_key, LazyStr(self.post_cache.stats_str))
+        field_dict = self.post_cache.get(cache_key, lambda: self.parse_fields(post_str, doc_path, role_str))
+
+        post = Post.build(post_words, post_str, **field_dict)
+        post.orig_str = orig_str
+        errors = self.test(post, doc_path)
+
+        self.print_details(post, errors, doc_path)
+        return post, errors
+
+    def parse_fields(self, post_str, doc_path, role_str):
         field_dict = {}
         for (field, hierarchy) in self.hierarchy_dict.items():
             self.match_options = self.get_match_options(field)
@@ -140,13 +158,7 @@ class PostParser:
 
             field_dict[field] = first(span_groups, None)
         # end for
-
-        post = Post.build(post_words, post_str, **field_dict)
-        post.orig_str = orig_str
-        errors = self.test(post, doc_path)
-
-        self.print_details(post, errors, doc_path)
-        return post, errors
+        return field_dict
 
     def handle_dept(self, post_str, field_dict, span_groups, doc_path):
         return span_groups
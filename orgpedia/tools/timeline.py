@@ -0,0 +1,107 @@
+import bisect
+import datetime
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+from dateutil import parser
+
+
+class DateTimeline:
+    """Finds the first of a list of half-open [start, end) date intervals that contains a date.
+
+    The interval boundaries split the timeline into segments, the index of the
+    first interval covering each segment is computed once, so a lookup is a
+    single bisect over the boundaries.
+    """
+
+    def __init__(self, intervals, items=None):
+        intervals = list(intervals)
+        self.items = list(items) if items is not None else intervals
+        assert len(self.items) == len(intervals)
+
+        self.bounds = sorted(set(d for interval in intervals for d in interval))
+        bound_pos = dict((d, pos) for (pos, d) in enumerate(self.bounds))
+
+        # walk the intervals in reverse, so that the earlier intervals overwrite the later ones
+        self.segment_idxs = [None] * len(self.bounds)
+        for idx in range(len(intervals) - 1, -1, -1):
+            start, end = intervals[idx]
+            for pos in range(bound_pos[start], bound_pos[end]):
+                self.segment_idxs[pos] = idx
+
+    @classmethod
+    def from_start_dates(cls, items, start_dates):
+        """Each item lasts till the start of the next one, the last item never ends."""
+        start_dates = list(start_dates)
+        end_dates = start_dates[1:] + [datetime.date.max]
+        return cls(zip(start_dates, end_dates), items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def find_idx(self, dt):
+        pos = bisect.bisect_right(self.bounds, dt) - 1
+        return self.segment_idxs[pos] if pos >= 0 else None
+
+    def find(self, dt):
+        idx = self.find_idx(dt)
+        return (self.items[idx], idx) if idx is not None else (None, None)
+
+
+class RoleTimelines:
+    """Names of the holders of the special roles on a date, from the tenures of the ministries."""
+
+    def __init__(self, tenures, role_fields):
+        def parse_date(tenure, key, alt_key):
+            date_str = tenure[key] if key in tenure else tenure[alt_key]
+            return parser.parse(date_str).date() if date_str != "today" else datetime.date.today()
+
+        self.timelines = {}
+        for role_field in role_fields:
+            tenure_name_dict = {}
+            for tenure in tenures:
+                sDate, eDate = parse_date(tenure, "start", "start_date"), parse_date(tenure, "end", "end_date")
+                tenure_name_dict[(sDate, eDate)] = tenure.get(role_field)
+
+            # the tenures are overlapping on last day, a role holder is only picked strictly inside the tenure
+            intervals = [(s + datetime.timedelta(days=1), e) for (s, e) in tenure_name_dict]
+            self.timelines[role_field] = DateTimeline(intervals, tenure_name_dict.values())
+        self.role_name_dict = {}
+
+    def get_role_name(self, role_field, order_date):
+        if (role_field, order_date) not in self.role_name_dict:
+            name, _ = self.timelines[role_field].find(order_date)
+            self.role_name_dict[(role_field, order_date)] = name
+        return self.role_name_dict[(role_field, order_date)]
+
+
+def find_key_overlaps(intervals, keys):
+    """Returns [(key, start, end, idxs)], the periods in which two or more [start, end) intervals of a key overlap.
+
+    The interval ends and starts are swept in date order keeping the active
+    intervals of each key, a period ends when the key's active set changes.
+    """
+    events = []
+    for idx, (start, end) in enumerate(intervals):
+        if start < end:
+            events += [(start, 1, idx), (end, 0, idx)]
+    events.sort()
+
+    active, open_periods, overlaps = defaultdict(set), {}, []
+    for dt, dt_events in groupby(events, key=itemgetter(0)):
+        changed_keys = set()
+        for _, is_start, idx in dt_events:
+            key = keys[idx]
+            (active[key].add if is_start else active[key].remove)(idx)
+            changed_keys.add(key)
+
+        for key in changed_keys:
+            if key in open_periods:
+                start, idxs = open_periods.pop(key)
+                overlaps.append((key, start, dt, idxs))
+            if len(active[key]) > 1:
+                open_periods[key] = (dt, sorted(active[key]))
+
+    overlaps.sort(key=lambda o: (o[1], o[3]))
+    return overlaps
@@ -0,0 +1,179 @@
+import atexit
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+# Timing records are buffered in memory and appended to TIMING_FILE in batches.
+# The file is in the task directory's logs, like the per-document log files,
+# and is resolved when the module is imported, as the working directory can
+# change before the records are flushed. ORGPEDIA_TIMING_FILE overrides it.
+TIMING_FILE_NAME = Path("logs") / "timings.jsonl"
+TIMING_FILE = Path(os.environ.get("ORGPEDIA_TIMING_FILE", TIMING_FILE_NAME)).absolute()
+FLUSH_EVERY = 500
+ENABLED = os.environ.get("ORGPEDIA_TIMING", "1") not in ("0", "false", "no")
+
+RUN_ID = datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+_local = threading.local()
+_lock = threading.Lock()
+_records = []
+
+
+def _active_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _doc_name(args):
+    doc = args[0] if args else None
+    return getattr(doc, "pdf_name", None)
+
+
+def timed(method):
+    """Record the duration of a component's __call__/pipe along with its sub-phases."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not ENABLED:
+            return method(self, *args, **kwargs)
+
+        record = {
+            "run": RUN_ID,
+            "component": type(self).__name__,
+            "stub": str(self.conf_stub) if getattr(self, "conf_stub", None) else None,
+            "method": method.__name__,
+            "doc": _doc_name(args) if method.__name__ == "__call__" else None,
+            "phases": defaultdict(float),
+        }
+        stack = _active_stack()
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record["seconds"] = round(time.perf_counter() - start, 6)
+            record["phases"] = {k: round(v, 6) for k, v in record["phases"].items()}
+            stack.pop()
+            _add_record(record)
+
+    return wrapper
+
+
+@contextmanager
+def phase(name):
+    """Accumulate the time spent inside the block against the active component record."""
+    stack = _active_stack() if ENABLED else None
+    if not stack:
+        yield
+        return
+
+    record = stack[-1]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["phases"][name] += time.perf_counter() - start
+
+
+def timed_phase(name):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_phase(name, seconds):
+    stack = _active_stack() if ENABLED else None
+    if stack:
+        stack[-1]["phases"][name] += seconds
+
+
+def _add_record(record):
+    with _lock:
+        _records.append(record)
+        if len(_records) >= FLUSH_EVERY:
+            _flush_locked()
+
+
+def _flush_locked():
+    if not _records:
+        return
+    TIMING_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMING_FILE, "a") as timing_file:
+        for record in _records:
+            timing_file.write(json.dumps(record) + "\n")
+    _records.clear()
+
+
+def flush():
+    with _lock:
+        _flush_locked()
+
+
+atexit.register(flush)
+
+
+def read_timings(timing_file):
+    timing_file = Path(timing_file)
+    if not timing_file.exists():
+        return []
+
+    records = []
+    for line in timing_file.read_text().splitlines():
+        if line.strip():
+            records.append(json.loads(line))
+    return records
+
+
+def summarize_timings(timing_file):
+    def summarize(run_records):
+        summary = {}
+        for r in run_records:
+            key = (r["component"], r["method"])
+            s = summary.setdefault(key, {"calls": 0, "total": 0.0, "max": 0.0, "phases": defaultdict(float)})
+            s["calls"] += 1
+            s["total"] += r["seconds"]
+            s["max"] = max(s["max"], r["seconds"])
+            for name, secs in r.get("phases", {}).items():
+                s["phases"][name] += secs
+        return summary
+
+    records = read_timings(timing_file)
+    if not records:
+        return "No timings recorded.\n"
+
+    runs = list(dict.fromkeys(r["run"] for r in records))
+    last_run = runs[-1]
+    prev_run = runs[-2] if len(runs) > 1 else None
+
+    run_records = defaultdict(list)
+    [run_records[r["run"]].append(r) for r in records]
+
+    last_summary = summarize(run_records[last_run])
+    prev_summary = summarize(run_records[prev_run]) if prev_run else {}
+
+    s = f'Run: {last_run}' + (f' (compared with {prev_run})' if prev_run else '') + '\n\n'
+    s += '| Component                | Method   |  Calls | Total(s) | Mean(ms) |  Max(ms) | Change | Top phases |\n'
+    s += '|--------------------------|----------|--------|----------|----------|----------|--------|------------|\n'
+    for (component, method), c in sorted(last_summary.items(), key=lambda kv: -kv[1]["total"]):
+        mean_ms = 1000 * c["total"] / c["calls"]
+        prev = prev_summary.get((component, method))
+        change = f'{100 * (c["total"] - prev["total"]) / prev["total"]:+.0f}%' if prev and prev["total"] else '-'
+        top_phases = sorted(c["phases"].items(), key=lambda kv: -kv[1])[:3]
+        phases_str = ', '.join(f'{n}: {v:.2f}s' for n, v in top_phases)
+        s += f'| {component:24} | {method:8} | {c["calls"]:>6} | {c["total"]:>8.2f} | {mean_ms:>8.1f} |'
+        s += f' {1000 * c["max"]:>8.1f} | {change:>6} | {phases_str} |\n'
+    return s
@@ -0,0 +1,55 @@
+import csv
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from orgpedia.tools.columns import ARROW_FORMATS, build_columns, write_arrow, write_csv
+
+TENURES = [
+    SimpleNamespace(tenure_id=1, post_id='p1', start_date=datetime.date(2020, 1, 2), end_date='to_date'),
+    SimpleNamespace(
+        tenure_id=2, post_id=None, start_date=datetime.date(2021, 3, 4), end_date=datetime.date(2022, 1, 1)
+    ),
+]
+FIELDS = ['tenure_id', 'post_id', 'start_date', 'end_date']
+
+
+def test_build_columns():
+    columns = build_columns(TENURES, FIELDS)
+    assert columns['tenure_id'] == [1, 2] and columns['end_date'] == ['to_date', datetime.date(2022, 1, 1)]
+    assert build_columns(TENURES, ['post_id']) == {'post_id': ['p1', None]}
+    assert build_columns([], FIELDS) == dict((f, []) for f in FIELDS)
+
+
+def test_write_csv(tmp_path):
+    write_csv(tmp_path / 'tenures.csv', build_columns(TENURES, FIELDS))
+    write_csv(tmp_path / 'tenures-sample.csv', build_columns(TENURES, FIELDS), num_rows=1)
+
+    with open(tmp_path / 'expected.csv', 'w') as expected_csv:
+        csv_writer = csv.DictWriter(expected_csv, fieldnames=FIELDS)
+        csv_writer.writeheader()
+        csv_writer.writerows(vars(t) for t in TENURES)
+
+    expected_lines = (tmp_path / 'expected.csv').read_text().splitlines()
+    assert (tmp_path / 'tenures.csv').read_text().splitlines() == expected_lines
+    assert (tmp_path / 'tenures-sample.csv').read_text().splitlines() == expected_lines[:2]
+
+
+@pytest.mark.parametrize('fmt', ARROW_FORMATS)
+def test_write_arrow(tmp_path, fmt):
+    pytest.importorskip('pyarrow')
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    write_arrow(tmp_path / f'tenures.{fmt}', build_columns(TENURES, FIELDS), fmt)
+    table = (
+        pq.read_table(tmp_path / 'tenures.parquet')
+        if fmt == 'parquet'
+        else feather.read_table(tmp_path / 'tenures.feather')
+    )
+
+    assert table.column_names == FIELDS
+    assert table.column('tenure_id').to_pylist() == [1, 2] and table.column('post_id').to_pylist() == ['p1', None]
+    assert table.column('start_date').to_pylist() == [datetime.date(2020, 1, 2), datetime.date(2021, 3, 4)]
+    assert table.column('end_date').to_pylist() == ['to_date', '2022-01-01']  # mixed dates and strings are strings
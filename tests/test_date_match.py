@@ -0,0 +1,47 @@
+import datetime
+
+from polyleven import levenshtein
+
+from orgpedia.tools.date_match import BirthDates
+
+
+def string_fuzzy_match(d1, d2):
+    inv_equal = d1.year == d2.year and d1.month == d2.day and d1.day == d2.month
+    return d1 == d2 or inv_equal or levenshtein(str(d1), str(d2), 1) <= 1
+
+
+DATES = [
+    datetime.date(1956, 3, 7),
+    datetime.date(1956, 7, 3),
+    datetime.date(1956, 3, 8),
+    datetime.date(1965, 3, 7),
+    datetime.date(1956, 12, 7),
+    datetime.date(1957, 4, 7),
+    datetime.date(2001, 11, 30),
+    None,
+]
+
+
+def test_exact_and_missing():
+    birth_dates = BirthDates(DATES)
+    assert birth_dates.exact(DATES[0]).tolist() == [True] + [False] * 7
+    assert birth_dates.missing.tolist() == [False] * 7 + [True]
+
+
+def test_inverted():
+    birth_dates = BirthDates(DATES)
+    assert birth_dates.inverted(DATES[0]).tolist() == [False, True] + [False] * 6
+
+
+def test_fuzzy_matches_string_rule():
+    birth_dates = BirthDates(DATES)
+    for query in DATES[:-1]:
+        expected = [d is not None and string_fuzzy_match(d, query) for d in DATES]
+        assert birth_dates.fuzzy(query).tolist() == expected
+
+
+def test_take_and_any():
+    birth_dates = BirthDates(DATES).take([1, 2, 7])
+    assert birth_dates.any_exact([DATES[0], DATES[2]]).tolist() == [False, True, False]
+    assert birth_dates.any_fuzzy([DATES[0]]).tolist() == [True, True, False]
+    assert birth_dates.any_fuzzy([]).tolist() == [False, False, False]
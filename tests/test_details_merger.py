@@ -0,0 +1,119 @@
+import json
+from types import SimpleNamespace
+
+import yaml
+
+from orgpedia.components.details_merger import DetailsMerger
+from orgpedia.extracts.orgpedia import Order
+
+CADRE = "IAS"
+
+OFFICERS = [
+    {"officer_id": "Q1", "name": "Anil Kumar", "cadre": CADRE},
+    {"officer_id": "Q2", "name": "Ravi Shah", "cadre": CADRE},
+    {"officer_id": "Q3", "name": "Ram Singh", "cadre": CADRE, "birth_date": "1960-01-15"},
+    {"officer_id": "Q4", "name": "Ram Singh", "cadre": CADRE, "birth_date": "1972-08-03"},
+    {"officer_id": "Q5", "name": "Suresh Jain", "cadre": CADRE},
+    {"officer_id": "Q6", "name": "Amit Rao", "cadre": CADRE},
+]
+
+MIS_MATCHES = [["Amit Rao", "Amir Rao"]]
+
+
+def post_dict(dept):
+    return {
+        "post_str": dept,
+        "dept_hpath": ["Ministries", dept],
+        "post_id": f"D:Ministries>{dept}",
+        "words": [],
+        "word_lines": [],
+        "word_lines_idxs": [],
+    }
+
+
+def detail_dict(detail_idx, name, officer_id="", birth_date=None, **verbs):
+    officer = {"salut": "", "name": name, "full_name": name, "cadre": CADRE, "officer_id": officer_id}
+    officer.update({"birth_date": birth_date, "words": [], "word_lines": [], "word_lines_idxs": []})
+    details = {"detail_idx": detail_idx, "detail_page_idx": 0, "officer": officer}
+    return details | {v: verbs.get(v, []) for v in ["continues", "relinquishes", "assumes"]}
+
+
+def build_orders():
+    # the two Ram Singh are duplicate names, Amit Rao and Amir Rao are mismatch names
+    order_dicts = [
+        {
+            "order_id": "order-1.pdf",
+            "date": "2001-01-01",
+            "category": "",
+            "details": [
+                detail_dict(0, "Anil Kumar", "Q1"),
+                detail_dict(1, "Ram Singh", birth_date="1960-01-15"),
+                detail_dict(2, "Amit Rao"),
+                detail_dict(3, "Suresh Jain"),
+                detail_dict(4, "Ravi Shah", assumes=[post_dict("Finance")]),
+            ],
+        },
+        {
+            "order_id": "order-2.pdf",
+            "date": "2002-01-01",
+            "category": "",
+            "details": [
+                detail_dict(0, "Anil Kumar"),
+                detail_dict(1, "Ram Singh", birth_date="1972-08-03"),
+                detail_dict(2, "Amir Rao"),
+                detail_dict(3, "Suresh Jan"),
+                detail_dict(4, "Ravi Shaw", relinquishes=[post_dict("Finance")]),
+            ],
+        },
+        {
+            "order_id": "order-3.pdf",
+            "date": "2003-01-01",
+            "category": "civil_list",
+            "details": [
+                detail_dict(0, "Anil Kumar", "Q1", birth_date="1961-05-05"),
+                detail_dict(1, "Ram Singh", birth_date="1960-01-15"),
+            ],
+        },
+    ]
+    orders = [Order.from_dict(d) for d in order_dicts]
+
+    # regions without words are falsy, details and officers get placeholder words
+    for detail in (d for o in orders for d in o.details):
+        detail.officer.words = [SimpleNamespace(text=t, page_idx=0) for t in detail.officer.name.split()]
+        detail.words = list(detail.officer.words)
+    return orders
+
+
+def get_clusters(tmp_path, merge_engine):
+    conf_dir = tmp_path / "conf"
+    conf_dir.mkdir(exist_ok=True)
+    (conf_dir / "officers.json").write_text(json.dumps({"officers": OFFICERS}))
+    (conf_dir / "mismatch_names.yml").write_text(yaml.dump({"mis_matches": MIS_MATCHES}))
+
+    cadre_file_dict = {CADRE: str(conf_dir / "officers.json")}
+    merger = DetailsMerger(
+        conf_dir, "details_merger", False, cadre_file_dict, ["dept"], [], "mismatch_names.yml", merge_engine
+    )
+
+    orders = build_orders()
+    merger.index_orders(orders)
+    if merge_engine == "union_find":
+        officer_histories = merger.merge_officer_histories(orders)
+    else:
+        officer_histories = merger.get_officer_histories(orders)
+    return set(frozenset((o.order_id, d.detail_idx) for o, d in zip(oh.orders, oh.details)) for oh in officer_histories)
+
+
+def test_union_find_matches_greedy(tmp_path):
+    clusters = get_clusters(tmp_path, "union_find")
+    assert clusters == get_clusters(tmp_path, "greedy")
+
+    assert clusters == {
+        frozenset({("order-1.pdf", 0), ("order-2.pdf", 0), ("order-3.pdf", 0)}),
+        frozenset({("order-1.pdf", 1), ("order-3.pdf", 1)}),
+        frozenset({("order-2.pdf", 1)}),
+        frozenset({("order-1.pdf", 2)}),
+        frozenset({("order-2.pdf", 2)}),
+        frozenset({("order-1.pdf", 3), ("order-2.pdf", 3)}),
+        frozenset({("order-1.pdf", 4), ("order-2.pdf", 4)}),
+    }
@@ -0,0 +1,44 @@
+import json
+
+from orgpedia.extracts.orgpedia import OfficerID
+from orgpedia.tools import file_cache
+
+
+def test_load_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORGPEDIA_CACHE_DIR", str(tmp_path / "cache"))
+    file_cache.clear()
+
+    calls = []
+
+    def load_fn(file_bytes):
+        calls.append(1)
+        return json.loads(file_bytes)
+
+    data_path = tmp_path / "officers.json"
+    data_path.write_text(json.dumps({"officers": [1, 2]}))
+
+    assert file_cache.load_cached(data_path, load_fn) == {"officers": [1, 2]}
+    assert file_cache.load_cached(data_path, load_fn) == {"officers": [1, 2]}
+    assert len(calls) == 1
+
+    file_cache.clear()  # a new process reads the pickle
+    assert file_cache.load_cached(data_path, load_fn) == {"officers": [1, 2]}
+    assert len(calls) == 1 and len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    data_path.write_text(json.dumps({"officers": [3]}))
+    assert file_cache.load_cached(data_path, load_fn) == {"officers": [3]}
+    assert len(calls) == 2
+    assert len(file_cache._memory) == 1
+
+
+def test_officers_are_copied(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORGPEDIA_CACHE_DIR", "")
+    file_cache.clear()
+
+    officers_path = tmp_path / "officers.json"
+    officers_path.write_text(json.dumps({"officers": [{"name": "Anil Kumar", "aliases": [{"name": "A. Kumar"}]}]}))
+
+    officer = OfficerID.from_disk(officers_path)[0]
+    officer.aliases.append({"name": "Anil Kr."})
+    officer.aliases[0]["name"] = "Anil"
+    assert OfficerID.from_disk(officers_path)[0].aliases == [{"name": "A. Kumar"}]
@@ -0,0 +1,29 @@
+from docint.hierarchy import MatchOptions
+
+from orgpedia.tools import file_cache
+from orgpedia.tools.hierarchy_cache import load_hierarchy
+
+ROLE_YML = """
+name: roles
+role:
+  - name: Cabinet Minister
+    alias: ['Minister']
+  - name: Minister of State
+    alias: ['MoS']
+"""
+
+
+def test_load_hierarchy(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORGPEDIA_CACHE_DIR", str(tmp_path / "cache"))
+    file_cache.clear()
+
+    role_path = tmp_path / "role.yml"
+    role_path.write_text(ROLE_YML)
+
+    first, second = load_hierarchy(role_path), load_hierarchy(role_path)
+    assert first is not second and first.root is not second.root
+
+    match_options = MatchOptions(ignore_case=True)
+    first_match = first.find_match("mos", match_options)
+    second_match = second.find_match("mos", match_options)
+    assert [sg.leaf for sg in first_match] == [sg.leaf for sg in second_match] == ["Minister of State"]
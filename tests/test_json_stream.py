@@ -0,0 +1,24 @@
+import datetime
+import gzip
+import json
+
+from orgpedia.tools.json_stream import write_json_dict, write_json_list
+
+OBJS = [{'name': 'राम', 'start': datetime.date(2020, 1, 2)}, {'name': 'Shyam', 'roles': [1, 2.5, None]}]
+
+
+def test_write_json_list(tmp_path):
+    assert write_json_list(tmp_path / 'tenures', iter(OBJS), ['json', 'jsonl', 'csv']) == 2
+    expected = json.dumps(OBJS, default=str)
+    assert (tmp_path / 'tenures.json').read_text() == expected
+    assert [json.loads(ln) for ln in (tmp_path / 'tenures.jsonl').read_text().splitlines()] == json.loads(expected)
+
+    write_json_list(tmp_path / 'empty', [], ['json'], compress=True)
+    assert gzip.open(tmp_path / 'empty.json.gz', 'rt').read() == '[]'
+    assert not (tmp_path / 'empty.json').exists()
+
+
+def test_write_json_dict(tmp_path):
+    post_infos = {'dept': OBJS, 'role': {}}
+    write_json_dict(tmp_path / 'post_infos.json', post_infos)
+    assert (tmp_path / 'post_infos.json').read_text() == json.dumps(post_infos, default=str)
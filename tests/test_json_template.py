@@ -0,0 +1,31 @@
+import json
+
+from orgpedia.tools.json_template import JsonTemplate
+
+JSON_KWARGS = {'separators': (',', ':'), 'ensure_ascii': False}
+
+
+def build_tenures(roles):
+    def build(slot):
+        return [
+            {'idx': idx, 'name': slot(n), 'role': slot(r), 'url': f'o-{idx}.html'} for idx, (n, r) in enumerate(roles)
+        ]
+
+    return build
+
+
+def test_fill_matches_json_dumps():
+    roles = [('Ram', 'Cabinet Minister'), ('Shyam', None)]
+    template = JsonTemplate(build_tenures(roles), **JSON_KWARGS)
+    assert template.num_slots == 4
+
+    hi_roles = [('राम', 'कैबिनेट मंत्री'), ('श्याम "स"', ['a', 1])]
+    expected = json.dumps(build_tenures(hi_roles)(lambda v: v), **JSON_KWARGS)
+    assert template.fill(build_tenures(hi_roles)) == expected
+
+
+def test_fill_changed_structure():
+    template = JsonTemplate(build_tenures([('Ram', 'Cabinet Minister')]), **JSON_KWARGS)
+    roles = [('Ram', 'Cabinet Minister'), ('Shyam', 'Minister of State')]
+    expected = json.dumps(build_tenures(roles)(lambda v: v), **JSON_KWARGS)
+    assert template.fill(build_tenures(roles)) == expected
@@ -0,0 +1,43 @@
+import datetime
+
+import pytest
+
+from orgpedia.tools.lang_runtime import LANG_CODES, get_run_languages, load_lang_bundles
+
+HINDI_DIGITS = '०१२३४५६७८९'
+
+TRANSLATIONS = {
+    'digits': dict((str(d), {'en': str(d), 'hi': HINDI_DIGITS[d]}) for d in range(10)),
+    'labels': {'To Date': {'en': 'To Date', 'hi': 'अब तक'}, 'Council, Ministers': {'en': 'Ministers', 'hi': 'मंत्री'}},
+}
+
+
+def test_run_languages():
+    assert get_run_languages([]) == LANG_CODES
+    assert get_run_languages(['hi', 'en']) == ['hi', 'en']
+    with pytest.raises(ValueError):
+        get_run_languages(['xx'])
+
+
+def test_bundles():
+    bundles = load_lang_bundles(TRANSLATIONS, ['en', 'hi'])
+    hi = bundles['hi']
+    assert hi.to_date == 'अब तक' and hi.labels['council_ministers'] == 'मंत्री'
+    assert bundles['en'].months[1] == 'January' and len(hi.months) == 13
+
+    assert hi.format_year(1952) == '१९५२'
+    assert hi.format_date(datetime.date(1952, 5, 13), 'd MMMM YYYY').startswith('१३ ')
+    assert bundles['en'].format_date(datetime.date(1952, 5, 13), 'd MMM yyyy') == '13 May 1952'
+
+    with pytest.raises(TypeError):
+        hi.digits['0'] = '0'
+
+
+def test_bundles_independent():
+    hi = load_lang_bundles(TRANSLATIONS, ['hi'])['hi']
+    hi.format_year(1960)
+
+    labels = dict(TRANSLATIONS['labels'], **{'To Date': {'en': 'Today', 'hi': 'आज'}})
+    other_hi = load_lang_bundles(dict(TRANSLATIONS, labels=labels), ['hi'])['hi']
+    assert other_hi.to_date == 'आज' and hi.to_date == 'अब तक'
+    assert other_hi.year_strs == {} and hi.year_strs == {1960: '१९६०'}
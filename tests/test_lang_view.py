@@ -0,0 +1,54 @@
+import pytest
+
+from orgpedia.tools.lang_view import LangView
+
+
+class Info:
+    def __init__(self, name, dept):
+        self.name = name
+        self.dept = dept
+        self.lang = 'en'
+
+    @property
+    def title(self):
+        return f'{self.name} ({self.dept}) {self.lang}'
+
+    def get_title(self, suffix):
+        return f'{self.title}{suffix}'
+
+
+def test_fields_and_properties():
+    info = Info('Ram', 'Home')
+    view = LangView(info, 'hi', name='राम')
+    assert view.name == 'राम' and view.dept == 'Home'
+    assert view.title == 'राम (Home) hi'
+    assert view.get_title('!') == 'राम (Home) hi!'
+    assert info.title == 'Ram (Home) en'
+
+
+def test_lazy_fields_resolved_once():
+    calls = []
+
+    def translate_dept():
+        calls.append(1)
+        return 'गृह'
+
+    view = LangView(Info('Ram', 'Home'), 'hi', dept=translate_dept)
+    assert calls == []
+    assert view.dept == 'गृह' and view.dept == 'गृह'
+    assert calls == [1]
+
+
+def test_failed_lazy_field_not_dropped():
+    translations = {}
+
+    def translate_dept():
+        return translations['Home']
+
+    view = LangView(Info('Ram', 'Home'), 'hi', dept=translate_dept)
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            view.dept
+
+    translations['Home'] = 'गृह'
+    assert view.dept == 'गृह'
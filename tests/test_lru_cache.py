@@ -0,0 +1,21 @@
+from orgpedia.tools.lru_cache import LRUCache
+
+
+def test_lru_cache():
+    cache, calls = LRUCache(maxsize=2), []
+
+    def build(key):
+        calls.append(key)
+        return key.upper()
+
+    assert [cache.get(k, lambda: build(k)) for k in ["a", "b", "a", "c", "b"]] == ["A", "B", "A", "C", "B"]
+    assert calls == ["a", "b", "c", "b"]  # b was the least recently used when c was added
+    assert "c" in cache and "a" not in cache
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+    assert cache.stats_str() == "hits: 1 misses: 4 hit_rate: 20.0% size: 2/2"
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    assert cache.get("a", lambda: 1) == 1 and cache.get("a", lambda: 2) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 0)
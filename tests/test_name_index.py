@@ -0,0 +1,75 @@
+import datetime
+import random
+import string
+from types import SimpleNamespace
+
+from polyleven import levenshtein
+
+from orgpedia.tools.name_index import NameIndex, NameSuggestions
+from orgpedia.tools.timeline import RoleTimelines
+
+
+def brute_force_nearest(names, name, max_dist):
+    dists = [(levenshtein(name, n), idx) for (idx, n) in enumerate(names)]
+    dist, idx = min(dists)
+    return (names[idx], dist) if dist <= max_dist else (None, None)
+
+
+def random_edit(rng, name):
+    pos = rng.randrange(len(name) + 1)
+    op = rng.choice(["insert", "delete", "replace"])
+    if op == "insert":
+        return name[:pos] + rng.choice(string.ascii_lowercase) + name[pos:]
+    elif op == "delete":
+        return name[:pos] + name[pos + 1 :]
+    return name[:pos] + rng.choice(string.ascii_lowercase) + name[pos + 1 :]
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    names = list(dict.fromkeys("".join(rng.choices("aeiknrst", k=rng.randint(2, 14))) for _ in range(400)))
+    name_index = NameIndex(names)
+
+    queries = []
+    for _ in range(300):
+        query = rng.choice(names)
+        for _ in range(rng.randint(0, 5)):
+            query = random_edit(rng, query)
+        queries.append(query)
+
+    for query in queries:
+        assert name_index.find_nearest(query, 3) == brute_force_nearest(names, query, 3), query
+
+    nearest_dict = name_index.find_nearest_batch(queries, 3)
+    assert all(nearest_dict[q] == brute_force_nearest(names, q, 3) for q in queries)
+
+
+def test_no_match():
+    name_index = NameIndex(["narendramodi", "rajnathsingh"])
+    assert name_index.find_nearest("amitshah", 3) == (None, None)
+    assert name_index.find_nearest("rajnathsinh", 3) == ("rajnathsingh", 1)
+
+
+class Suggester(NameSuggestions):
+    def __init__(self, names):
+        self.cadre_names_dict = {"minister": dict((n, f"Q{idx}") for (idx, n) in enumerate(names))}
+        self.cadre_name_index = {"minister": NameIndex(names)}
+        self.cadre_suggestions_dict = {"minister": {}}
+        self.special_role_dict = {"primeminister": "pm"}
+        self.role_timelines = RoleTimelines([{"start": "2014-05-26", "end": "today", "pm": "Narendra Modi"}], ["pm"])
+
+
+def test_suggestions():
+    suggester = Suggester(["narendramodi", "rajnathsingh"])
+    names = ["Rajnath Sinh", "The Prime Minister", "Rajnath Singh", "Amit Shah"]
+    details = [
+        SimpleNamespace(detail_idx=idx, officer=SimpleNamespace(name=n, cadre="minister"))
+        for (idx, n) in enumerate(names)
+    ]
+    doc = SimpleNamespace(order=SimpleNamespace(date=datetime.date(2020, 1, 1), details=details))
+
+    assert suggester.get_name_nows(doc, details[1].officer) == ("Narendra Modi", "narendramodi")
+
+    suggester.add_suggestions(doc, {})
+    assert suggester.cadre_suggestions_dict["minister"] == {"rajnathsinh": "rajnathsingh", "amitshah": None}
+    assert suggester.get_suggestion("minister", "narendramod") == "narendramodi"
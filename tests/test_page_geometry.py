@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from orgpedia.tools.page_geometry import _doc_geometries, get_page_geometry
+
+
+class Line:
+    def __init__(self, *spans):
+        self.words = [SimpleNamespace(xmin=xmin, xmax=xmax) for (xmin, xmax) in spans]
+
+    def __bool__(self):
+        return bool(self.words)
+
+    @property
+    def xmin(self):
+        return min(w.xmin for w in self.words)
+
+    @property
+    def xmax(self):
+        return max(w.xmax for w in self.words)
+
+
+def build_page(lines, doc=None):
+    return SimpleNamespace(doc=doc, lines=lines, words=[w for ln in lines for w in ln.words])
+
+
+def test_page_geometry():
+    lines = [Line((0.05, 0.3), (0.7, 0.95)), Line((0.4, 0.6)), Line(), Line((0.05, 0.5))]
+    page = build_page(lines)
+    geometry = get_page_geometry(page)
+
+    assert (geometry.xmin, geometry.xmax) == (0.05, 0.95)
+    assert geometry.is_full_line(0) and geometry.has_gap(0, 0.25) and not geometry.has_gap(1, 0.0)
+    assert geometry.is_center_aligned(1) and geometry.is_center_balanced(1)
+    assert not any([geometry.is_center_aligned(2), geometry.is_left_aligned(2), geometry.is_full_line(2)])
+    assert geometry.is_left_aligned(3) and not geometry.is_right_aligned(3)
+
+    assert get_page_geometry(page) is geometry
+    page.lines.append(Line((0.1, 0.2)))
+    assert get_page_geometry(page) is not geometry
+
+    geometry = get_page_geometry(page)
+    page.lines = page.lines[:2] + [Line((0.2, 0.3))] + page.lines[3:]
+    assert not geometry.has_line(2) and get_page_geometry(page).has_line(2)
+
+
+def test_page_geometry_per_doc():
+    doc1, doc2 = SimpleNamespace(), SimpleNamespace()
+    page1, page2 = build_page([Line((0.1, 0.9))], doc1), build_page([Line((0.1, 0.9))], doc1)
+    geometry1 = get_page_geometry(page1)
+    assert get_page_geometry(page2) is not geometry1 and get_page_geometry(page1) is geometry1
+
+    get_page_geometry(build_page([Line((0.1, 0.9))], doc2))
+    assert _doc_geometries["doc"] is doc2 and len(_doc_geometries["pages"]) == 1
+    assert get_page_geometry(page1) is not geometry1
@@ -0,0 +1,171 @@
+import datetime
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import yaml
+
+from orgpedia.components.tenure_builder import VERBS, DetailInfo, DetailInfoStore, TenureBuilder
+from orgpedia.extracts.orgpedia import Order
+
+DEPTS = ['Finance', 'Defence', 'Railways', 'Health', 'Education', 'Coal']
+ROLES = ['Cabinet Minister', 'Minister of State']
+
+
+class Doc:
+    def __init__(self, order):
+        self.order, self.pdf_name = order, order.order_id
+
+    def add_pipe(self, pipe_name):
+        pass
+
+    def add_extra_field(self, field_name, field_type):
+        pass
+
+
+def post_dict(dept, role):
+    return {
+        'post_str': f'{role}, {dept}',
+        'dept_hpath': ['Ministries', dept],
+        'role_hpath': ['Roles', role],
+        'post_id': f'D:Ministries>{dept}',
+        'words': [],
+        'word_lines': [],
+        'word_lines_idxs': [],
+    }
+
+
+def build_order_dicts(num_orders=40, num_officers=30, seed=0):
+    rng = random.Random(seed)
+    active_posts, order_dicts = {}, []
+    for order_idx in range(num_orders):
+        order_date = datetime.date(2000, 1, 1) + datetime.timedelta(days=order_idx * 90)
+        details = []
+        for detail_idx, officer_idx in enumerate(rng.sample(range(num_officers), 8)):
+            officer_id = f'Q{officer_idx}'
+            verbs = {'continues': [], 'relinquishes': [], 'assumes': []}
+            if officer_id in active_posts:
+                verbs['relinquishes'].append(active_posts.pop(officer_id))
+            if rng.random() < 0.7:
+                active_posts[officer_id] = post_dict(rng.choice(DEPTS), rng.choice(ROLES))
+                verbs['assumes'].append(active_posts[officer_id])
+
+            officer = {'salut': '', 'name': officer_id, 'full_name': officer_id, 'cadre': 'minister'}
+            officer.update({'officer_id': officer_id, 'words': [], 'word_lines': [], 'word_lines_idxs': []})
+            details.append({'detail_idx': detail_idx, 'detail_page_idx': 0, 'officer': officer, **verbs})
+
+        category = 'Council of Ministers' if order_idx % 10 == 0 else ''
+        order_dicts.append({'order_id': f'order-{order_idx}.pdf', 'date': str(order_date), 'category': category})
+        order_dicts[-1]['details'] = details
+    return order_dicts
+
+
+def write_ministries(task_dir):
+    ministries = [
+        {'name': 'Ministry 1', 'start_date': '2000-01-01', 'end_date': '2005-01-01', 'first_order_id': 'order-0.pdf'},
+        {'name': 'Ministry 2', 'start_date': '2005-01-01', 'end_date': 'today', 'first_order_id': 'order-20.pdf'},
+    ]
+    (task_dir / 'ministries.yml').write_text(yaml.dump({'ministries': ministries}))
+
+
+def build_tenures(task_dir, **kwargs):
+    ministry_file = str(task_dir / 'ministries.yml')
+    builder = TenureBuilder('conf', 'tenure_builder', ministry_file, 'Cabinet Minister', duplicates_file='', **kwargs)
+    docs = builder.pipe([Doc(Order.from_dict(d)) for d in build_order_dicts()])
+    return [t.dict() for doc in docs for t in doc.tenures]
+
+
+def test_sharded_tenures(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs').mkdir()
+    write_ministries(tmp_path)
+
+    tenures = build_tenures(tmp_path)
+    assert len(tenures) > 20
+
+    assert build_tenures(tmp_path, tenure_workers=2) == tenures
+
+    checkpoint_dir = tmp_path / 'checkpoints'
+    assert build_tenures(tmp_path, checkpoint_dir=str(checkpoint_dir)) == tenures
+    checkpoint_paths = sorted(checkpoint_dir.glob('*.pkl'))
+    assert len(checkpoint_paths) > 1
+    assert build_tenures(tmp_path, checkpoint_dir=str(checkpoint_dir)) == tenures
+    assert sorted(checkpoint_dir.glob('*.pkl')) == checkpoint_paths
+
+    # a changed input replaces the checkpoints of the shards
+    builder_kwargs = dict(checkpoint_dir=str(checkpoint_dir), tenure_workers=2)
+    monkeypatch.setattr('orgpedia.components.tenure_builder.TENURE_BUILDER_VERSION', -1)
+    assert build_tenures(tmp_path, **builder_kwargs) == tenures
+    new_checkpoint_paths = sorted(checkpoint_dir.glob('*.pkl'))
+    assert len(new_checkpoint_paths) == len(checkpoint_paths) and not set(new_checkpoint_paths) & set(checkpoint_paths)
+
+
+def build_order_rows(seed=0):
+    rng = random.Random(seed)
+    order_rows = []
+    for order_idx in rng.sample(range(30), 30):  # the order_ids are not in date order
+        order_date = datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(10) * 30)
+        order = SimpleNamespace(order_id=f'order-{order_idx}.pdf', date=order_date, category='')
+        rows = []
+        for detail_idx in range(rng.randrange(4)):
+            officer_id, role = f'Q{rng.randrange(8)}', rng.choice(ROLES + [None])
+            rows += [(detail_idx, officer_id, rng.choice(VERBS), f'P{rng.randrange(5)}', role) for _ in range(2)]
+        order_rows.append((order, rows))
+    return order_rows
+
+
+def test_detail_info_store():
+    order_rows = build_order_rows()
+    store = DetailInfoStore.build(order_rows)
+
+    infos = [DetailInfo(o.order_id, o.date, *r[:4], r[4], o.category, []) for (o, rows) in order_rows for r in rows]
+    infos.sort(key=lambda i: (i.officer_id, i.order_date, i.verb_code, i.order_id, i.post_id))  # stable
+
+    assert len(store) == len(infos)
+    assert [i for (_, o_infos) in store.iter_officer_infos() for i in o_infos] == infos
+    assert [o_id for (o_id, _, _) in store.iter_officer_slices()] == sorted(set(i.officer_id for i in infos))
+
+    # a shard keeps only the strings of its rows
+    row_idxs = np.flatnonzero(np.isin(store.columns['officer_code'], [1, 3]))
+    shard = store.take(row_idxs)
+    shard_infos = [i for i in infos if i.officer_id in (store.officer_ids[1], store.officer_ids[3])]
+    assert [i for (_, o_infos) in shard.iter_officer_infos() for i in o_infos] == shard_infos
+    assert shard.officer_ids == [store.officer_ids[1], store.officer_ids[3]]
+    assert shard.post_ids == sorted(set(i.post_id for i in shard_infos))
+    assert set(shard.roles) == set(i.role for i in shard_infos)
+    assert sorted(o[0] for o in shard.orders) == sorted(set(i.order_id for i in shard_infos))
+
+
+def test_empty_detail_info_store():
+    for order_rows in (
+        [],
+        [(SimpleNamespace(order_id='order-1.pdf', date=datetime.date(2000, 1, 1), category=''), [])],
+    ):
+        store = DetailInfoStore.build(order_rows)
+        assert len(store) == 0 and list(store.iter_officer_slices()) == [] and list(store.iter_officer_infos()) == []
+        assert len(store.take(np.array([], dtype=np.int64))) == 0
+
+
+def get_officer_infos():
+    infos = [i for (_, o_infos) in DetailInfoStore.build(build_order_rows()).iter_officer_infos() for i in o_infos]
+    officer_infos = [i for i in infos if i.officer_id == infos[0].officer_id]
+
+    # the sort is stable, infos with equal keys keep their input order
+    keys = [(i.order_date, i.verb_code, i.order_id, i.post_id) for i in officer_infos]
+    return [i for (k, i) in zip(keys, officer_infos) if keys.count(k) == 1]
+
+
+def test_unsorted_detail_infos(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_ministries(tmp_path)
+    builder = TenureBuilder('conf', 'tenure_builder', str(tmp_path / 'ministries.yml'), 'Cabinet Minister')
+    builder.council_order_dates = []  # set by pipe
+
+    # the infos are updated by build_officer_tenures, each call gets fresh infos
+    officer_infos = get_officer_infos()
+    assert len(officer_infos) > 2
+    officer_id = officer_infos[0].officer_id
+
+    tenures = builder.build_officer_tenures(officer_id, officer_infos)
+    assert builder.build_officer_tenures(officer_id, get_officer_infos()[::-1]) == tenures
+    assert builder.build_officer_tenures(officer_id, iter(get_officer_infos()[::-1])) == tenures
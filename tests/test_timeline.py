@@ -0,0 +1,69 @@
+import datetime
+
+from orgpedia.tools.timeline import DateTimeline, RoleTimelines, find_key_overlaps
+
+
+def d(year, month=1, day=1):
+    return datetime.date(year, month, day)
+
+
+# overlapping and with a gap between 2004 and 2005
+INTERVALS = [(d(1999), d(2004)), (d(2002), d(2009)), (d(2005), d(2012))]
+
+
+def linear_find_idx(intervals, dt):
+    return next((idx for (idx, (s, e)) in enumerate(intervals) if s <= dt < e), None)
+
+
+def test_matches_linear_scan():
+    timeline = DateTimeline(INTERVALS)
+    for dt in (d(1998) + datetime.timedelta(days=n) for n in range(0, 15 * 365, 17)):
+        assert timeline.find_idx(dt) == linear_find_idx(INTERVALS, dt)
+
+
+def test_find_boundaries():
+    timeline = DateTimeline(INTERVALS, ["a", "b", "c"])
+    assert timeline.find(d(1999)) == ("a", 0)
+    assert timeline.find(d(2004)) == ("b", 1)
+    assert timeline.find(d(2012)) == (None, None)
+    assert timeline.find(d(1998)) == (None, None)
+
+
+def test_from_start_dates():
+    start_dates = [d(2001), d(2003), d(2003), d(2007)]
+    timeline = DateTimeline.from_start_dates("abcd", start_dates)
+    assert timeline.find(d(2000)) == (None, None)
+    assert timeline.find(d(2003)) == ("c", 2)
+    assert timeline.find(d(2006)) == ("c", 2)
+    assert timeline.find(d(2030)) == ("d", 3)
+
+
+def linear_key_overlaps(intervals, keys, dt):
+    active = [idx for (idx, (s, e)) in enumerate(intervals) if s <= dt < e]
+    return set(tuple(i for i in active if keys[i] == keys[idx]) for idx in active) - set((i,) for i in active)
+
+
+def test_key_overlaps_matches_linear_scan():
+    intervals = INTERVALS + [(d(2003), d(2006)), (d(2006), d(2006)), (d(2001), d(2002))]
+    keys = ["p1", "p1", "p1", "p2", "p1", "p2"]
+    overlaps = find_key_overlaps(intervals, keys)
+    for dt in (d(1998) + datetime.timedelta(days=n) for n in range(0, 15 * 365, 17)):
+        expected = linear_key_overlaps(intervals, keys, dt)
+        assert set(tuple(idxs) for (_, s, e, idxs) in overlaps if s <= dt < e) == expected
+
+
+def test_key_overlaps_periods():
+    overlaps = find_key_overlaps(INTERVALS, ["a", "a", "a"])
+    assert overlaps == [("a", d(2002), d(2004), [0, 1]), ("a", d(2005), d(2009), [1, 2])]
+
+
+def test_role_timelines():
+    tenures = [
+        {"start": "2004-05-22", "end": "2014-05-26", "pm": "Manmohan Singh"},
+        {"start_date": "2014-05-26", "end_date": "today", "pm": "Narendra Modi"},
+    ]
+    role_timelines = RoleTimelines(tenures, ["pm"])
+    assert role_timelines.get_role_name("pm", d(2010)) == "Manmohan Singh"
+    assert role_timelines.get_role_name("pm", d(2014, 5, 26)) is None  # the shared day is strictly inside neither
+    assert role_timelines.get_role_name("pm", d(2014, 5, 27)) == "Narendra Modi"
+    assert role_timelines.get_role_name("pm", d(2000)) is None
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+import yaml
+
+from orgpedia.components.website_lang_gen import OrderSummary, WebsiteLanguageGenerator
+from orgpedia.extracts.orgpedia import Order
+
+HINDI_DIGITS = '०१२३४५६७८९'
+
+TRANSLATIONS = {
+    'digits': dict((str(d), {'en': str(d), 'hi': HINDI_DIGITS[d]}) for d in range(10)),
+    'labels': {
+        'To Date': {'en': 'To Date', 'hi': 'अब तक'},
+        'Home': {'en': 'Home', 'hi': 'होम'},
+        'Orders': {'en': 'Orders', 'hi': 'आदेश'},
+        'Council of Ministers': {'en': 'Council of Ministers', 'hi': 'मंत्रिपरिषद'},
+    },
+    'ministry': {'Ministry 1': {'en': 'Ministry 1', 'hi': 'मंत्रालय 1'}},
+}
+
+MINISTRIES = [
+    {'name': 'Ministry 1', 'start_date': '1999-10-13', 'end_date': '2004-05-22', 'pm': 'A', 'pm_officer_id': 'Q1'},
+]
+
+ORDERS_TEMPLATE = '''{% for o in order_group.order_infos %}
+{{ o.order_id }}|{{ o.order_number }}|{{ o.url_name }}|{{ o.date_str }}|{{ o.category }}|{{ o.num_details }}
+{% endfor %}'''
+
+
+def build_generator(tmp_path, translations=TRANSLATIONS):
+    conf_dir = tmp_path / 'conf'
+    (conf_dir / 'templates' / 'site').mkdir(parents=True, exist_ok=True)
+    (conf_dir / 'templates' / 'site' / 'orders.html').write_text(ORDERS_TEMPLATE)
+    (conf_dir / 'trans.yml').write_text(yaml.dump(translations, allow_unicode=True))
+    (conf_dir / 'ministries.json').write_text(json.dumps({'ministries': MINISTRIES}))
+
+    missing, output_dir = str(conf_dir / 'missing.json'), str(tmp_path / 'output')
+    args = ['website_lang_gen', [], 'conf/ministries.json', output_dir, ['hi'], 'conf/trans.yml', missing, 'site']
+    return WebsiteLanguageGenerator('conf', *args, '', '')
+
+
+def detail_dict(detail_idx, page_idx):
+    officer = {'salut': '', 'name': 'Ram', 'full_name': 'Ram', 'cadre': 'minister', 'officer_id': ''}
+    officer.update({'birth_date': None, 'words': [], 'word_lines': [], 'word_lines_idxs': []})
+    details = {'detail_idx': detail_idx, 'detail_page_idx': page_idx, 'officer': officer}
+    return details | {v: [] for v in ['continues', 'relinquishes', 'assumes']}
+
+
+def build_order(order_id, date, page_idxs):
+    details = [detail_dict(idx, page_idx) for (idx, page_idx) in enumerate(page_idxs)]
+    order_dict = {'order_id': order_id, 'date': date, 'category': 'Council of Ministers', 'details': details}
+    order = Order.from_dict(order_dict)
+    order.number = f'{order_id[:-4]}/CM'
+    return order
+
+
+@pytest.mark.parametrize('lang', ['en', 'hi'])
+def test_translate_ordersummary(tmp_path, monkeypatch, lang):
+    monkeypatch.chdir(tmp_path)
+    generator = build_generator(tmp_path)
+    order = build_order('order-1.pdf', '2001-03-14', [1, 1, 2, 4])
+    order_info = generator.build_orderinfo(order)
+
+    info = generator.translate_orderinfo(order_info, lang)
+    summary = generator.translate_ordersummary(OrderSummary(order_info), lang)
+
+    fields = ['order_id', 'url', 'url_name', 'ministry', 'category', 'first_image_url', 'first_svg_url']
+    fields += ['date', 'date_str', 'short_date_str', 'num_details', 'num_detailed_pages']
+    assert [getattr(summary, f) for f in fields] == [getattr(info, f) for f in fields]
+    assert summary.get_ministry_years_str(lang) == info.get_ministry_years_str(lang)
+    assert summary.order_number == order.number
+    if lang == 'hi':
+        assert summary.num_details == '४' and summary.get_ministry_years_str(lang) == '१९९९-२००४'
+
+    with pytest.raises(AttributeError, match='OrderSummary has no field'):
+        summary.grouped_details
+
+
+def test_gen_orders_page(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = build_generator(tmp_path)
+    orders = [build_order('order-2.pdf', '2002-06-01', [0, 0]), build_order('order-1.pdf', '2001-03-14', [0])]
+    generator.order_info_dict = dict((o.order_id, generator.build_orderinfo(o)) for o in orders)
+
+    generator.gen_orders_page()
+
+    html = (tmp_path / 'output' / 'hi' / 'orders-1999-2004.html').read_text()
+    lines = [line for line in html.splitlines() if line]
+    assert lines == [
+        'order-1.pdf|order-1/CM|http://cabsec.gov.in/order-1.pdf|१४ मार्च २००१|मंत्रिपरिषद|१',
+        'order-2.pdf|order-2/CM|http://cabsec.gov.in/order-2.pdf|१ जून २००२|मंत्रिपरिषद|२',
+    ]
+
+
+def test_generators_keep_own_bundles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = build_generator(tmp_path)
+    summary = OrderSummary(generator.build_orderinfo(build_order('order-1.pdf', '2001-03-14', [0])))
+
+    en_digits = dict((str(d), {'en': str(d), 'hi': str(d)}) for d in range(10))
+    other_generator = build_generator(tmp_path, dict(TRANSLATIONS, digits=en_digits))
+    other_summary = OrderSummary(other_generator.build_orderinfo(build_order('order-1.pdf', '2001-03-14', [0])))
+
+    assert other_summary.get_ministry_years_str('hi') == '1999-2004'
+    assert summary.get_ministry_years_str('hi') == '१९९९-२००४'